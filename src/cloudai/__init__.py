@@ -20,15 +20,20 @@ from ._core.base_runner import BaseRunner
 from ._core.base_system_parser import BaseSystemParser
 from ._core.command_gen_strategy import CommandGenStrategy
 from ._core.exceptions import JobIdRetrievalError
+from ._core.failure_policy import FailurePolicy
 from ._core.grader import Grader
 from ._core.grading_strategy import GradingStrategy
 from ._core.install_strategy import InstallStrategy
 from ._core.job_id_retrieval_strategy import JobIdRetrievalStrategy
 from ._core.job_status_result import JobStatusResult
 from ._core.job_status_retrieval_strategy import JobStatusRetrievalStrategy
+from ._core.multi_scenario_runner import MultiScenarioRunner
+from ._core.node_bisection import NodeBisection
+from ._core.node_ledger import NodeLedger
 from ._core.parser import Parser
 from ._core.registry import Registry
 from ._core.report_generation_strategy import ReportGenerationStrategy
+from ._core.run_journal import RunJournal
 from ._core.runner import Runner
 from ._core.system import System
 from ._core.test import Test
@@ -40,7 +45,7 @@ from .installer.slurm_installer import SlurmInstaller
 from .installer.standalone_installer import StandaloneInstaller
 from .parser.system_parser.slurm_system_parser import SlurmSystemParser
 from .parser.system_parser.standalone_system_parser import StandaloneSystemParser
-from .report_generator import ReportGenerator
+from .report_generator import ReportGenerator, SystemComparisonReport
 from .runner.slurm.slurm_runner import SlurmRunner
 from .runner.standalone.standalone_runner import StandaloneRunner
 from .schema.test_template.chakra_replay.grading_strategy import ChakraReplayGradingStrategy
@@ -152,6 +157,7 @@ __all__ = [
     "BaseRunner",
     "BaseSystemParser",
     "CommandGenStrategy",
+    "FailurePolicy",
     "Grader",
     "GradingStrategy",
     "Installer",
@@ -159,11 +165,16 @@ __all__ = [
     "InstallStrategy",
     "JobIdRetrievalError",
     "JobStatusResult",
+    "MultiScenarioRunner",
+    "NodeBisection",
+    "NodeLedger",
     "Parser",
     "ReportGenerationStrategy",
     "ReportGenerator",
+    "RunJournal",
     "Runner",
     "System",
+    "SystemComparisonReport",
     "Test",
     "TestScenario",
     "TestTemplate",
@@ -18,11 +18,25 @@ import argparse
 import asyncio
 import logging
 import logging.config
+import os
 import sys
 from pathlib import Path
-from typing import List, Set
-
-from cloudai import Installer, Parser, ReportGenerator, Runner, System, Test, TestScenario, TestTemplate
+from typing import Dict, List, Optional, Set, cast
+
+from cloudai import (
+    Installer,
+    MultiScenarioRunner,
+    NodeBisection,
+    Parser,
+    ReportGenerator,
+    Runner,
+    System,
+    SystemComparisonReport,
+    Test,
+    TestScenario,
+    TestTemplate,
+)
+from cloudai.systems import SlurmSystem
 
 
 def setup_logging(log_file: str, log_level: str) -> None:
@@ -88,19 +102,24 @@ def parse_arguments() -> argparse.Namespace:
             "run",
             "generate-report",
             "uninstall",
+            "bisect",
         ],
         help=(
             "Operating mode: 'install' to install test templates, 'dry-run' "
             "to simulate running experiments without checking for "
             "installation, 'run' to run experiments, 'generate-report' to "
             "generate a report from existing data, 'uninstall' to remove "
-            "installed templates."
+            "installed templates, 'bisect' to find slow or broken nodes."
         ),
     )
     parser.add_argument(
         "--system-config",
         required=True,
-        help="Path to the system configuration file.",
+        nargs="+",
+        help=(
+            "Path to the system configuration file. Several files run the test scenario on each system concurrently "
+            "and compare the systems."
+        ),
     )
     parser.add_argument(
         "--test-templates-dir",
@@ -115,9 +134,39 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--test-scenario",
         required=False,
-        help="Path to the test scenario file.",
+        nargs="+",
+        help="Path to the test scenario file. Several files run their test scenarios concurrently, in dry-run and run.",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Maximum number of tests in flight, across all test scenarios when several are run together.",
     )
     parser.add_argument("--output-dir", help="Path to the output directory.")
+    parser.add_argument(
+        "--resume",
+        help="Path to the output directory of an interrupted run to resume, in run mode.",
+    )
+    parser.add_argument("--bisect-test", help="Name of the test run on subsets of the nodes in bisect mode.")
+    parser.add_argument(
+        "--bisect-nodes",
+        nargs="+",
+        help="Nodes to check in bisect mode, as node lists like 'node-[001-016]' or 'partition:group:num_nodes'.",
+    )
+    parser.add_argument(
+        "--bisect-threshold",
+        type=float,
+        help="Lowest performance of passing runs in bisect mode, such as the average bus bandwidth of NCCL tests.",
+    )
+    parser.add_argument(
+        "--bisect-method",
+        default="halving",
+        choices=list(NodeBisection.METHODS),
+        help=(
+            "How the nodes are split in bisect mode: 'halving' halves failing node groups, 'pairwise' runs disjoint "
+            "node pairs first (default: %(default)s)."
+        ),
+    )
     parser.add_argument("--log-file", default="debug.log", help="The name of the log file (default: %(default)s).")
     parser.add_argument(
         "--log-level",
@@ -197,7 +246,35 @@ def handle_install_and_uninstall(mode: str, system: System, tests: List[Test]) -
             sys.exit(1)
 
 
-def handle_dry_run_and_run(mode: str, system: System, tests: List[Test], test_scenario: TestScenario) -> None:
+def verify_installation(system: System, tests: List[Test]) -> None:
+    """
+    Exit with an error if the test templates of the tests are not installed on the system.
+
+    Args:
+        system (System): The system object.
+        tests (List[Test]): The list of test objects.
+    """
+    logging.info("Checking if test templates are installed.")
+
+    unique_templates = identify_unique_test_templates(tests)
+
+    installer = Installer(system)
+    result = installer.is_installed(unique_templates)
+
+    if not result.success:
+        logging.error("CloudAI has not been installed. Please run install mode first.")
+        logging.error(result.message)
+        exit(1)
+
+
+def handle_dry_run_and_run(
+    mode: str,
+    system: System,
+    tests: List[Test],
+    test_scenario: TestScenario,
+    resume_path: Optional[Path] = None,
+    max_in_flight: Optional[int] = None,
+) -> None:
     """
     Execute the dry-run or run modes for CloudAI.
 
@@ -208,27 +285,23 @@ def handle_dry_run_and_run(mode: str, system: System, tests: List[Test], test_sc
         system (System): The system object.
         tests (List[Test]): The list of test objects.
         test_scenario (TestScenario): The test scenario object.
+        resume_path (Optional[Path]): The output directory of an interrupted run to resume.
+        max_in_flight (Optional[int]): Maximum number of tests in flight, lowering the test scenario's own limit, or
+            None.
     """
     logging.info(f"System Name: {system.name}")
     logging.info(f"Scheduler: {system.scheduler}")
     logging.info(f"Test Scenario Name: {test_scenario.name}")
 
-    if mode == "run":
-        logging.info("Checking if test templates are installed.")
-
-        unique_templates = identify_unique_test_templates(tests)
+    if max_in_flight is not None:
+        test_scenario.max_in_flight = min(max_in_flight, test_scenario.max_in_flight or max_in_flight)
 
-        installer = Installer(system)
-        result = installer.is_installed(unique_templates)
-
-        if not result.success:
-            logging.error("CloudAI has not been installed. Please run install mode first.")
-            logging.error(result.message)
-            exit(1)
+    if mode == "run":
+        verify_installation(system, tests)
 
     logging.info(test_scenario.pretty_print())
 
-    runner = Runner(mode, system, test_scenario)
+    runner = Runner(mode, system, test_scenario, str(resume_path.absolute()) if resume_path else None)
     asyncio.run(runner.run())
 
     logging.info(f"All test scenario results stored at: {runner.runner.output_path}")
@@ -238,6 +311,199 @@ def handle_dry_run_and_run(mode: str, system: System, tests: List[Test], test_sc
         generator.generate_report(test_scenario)
 
 
+def handle_bisect(
+    system: System,
+    tests: List[Test],
+    test_name: Optional[str],
+    node_specs: Optional[List[str]],
+    threshold: Optional[float],
+    method: str,
+) -> None:
+    """
+    Find the slow or broken nodes of a node set in adaptive rounds of runs of a test on subsets of the nodes.
+
+    Args:
+        system (System): The system object.
+        tests (List[Test]): The list of test objects.
+        test_name (Optional[str]): The name of the test run on the subsets of the nodes.
+        node_specs (Optional[List[str]]): The nodes to check, as node lists or 'partition:group:num_nodes'
+            specifications.
+        threshold (Optional[float]): Lowest performance of passing runs.
+        method (str): 'halving' or 'pairwise'.
+    """
+    if not test_name or not node_specs or threshold is None:
+        logging.error("Error: --bisect-test, --bisect-nodes and --bisect-threshold are required for mode=bisect.")
+        exit(1)
+    test = next((test for test in tests if test.name == test_name), None)
+    if test is None:
+        logging.error(f"Error: test '{test_name}' not found in the test configuration directory.")
+        exit(1)
+    if not isinstance(system, SlurmSystem):
+        logging.error("Error: bisect mode is only supported on Slurm systems.")
+        exit(1)
+
+    verify_installation(system, [test])
+    bisection = NodeBisection(system, test, system.parse_nodes(node_specs), threshold, method)
+    asyncio.run(bisection.run())
+
+
+def handle_concurrent_runs(
+    mode: str,
+    system_config_paths: List[Path],
+    test_templates_dir: Path,
+    tests_dir: Path,
+    test_scenario_paths: List[Path],
+    output_dir: Optional[Path],
+    resume_path: Optional[Path],
+    max_in_flight: Optional[int],
+) -> None:
+    """
+    Run several test scenarios on a system, or a test scenario on several systems, concurrently in one process.
+
+    Args:
+        mode (str): The operating mode.
+        system_config_paths (List[Path]): The system configuration files.
+        test_templates_dir (Path): The test template configuration directory.
+        tests_dir (Path): The test configuration directory.
+        test_scenario_paths (List[Path]): The test scenario files.
+        output_dir (Optional[Path]): The output directory, if any.
+        resume_path (Optional[Path]): The output directory of an interrupted run to resume, which is not supported.
+        max_in_flight (Optional[int]): Maximum number of tests in flight across all test scenarios, or None.
+    """
+    if (
+        mode in ["generate-report", "bisect"]
+        or resume_path
+        or (len(system_config_paths) > 1 and len(test_scenario_paths) > 1)
+    ):
+        logging.error(
+            "Error: several test scenarios, or several systems running one test scenario, are only supported in "
+            "install, uninstall, dry-run and run modes without --resume."
+        )
+        exit(1)
+
+    if len(system_config_paths) > 1:
+        handle_fan_out(
+            mode, system_config_paths, test_templates_dir, tests_dir, test_scenario_paths, output_dir, max_in_flight
+        )
+        return
+
+    parser = Parser(system_config_paths[0], test_templates_dir)
+    system, tests, test_scenarios = parser.parse_scenarios(tests_dir, test_scenario_paths)
+    if output_dir:
+        system.output_path = str(output_dir.absolute())
+    system.update()
+
+    if mode in ["install", "uninstall"]:
+        handle_install_and_uninstall(mode, system, tests)
+    else:
+        handle_multi_scenario_run(mode, system, tests, test_scenarios, max_in_flight)
+
+
+def handle_multi_scenario_run(
+    mode: str, system: System, tests: List[Test], test_scenarios: List[TestScenario], max_in_flight: Optional[int]
+) -> None:
+    """
+    Execute several test scenarios concurrently in the dry-run or run modes.
+
+    Args:
+        mode (str): The operating mode.
+        system (System): The system object.
+        tests (List[Test]): The list of test objects used by the test scenarios.
+        test_scenarios (List[TestScenario]): The test scenario objects.
+        max_in_flight (Optional[int]): Maximum number of tests in flight across all test scenarios, or None.
+    """
+    logging.info(f"System Name: {system.name}")
+    logging.info(f"Scheduler: {system.scheduler}")
+    logging.info(f"Test Scenario Names: {', '.join(test_scenario.name for test_scenario in test_scenarios)}")
+
+    if mode == "run":
+        verify_installation(system, tests)
+
+    multi_runner = MultiScenarioRunner(
+        mode, [(system, test_scenario) for test_scenario in test_scenarios], max_in_flight
+    )
+    failed = False
+    try:
+        asyncio.run(multi_runner.run())
+    except Exception:
+        failed = True
+    finally:
+        for runner in multi_runner.runners:
+            logging.info(f"Test scenario {runner.test_scenario.name} results stored at: {runner.output_path}")
+
+    if mode == "run":
+        for runner in multi_runner.runners:
+            ReportGenerator(runner.output_path).generate_report(runner.test_scenario)
+    if failed:
+        exit(1)
+
+
+def handle_fan_out(
+    mode: str,
+    system_config_paths: List[Path],
+    test_templates_dir: Path,
+    tests_dir: Path,
+    test_scenario_paths: List[Path],
+    output_dir: Optional[Path],
+    max_in_flight: Optional[int],
+) -> None:
+    """
+    Run the same test scenario on several systems concurrently and compare the systems, or install on each system.
+
+    Each system writes its runs to a subdirectory named after the system, in the output directory if one is given.
+    The comparison of the systems is written to the output directory, or to the common parent of the systems' output
+    directories.
+
+    Args:
+        mode (str): The operating mode.
+        system_config_paths (List[Path]): The system configuration files.
+        test_templates_dir (Path): The test template configuration directory.
+        tests_dir (Path): The test configuration directory.
+        test_scenario_paths (List[Path]): The test scenario files, of which there must be at most one.
+        output_dir (Optional[Path]): The output directory, if any.
+        max_in_flight (Optional[int]): Maximum number of tests in flight across all systems, or None.
+    """
+    parser = Parser(system_config_paths[0], test_templates_dir)
+    parsed = parser.parse_systems(
+        system_config_paths, tests_dir, test_scenario_paths[0] if test_scenario_paths else None
+    )
+    run_names: Dict[str, System] = {}
+    for system, _, _ in parsed:
+        run_name = system.name if system.name not in run_names else f"{system.name}_{len(run_names)}"
+        run_names[run_name] = system
+        system.output_path = os.path.join(str(output_dir.absolute()) if output_dir else system.output_path, run_name)
+        system.update()
+
+    if mode in ["install", "uninstall"]:
+        for system, tests, _ in parsed:
+            handle_install_and_uninstall(mode, system, tests)
+        return
+
+    test_scenario = parsed[0][2]
+    if not test_scenario:
+        logging.error(f"Error: --test-scenario is required for mode={mode}")
+        exit(1)
+    if mode == "run":
+        for system, tests, _ in parsed:
+            verify_installation(system, tests)
+
+    multi_runner = MultiScenarioRunner(
+        mode, [(system, cast(TestScenario, scenario)) for system, _, scenario in parsed], max_in_flight
+    )
+    try:
+        asyncio.run(multi_runner.run())
+    finally:
+        for runner in multi_runner.runners:
+            logging.info(f"Results of system {runner.system.name} stored at: {runner.output_path}")
+
+    if mode == "run":
+        for runner in multi_runner.runners:
+            ReportGenerator(runner.output_path).generate_report(runner.test_scenario)
+        run_paths = {name: runner.output_path for name, runner in zip(run_names, multi_runner.runners)}
+        comparison_dir = os.path.commonpath([os.path.dirname(system.output_path) for system in run_names.values()])
+        SystemComparisonReport(comparison_dir).generate(test_scenario, run_paths)
+
+
 def handle_generate_report(test_scenario: TestScenario, output_dir: Path) -> None:
     """
     Generate a report based on the existing configuration and test results.
@@ -253,25 +519,84 @@ def handle_generate_report(test_scenario: TestScenario, output_dir: Path) -> Non
     logging.info("Report generation completed.")
 
 
+def handle_test_scenario_modes(
+    mode: str,
+    system: System,
+    tests: List[Test],
+    test_scenario: Optional[TestScenario],
+    output_dir: Optional[Path],
+    resume_path: Optional[Path],
+    log_file: str,
+    max_in_flight: Optional[int],
+) -> None:
+    """
+    Execute the dry-run, run or generate-report modes for a single test scenario.
+
+    Args:
+        mode (str): The operating mode.
+        system (System): The system object.
+        tests (List[Test]): The list of test objects.
+        test_scenario (Optional[TestScenario]): The test scenario object, if any.
+        output_dir (Optional[Path]): The output directory, if any.
+        resume_path (Optional[Path]): The output directory of an interrupted run to resume.
+        log_file (str): The name of the log file.
+        max_in_flight (Optional[int]): Maximum number of tests in flight, or None.
+    """
+    if not test_scenario:
+        logging.error(f"Error: --test-scenario is required for mode={mode}")
+        exit(1)
+
+    elif mode in ["dry-run", "run"]:
+        if resume_path and mode != "run":
+            logging.error("Error: --resume is only supported when mode is run.")
+            exit(1)
+        handle_dry_run_and_run(mode, system, tests, test_scenario, resume_path, max_in_flight)
+        if mode == "run":
+            logging.info(
+                "All test scenario execution attempts are complete. Please review"
+                f" the '{log_file}' file to confirm successful completion or to"
+                " identify any issues."
+            )
+    elif mode == "generate-report":
+        if not output_dir:
+            logging.error("Error: --output-dir is required when mode is generate-report.")
+            exit(1)
+        handle_generate_report(test_scenario, output_dir)
+
+
 def main() -> None:
     args = parse_arguments()
 
     setup_logging(args.log_file, args.log_level)
 
-    system_config_path = Path(args.system_config)
+    system_config_paths = [Path(path) for path in args.system_config]
     test_templates_dir = Path(args.test_templates_dir)
     tests_dir = Path(args.tests_dir)
-    test_scenario_path = Path(args.test_scenario) if args.test_scenario else None
+    test_scenario_paths = [Path(path) for path in args.test_scenario or []]
     output_dir = Path(args.output_dir) if args.output_dir else None
+    resume_path = Path(args.resume) if args.resume else None
 
-    logging.info(f"System configuration file: {system_config_path}")
+    logging.info(f"System configuration files: {', '.join(str(path) for path in system_config_paths)}")
     logging.info(f"Test templates directory: {test_templates_dir}")
     logging.info(f"Tests directory: {tests_dir}")
-    logging.info(f"Test scenario file: {test_scenario_path}")
+    logging.info(f"Test scenario files: {', '.join(str(path) for path in test_scenario_paths) or None}")
     logging.info(f"Output directory: {output_dir}")
 
-    parser = Parser(system_config_path, test_templates_dir)
-    system, tests, test_scenario = parser.parse(tests_dir, test_scenario_path)
+    if len(system_config_paths) > 1 or len(test_scenario_paths) > 1:
+        handle_concurrent_runs(
+            args.mode,
+            system_config_paths,
+            test_templates_dir,
+            tests_dir,
+            test_scenario_paths,
+            output_dir,
+            resume_path,
+            args.max_in_flight,
+        )
+        return
+
+    parser = Parser(system_config_paths[0], test_templates_dir)
+    system, tests, test_scenario = parser.parse(tests_dir, test_scenario_paths[0] if test_scenario_paths else None)
 
     if output_dir:
         system.output_path = str(output_dir.absolute())
@@ -279,24 +604,12 @@ def main() -> None:
 
     if args.mode in ["install", "uninstall"]:
         handle_install_and_uninstall(args.mode, system, tests)
+    elif args.mode == "bisect":
+        handle_bisect(system, tests, args.bisect_test, args.bisect_nodes, args.bisect_threshold, args.bisect_method)
     else:
-        if not test_scenario:
-            logging.error(f"Error: --test-scenario is required for mode={args.mode}")
-            exit(1)
-
-        elif args.mode in ["dry-run", "run"]:
-            handle_dry_run_and_run(args.mode, system, tests, test_scenario)
-            if args.mode == "run":
-                logging.info(
-                    "All test scenario execution attempts are complete. Please review"
-                    f" the '{args.log_file}' file to confirm successful completion or to"
-                    " identify any issues."
-                )
-        elif args.mode == "generate-report":
-            if not output_dir:
-                logging.error("Error: --output-dir is required when mode is generate-report.")
-                exit(1)
-            handle_generate_report(test_scenario, output_dir)
+        handle_test_scenario_modes(
+            args.mode, system, tests, test_scenario, output_dir, resume_path, args.log_file, args.max_in_flight
+        )
 
 
 if __name__ == "__main__":
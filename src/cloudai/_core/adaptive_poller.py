@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import Iterable, Optional
+
+
+class AdaptivePoller:
+    """
+    Paces the runner's monitoring ticks, polling fast when job states are likely to change and backing off otherwise.
+
+    The interval between ticks starts at the minimum and doubles after every quiet tick, up to the maximum. It drops
+    back to the minimum on activity, such as a submission or a completion, and a tick is always scheduled at the next
+    predicted end of a running job. Local signals, such as a child process exiting, wake the runner immediately.
+
+    Attributes
+        min_interval (float): Shortest interval in seconds between two ticks.
+        max_interval (float): Longest interval in seconds between two ticks.
+        interval (float): Interval in seconds before the next tick, barring predicted ends and wake-ups.
+    """
+
+    BACKOFF_FACTOR = 2
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        """
+        Initialize an AdaptivePoller instance.
+
+        Args:
+            min_interval (float): Shortest interval in seconds between two ticks.
+            max_interval (float): Longest interval in seconds between two ticks. Raised to the minimum if lower.
+
+        Raises:
+            ValueError: If the minimum interval is negative.
+        """
+        if min_interval < 0:
+            raise ValueError(f"Monitor interval must not be negative, got {min_interval}")
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min_interval
+        self._woken = False
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def on_activity(self) -> None:
+        """Poll at the minimum interval again, since more job state changes are likely to follow."""
+        self.interval = self.min_interval
+
+    def next_interval(self, predicted_ends: Iterable[float], now: float) -> float:
+        """
+        Return the interval before the next tick and back off for the tick after it.
+
+        Args:
+            predicted_ends (Iterable[float]): Predicted end times of the running jobs, as epoch timestamps.
+            now (float): The current time, as an epoch timestamp.
+
+        Returns:
+            float: The interval in seconds before the next tick.
+        """
+        interval = self.interval
+        next_end = min((end - now for end in predicted_ends if end > now), default=None)
+        if next_end is not None and next_end < interval:
+            interval = max(next_end, self.min_interval)
+            self.interval = self.min_interval
+        self.interval = min(self.interval * self.BACKOFF_FACTOR, self.max_interval)
+        return interval
+
+    def notify(self) -> None:
+        """Wake up the runner if it is waiting for its next tick, or end its next wait at once otherwise."""
+        self._woken = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait for the next tick, until the timeout expires or a wake-up is notified.
+
+        Args:
+            timeout (float): The longest time to wait in seconds.
+
+        Returns:
+            bool: True if the wait was cut short by a wake-up, False if the timeout expired.
+        """
+        if self._woken:
+            self._woken = False
+            return True
+        # The event is created on first use so that it belongs to the running event loop.
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._woken = False
+            self._wakeup.clear()
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Optional
+
 from .test import Test
 
 
@@ -26,6 +28,12 @@ class BaseJob:
         test (Test): The test instance associated with this job.
         output_path (str): The path where the job's output is stored.
         terminated_by_dependency (bool): Flag to indicate if the job was terminated due to a dependency.
+        submit_time (Optional[float]): Time the runner submitted the job, or None if the job was not submitted by the
+            current runner.
+        start_time (Optional[float]): Time the runner first observed the job running, or None if it has not yet.
+        last_poll_time (Optional[float]): Time the runner last observed the job not yet completed, or None if it has
+            not yet.
+        end_time (Optional[float]): Time the runner observed the job completed, or None if it has not yet.
     """
 
     def __init__(self, job_id: int, test: Test, output_path: str):
@@ -41,6 +49,10 @@ class BaseJob:
         self.test = test
         self.output_path = output_path
         self.terminated_by_dependency = False
+        self.submit_time: Optional[float] = None
+        self.start_time: Optional[float] = None
+        self.last_poll_time: Optional[float] = None
+        self.end_time: Optional[float] = None
 
     def increment_iteration(self):
         """
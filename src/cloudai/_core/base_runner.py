@@ -19,18 +19,26 @@ import logging
 import os
 import signal
 import sys
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task
 from datetime import datetime
 from types import FrameType
-from typing import Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, Set, Tuple
 
+from .adaptive_poller import AdaptivePoller
 from .base_job import BaseJob
 from .exceptions import JobFailureError, JobSubmissionError
+from .failure_policy import FailurePolicy
 from .job_status_result import JobStatusResult
+from .run_journal import RunJournal
+from .runtime_model import RuntimeModel
+from .submission_budget import SubmissionBudget
+from .submission_queue import SubmissionQueue
 from .system import System
 from .test import Test
 from .test_scenario import TestScenario
+from .timeline import Timeline
 
 
 class BaseRunner(ABC):
@@ -45,19 +53,45 @@ class BaseRunner(ABC):
         system (System): The system schema object.
         test_scenario (TestScenario): The test scenario to run.
         output_path (str): Path to the output directory.
+        resume (bool): Whether the runner resumes an interrupted run in an existing output directory.
+        journal (RunJournal): Journal of the run's submissions and completions, used to resume an interrupted run.
+        timeline (Timeline): Timeline of the run's submissions, queue waits, runtimes, and completion detection lags,
+            written to the output directory at the end of the run.
         monitor_interval (int): Interval in seconds for monitoring jobs.
+        poller (AdaptivePoller): Paces the monitoring ticks between the system's monitor interval and its maximum
+            monitor interval, and lets local signals wake the runner up between ticks.
         jobs (List[BaseJob]): List to track jobs created by the runner.
         test_to_job_map (Dict[Test, BaseJob]): Mapping from tests to their jobs.
+        scheduled_tests (Set[Test]): Tests that have been submitted or scheduled for submission, so that dependency
+            handling never starts a test twice.
+        pending_submissions (Dict[Test, Task]): Tests whose delayed submission has been scheduled but not yet carried
+            out, mapped to the timer task that will submit them.
+        scheduled_tasks (Set[Task]): Timer tasks for delayed submissions and delayed job terminations that are
+            scheduled on the event loop and not yet reaped by the runner.
+        runtime_model (RuntimeModel): Runtime predictions of the tests, learned from the prior runs stored in the
+            system's output directory.
+        submission_queue (SubmissionQueue): Tests waiting for a free submission slot when the test scenario limits the
+            number of tests in flight, ordered by critical path.
+        submitting (Set[Test]): Tests whose submission is in progress, counted as in flight.
+        submission_budget (Optional[SubmissionBudget]): Limit on the tests in flight shared with the runners of other
+            test scenarios run together, or None if the runner runs alone.
+        retry_counts (Dict[Test, int]): Number of times each test has been submitted again after a failed job.
+        failures (List[Dict[str, Any]]): Job failures tolerated by the failure policies, reported at the end of the run.
         logger (logging.Logger): Logger for the runner.
         shutting_down (bool): A flag indicating whether a shutdown process has been initiated, preventing the start of
             new tests and ensuring a graceful termination of all running tests.
+        exit_on_shutdown (bool): Whether a shutdown with outstanding jobs exits the process. Runners of test scenarios
+            run together leave the process to the other test scenarios instead.
     """
 
+    LOCAL_SIGNAL_INTERVAL = 0.2
+
     def __init__(
         self,
         mode: str,
         system: System,
         test_scenario: TestScenario,
+        resume_path: Optional[str] = None,
     ):
         """
         Initialize the BaseRunner with a system object, test scenario, and monitor interval.
@@ -66,16 +100,38 @@ class BaseRunner(ABC):
             mode (str): The operation mode ('dry-run', 'run').
             system (System): The system configuration.
             test_scenario (TestScenario): The test scenario to run.
+            resume_path (Optional[str]): Output directory of an interrupted run to resume, or None to start a new run.
         """
         self.mode = mode
         self.system = system
         self.test_scenario = test_scenario
-        self.output_path = self.setup_output_directory(system.output_path)
+        self.resume = resume_path is not None
+        if resume_path is not None:
+            if not os.path.isdir(resume_path):
+                raise FileNotFoundError(f"Cannot resume run: output directory {resume_path} does not exist")
+            self.output_path = resume_path
+        else:
+            self.output_path = self.setup_output_directory(system.output_path)
+        self.journal = RunJournal(self.output_path)
+        self.timeline = Timeline(self.output_path, test_scenario.name)
         self.monitor_interval = system.monitor_interval
+        self.poller = AdaptivePoller(system.monitor_interval, system.max_monitor_interval)
         self.jobs: List[BaseJob] = []
         self.test_to_job_map: Dict[Test, BaseJob] = {}
+        self.scheduled_tests: Set[Test] = set()
+        self.pending_submissions: Dict[Test, Task] = {}
+        self.scheduled_tasks: Set[Task] = set()
+        self.runtime_model = RuntimeModel.load(system.output_path)
+        self._predicting_runtime_model: Optional[RuntimeModel] = None
+        self._uses_predicted_runtimes = False
+        self.submission_queue = SubmissionQueue(self.get_critical_path)
+        self.submitting: Set[Test] = set()
+        self.submission_budget: Optional[SubmissionBudget] = None
+        self.retry_counts: Dict[Test, int] = {}
+        self.failures: List[Dict[str, Any]] = []
         logging.debug(f"{self.__class__.__name__} initialized")
         self.shutting_down = False
+        self.exit_on_shutdown = True
         self.register_signal_handlers()
 
     def setup_output_directory(self, base_output_path: str) -> str:
@@ -131,64 +187,487 @@ class BaseRunner(ABC):
         asyncio.create_task(self.shutdown())
 
     async def shutdown(self):
-        """Gracefully shut down the runner, terminating all outstanding jobs."""
+        """
+        Gracefully shut down the runner, terminating all outstanding jobs.
+
+        The process exits if there were outstanding jobs, unless `exit_on_shutdown` is off.
+        """
+        jobs_outstanding = bool(self.jobs)
+        await self.terminate()
+        if jobs_outstanding and self.exit_on_shutdown:
+            sys.exit(0)
+
+    async def terminate(self):
+        """Terminate all outstanding jobs and drop the tests that have not been submitted yet."""
+        self.cancel_scheduled_tasks()
+        self.submission_queue.clear()
         if not self.jobs:
+            self.write_timeline()
             return
         logging.info("Terminating all jobs...")
+        await self.kill_jobs(self.jobs)
         for job in self.jobs:
-            self.kill_job(job)
+            self.record_job_event("cancelled", job)
+            self.record_job_timeline(job, "cancelled")
+        self.write_timeline()
         logging.info("All jobs have been killed.")
 
-        sys.exit(0)
-
     async def run(self):
         """Asynchronously run the test scenario."""
         if self.shutting_down:
             return
 
         logging.info("Starting test scenario execution.")
+        run_start_time = time.time()
         total_tests = len(self.test_scenario.tests)
-        completed_jobs_count = 0
+        completed_jobs_count = await self.resume_from_journal() if self.resume else 0
 
-        dependency_free_tests = self.find_dependency_free_tests()
-        for test in dependency_free_tests:
-            await self.submit_test(test)
+        dependency_free_tests = sorted(self.find_dependency_free_tests(), key=self.submission_queue.sort_key)
+        await asyncio.gather(
+            *(self.submit_test(test) for test in dependency_free_tests if test not in self.scheduled_tests)
+        )
 
         while completed_jobs_count < total_tests:
+            await self.update_job_states()
+            await self.update_job_start_times()
             await self.check_start_post_init_dependencies()
             completed_jobs_count += await self.monitor_jobs()
-            await asyncio.sleep(self.monitor_interval)
+            await self.submit_queued_tests()
+            self.reap_scheduled_tasks()
+            await self.wait_for_next_tick()
+
+        self.cancel_scheduled_tasks()
+        self.timeline.add_span("CloudAI", "test scenario", "cloudai", run_start_time, time.time())
+        self.write_timeline()
+        self.log_failure_summary()
+
+    def write_timeline(self) -> None:
+        """Write the run's timeline to the output directory. Dry runs have no timeline, since nothing runs."""
+        if self.mode == "dry-run":
+            return
+        self.timeline.write()
+        logging.info(f"Timeline of the run written to {self.timeline.path}")
+
+    def record_job_timeline(self, job: BaseJob, outcome: str) -> None:
+        """
+        Record the phases of a finished job on the timeline track of its test.
+
+        The job is shown queued until the runner first observed it running, and running until the runner last observed
+        it not completed. The rest, until the runner observed it completed, is the lag of CloudAI's polling. Jobs that
+        did not complete, such as jobs cancelled on shutdown, are shown running until now.
+
+        Args:
+            job (BaseJob): The finished job.
+            outcome (str): How the job finished ('completed', 'failed', 'terminated', 'cancelled').
+        """
+        if job.submit_time is None:
+            return
+        track = str(job.test.section_name)
+        args = {"job_id": job.id, "iteration": job.test.current_iteration, "outcome": outcome}
+        last_poll_time = job.last_poll_time if job.last_poll_time is not None else job.submit_time
+        if job.end_time is None:
+            last_poll_time = time.time()
+        if job.start_time is None:
+            self.timeline.add_span(track, "queued or running", "job", job.submit_time, last_poll_time, **args)
+        else:
+            self.timeline.add_span(track, "queued", "job", job.submit_time, job.start_time, **args)
+            self.timeline.add_span(track, "running", "job", job.start_time, max(last_poll_time, job.start_time), **args)
+        if job.end_time is not None:
+            self.timeline.add_span(track, "polling lag", "cloudai", last_poll_time, job.end_time, **args)
+
+    async def wait_for_next_tick(self) -> None:
+        """Wait until the next monitoring tick, which comes earlier when a running job is predicted to end."""
+        interval = self.poller.next_interval(self.get_predicted_end_times(), time.time())
+        if await self.poller.wait(interval):
+            logging.debug("Monitoring tick brought forward by a local signal.")
+
+    def get_predicted_end_times(self) -> Iterator[float]:
+        """
+        Predict when the running jobs will end, from the runtimes of their tests in prior runs.
+
+        Returns
+            Iterator[float]: The predicted end times of the running jobs with a known runtime, as epoch timestamps.
+        """
+        for job in self.jobs:
+            if job.start_time is None:
+                continue
+            runtime = self.runtime_model.predict(job.test)
+            if runtime is not None:
+                yield job.start_time + runtime
+
+    def wake_on(self, job: BaseJob, condition: Callable[[], bool]) -> None:
+        """
+        Wake the runner up as soon as a local condition signalling a state change of a job holds.
+
+        The condition is checked often, so it must be cheap, such as a file check or a poll of a child process. The
+        check stops once the job is no longer tracked by the runner.
+
+        Args:
+            job (BaseJob): The job the condition is about.
+            condition (Callable[[], bool]): The condition to wait for.
+        """
+        if self.mode == "run":
+            self.schedule_task(self._wake_on(job, condition))
+
+    async def _wake_on(self, job: BaseJob, condition: Callable[[], bool]) -> None:
+        """
+        Check a local condition until it holds and wake the runner up.
+
+        Args:
+            job (BaseJob): The job the condition is about.
+            condition (Callable[[], bool]): The condition to wait for.
+        """
+        while not condition():
+            await asyncio.sleep(self.LOCAL_SIGNAL_INTERVAL)
+            if job not in self.jobs:
+                return
+        self.poller.notify()
+
+    def log_failure_summary(self) -> None:
+        """Report the job failures tolerated during the run, if any."""
+        if not self.failures:
+            return
+        logging.warning(f"Test scenario finished with {len(self.failures)} failed jobs:")
+        for failure in self.failures:
+            outcome = "retried" if failure["retried"] else "not retried"
+            logging.warning(
+                f"  {failure['test']} iteration {failure['iteration']}, job {failure['job_id']} ({outcome}): "
+                f"{failure['error_message']}"
+            )
+
+    def schedule_task(self, coro: Coroutine) -> Task:
+        """
+        Schedule a coroutine as a task on the event loop without waiting for it.
+
+        The task is tracked by the runner, so that its errors are surfaced by `reap_scheduled_tasks` and it can be
+        cancelled on shutdown.
+
+        Args:
+            coro (Coroutine): The coroutine to schedule.
+
+        Returns:
+            Task: The scheduled task.
+        """
+        task = asyncio.create_task(coro)
+        self.scheduled_tasks.add(task)
+        return task
+
+    def reap_scheduled_tasks(self) -> None:
+        """
+        Forget scheduled tasks that have finished, re-raising any exception one of them has raised.
+
+        Raises
+            Exception: The exception raised by a finished scheduled task, if any.
+        """
+        for task in [task for task in self.scheduled_tasks if task.done()]:
+            self.scheduled_tasks.discard(task)
+            if not task.cancelled():
+                task.result()
+
+    def cancel_scheduled_tasks(self) -> None:
+        """Cancel all scheduled tasks that have not finished yet, dropping pending delayed submissions."""
+        for task in self.scheduled_tasks:
+            if not task.done():
+                task.cancel()
+        self.scheduled_tasks.clear()
+        self.pending_submissions.clear()
 
     async def submit_test(self, test: Test):
         """
-        Start a dependency-free test.
+        Start a dependency-free test, or queue it if the test scenario's limit of tests in flight is reached.
 
         Args:
             test (Test): The test to be started.
         """
+        self.scheduled_tests.add(test)
+        if not self.can_submit(test):
+            logging.info(f"Queueing test {test.section_name} until a submission slot is free.")
+            self.submission_queue.push(test)
+            return
+
         logging.info(f"Starting test: {test.section_name}")
+        self.submitting.add(test)
         try:
-            job = self._submit_test(test)
+            submit_call_time = time.time()
+            job = await self._submit_test(test)
+            self.timeline.add_span(
+                str(test.section_name),
+                "submit",
+                "cloudai",
+                submit_call_time,
+                time.time(),
+                job_id=job.id,
+                iteration=test.current_iteration,
+            )
+            if job.submit_time is None:
+                job.submit_time = time.time()
             self.jobs.append(job)
             self.test_to_job_map[test] = job
+            self.record_job_event("submitted", job)
+            self.poller.on_activity()
         except JobSubmissionError as e:
             logging.error(e)
             exit(1)
+        finally:
+            self.submitting.discard(test)
+
+    def record_job_event(self, event: str, job: BaseJob, **fields: Any) -> None:
+        """
+        Record an event of a job in the run journal. Dry runs are not journaled, since there is nothing to resume.
+
+        Args:
+            event (str): The event type ('submitted', 'completed', 'failed', 'cancelled').
+            job (BaseJob): The job.
+            **fields (Any): Additional JSON-serializable details of the event, overriding the details of the job.
+        """
+        if self.mode == "dry-run":
+            return
+        self.journal.record(event, **{**self.get_job_journal_fields(job), **fields})
+
+    def get_job_journal_fields(self, job: BaseJob) -> Dict[str, Any]:
+        """
+        Return the details of a job recorded in the run journal.
+
+        Runners whose jobs carry more state should extend these fields, so that `recover_job` can rebuild the job.
+
+        Args:
+            job (BaseJob): The job.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable details of the job.
+        """
+        return {
+            "test": job.test.section_name,
+            "iteration": job.test.current_iteration,
+            "job_id": job.id,
+            "output_path": job.output_path,
+        }
+
+    def recover_job(self, test: Test, entry: Dict[str, Any]) -> Optional[BaseJob]:
+        """
+        Rebuild a job submitted by an interrupted run from its journal entry, to re-attach to it.
+
+        Args:
+            test (Test): The test of the job.
+            entry (Dict[str, Any]): The journal entry recording the job's submission.
+
+        Returns:
+            Optional[BaseJob]: The job, or None if the job cannot outlive the runner and has to be submitted again.
+        """
+        return BaseJob(entry["job_id"], test, entry["output_path"])
+
+    def replay_journal(self) -> Tuple[Dict[Test, Dict[str, Any]], Dict[Test, Optional[Dict[str, Any]]], int]:
+        """
+        Replay the run journal to find the state of each test of the interrupted run.
+
+        Returns
+            Tuple[Dict[Test, Dict[str, Any]], Dict[Test, Optional[Dict[str, Any]]], int]: The submission entries of the
+                jobs still in flight, the last completion entry of each other submitted test (None if none of its jobs
+                completed), and the number of recorded job completions.
+        """
+        tests_by_section = {test.section_name: test for test in self.test_scenario.tests}
+        in_flight: Dict[Test, Dict[str, Any]] = {}
+        last_completion: Dict[Test, Optional[Dict[str, Any]]] = {}
+        completed_jobs_count = 0
+        for entry in self.journal.load():
+            test = tests_by_section.get(entry.get("test", ""))
+            if test is None:
+                continue
+            if entry["event"] == "submitted":
+                in_flight[test] = entry
+            elif entry["event"] in ("completed", "failed", "cancelled"):
+                in_flight.pop(test, None)
+                last_completion.setdefault(test, None)
+                if entry["event"] == "completed":
+                    completed_jobs_count += 1
+                    test.current_iteration = entry["iteration"]
+                    last_completion[test] = entry
+        return in_flight, last_completion, completed_jobs_count
+
+    async def resume_from_journal(self) -> int:
+        """
+        Restore the state of an interrupted run from its journal.
+
+        Jobs that were still in flight are re-attached, tests keep their completed iterations, tests whose job failed
+        or was cancelled are submitted again, and the dependencies of finished tests are handled again, so that the
+        tests waiting for them start.
+
+        Returns
+            int: The number of job completions recorded by the interrupted run.
+        """
+        in_flight, last_completion, completed_jobs_count = self.replay_journal()
+
+        finished_jobs, reattached_jobs_count = [], 0
+        for test in self.test_scenario.tests:
+            if test not in in_flight and test not in last_completion:
+                continue
+            self.scheduled_tests.add(test)
+            completion = last_completion.get(test)
+            if test in in_flight:
+                job = self.recover_job(test, in_flight[test])
+                if job is None:
+                    await self.submit_test(test)
+                else:
+                    logging.info(f"Re-attaching to job {job.id} of test {test.section_name}")
+                    test.current_iteration = in_flight[test]["iteration"]
+                    self.jobs.append(job)
+                    self.test_to_job_map[test] = job
+                    reattached_jobs_count += 1
+            elif completion and (completion["terminated_by_dependency"] or not test.has_more_iterations()):
+                finished_jobs.append(BaseJob(completion["job_id"], test, completion["output_path"]))
+            else:
+                await self.submit_test(test)
+
+        for job in finished_jobs:
+            await self.handle_dependencies(job)
+
+        logging.info(
+            f"Resumed run at {self.output_path}: {reattached_jobs_count} jobs re-attached, "
+            f"{len(finished_jobs)} tests already finished."
+        )
+        return completed_jobs_count
+
+    def get_critical_path(self, test: Test) -> float:
+        """
+        Return the critical path of a test, used to submit the tests starting the longest chains first.
+
+        Chains are measured in predicted runtime when prior runs have taught the runtime model any runtime of the
+        scenario's tests, and in number of tests otherwise.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            float: The predicted runtime, or the number of tests, of the longest chain started by the test.
+        """
+        if self.uses_predicted_runtimes():
+            return self.test_scenario.get_critical_path_cost(test, self.predict_test_runtime)
+        return self.test_scenario.get_critical_path_length(test)
+
+    def uses_predicted_runtimes(self) -> bool:
+        """
+        Check whether the runtime model predicts the runtime of any test of the scenario, once per runtime model.
+
+        Returns
+            bool: True if chains are measured in predicted runtime.
+        """
+        if self._predicting_runtime_model is not self.runtime_model:
+            self._predicting_runtime_model = self.runtime_model
+            self._uses_predicted_runtimes = self.runtime_model.has_predictions(self.test_scenario.tests)
+        return self._uses_predicted_runtimes
+
+    def predict_test_runtime(self, test: Test) -> float:
+        """
+        Predict the runtime of a test, assuming a typical runtime for tests that have never run.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            float: The predicted runtime in seconds.
+        """
+        runtime = self.runtime_model.predict(test)
+        if runtime is None:
+            runtime = self.runtime_model.get_default_runtime()
+        return runtime or 0.0
 
-    async def delayed_submit_test(self, test: Test, delay: int):
+    def get_test_node_group(self, test: Test) -> Optional[str]:
         """
-        Delay the start of a test based on start_post_comp dependency.
+        Return the name of the node group a test runs on, used to apply per-group limits of tests in flight.
+
+        The default implementation does not assign tests to node groups.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            Optional[str]: The name of the node group, or None if the test is not limited per node group.
+        """
+        return None
+
+    def can_submit(self, test: Test) -> bool:
+        """
+        Check if submitting a test keeps the number of tests in flight within the test scenario's limits.
+
+        The tests in flight of test scenarios run together also count against their shared budget, if any.
+
+        Args:
+            test (Test): The test to be submitted.
+
+        Returns:
+            bool: True if the test can be submitted now, False if it has to wait for a running test to complete.
+        """
+        if self.submission_budget is not None and not self.submission_budget.has_room():
+            return False
+
+        in_flight = [job.test for job in self.jobs] + list(self.submitting)
+        max_in_flight = self.test_scenario.max_in_flight
+        if max_in_flight is not None and len(in_flight) >= max_in_flight:
+            return False
+
+        group = self.get_test_node_group(test)
+        max_in_flight_per_group = self.test_scenario.max_in_flight_per_group.get(group) if group else None
+        if max_in_flight_per_group is not None:
+            group_in_flight = sum(1 for t in in_flight if self.get_test_node_group(t) == group)
+            if group_in_flight >= max_in_flight_per_group:
+                return False
+
+        return True
+
+    def count_in_flight(self) -> int:
+        """
+        Return the number of tests in flight, submitted and not yet completed or being submitted.
+
+        Returns
+            int: The number of tests in flight.
+        """
+        return len(self.jobs) + len(self.submitting)
+
+    async def submit_queued_tests(self) -> None:
+        """Submit queued tests, highest priority first, while submission slots are free."""
+        while True:
+            test = self.submission_queue.pop(self.can_submit)
+            if test is None:
+                return
+            await self.submit_test(test)
+
+    async def delayed_submit_test(self, test: Test, delay: int) -> Optional[Task]:
+        """
+        Schedule the start of a test after a delay, based on start_post_comp or start_post_init dependencies.
+
+        The submission runs as a timer task, so the caller and the monitoring loop are not blocked by the delay. A test
+        that has already been submitted or scheduled for submission is not scheduled again.
 
         Args:
             test (Test): The test to start after a delay.
             delay (int): Delay in seconds before starting the test.
+
+        Returns:
+            Optional[Task]: The task that submits the test, or None if the test was not scheduled.
         """
+        if test in self.scheduled_tests:
+            return None
         logging.info(f"Delayed start for test {test.section_name} by {delay} seconds.")
+        self.scheduled_tests.add(test)
+        task = self.schedule_task(self._delayed_submit_test(test, delay))
+        self.pending_submissions[test] = task
+        return task
+
+    async def _delayed_submit_test(self, test: Test, delay: float) -> None:
+        """
+        Wait for the given delay and submit the test.
+
+        Args:
+            test (Test): The test to start after a delay.
+            delay (float): Delay in seconds before starting the test.
+        """
         await asyncio.sleep(delay)
-        await self.submit_test(test)
+        del self.pending_submissions[test]
+        if not self.shutting_down:
+            await self.submit_test(test)
 
     @abstractmethod
-    def _submit_test(self, test: Test) -> BaseJob:
+    async def _submit_test(self, test: Test) -> BaseJob:
         """
         Execute a given test and returns a job if successful.
 
@@ -200,6 +679,23 @@ class BaseRunner(ABC):
         """
         return BaseJob
 
+    async def update_job_states(self) -> None:
+        """
+        Refresh the runner's view of job states once per monitoring tick.
+
+        Runners that can query the state of all their jobs at once should override this method, so that
+        `is_job_running` and `is_job_completed` answer from a shared snapshot instead of querying each job separately.
+        The default implementation does nothing.
+        """
+        return
+
+    async def update_job_start_times(self) -> None:
+        """Record when each submitted job is first observed running, to measure its runtime."""
+        for job in self.jobs:
+            if job.submit_time is not None and job.start_time is None and await self.is_job_running(job):
+                job.start_time = time.time()
+                self.poller.on_activity()
+
     async def check_start_post_init_dependencies(self):
         """
         Check and handle start_post_init dependencies.
@@ -210,7 +706,8 @@ class BaseRunner(ABC):
         items = list(self.test_to_job_map.items())
 
         for test, job in items:
-            if self.is_job_running(job):
+            dependents = self.test_scenario.get_dependents(test, "start_post_init")
+            if any(t not in self.scheduled_tests for t in dependents) and await self.is_job_running(job):
                 await self.check_and_schedule_start_post_init_dependent_tests(test)
 
     async def check_and_schedule_start_post_init_dependent_tests(self, started_test: Test):
@@ -220,11 +717,8 @@ class BaseRunner(ABC):
         Args:
             started_test (Test): The test that has just been started.
         """
-        for test in self.test_scenario.tests:
-            if test not in self.test_to_job_map:
-                for dep_type, dep in test.dependencies.items():
-                    if (dep_type == "start_post_init") and (dep.test == started_test):
-                        await self.delayed_submit_test(test, dep.time)
+        for test in self.test_scenario.get_dependents(started_test, "start_post_init"):
+            await self.delayed_submit_test(test, test.dependencies["start_post_init"].time)
 
     def find_dependency_free_tests(self) -> List[Test]:
         """
@@ -242,7 +736,7 @@ class BaseRunner(ABC):
 
         return dependency_free_tests
 
-    def get_job_output_path(self, test: Test) -> str:
+    def get_job_output_path(self, test: Test, iteration: Optional[int] = None) -> str:
         """
         Generate and ensures the existence of the output directory for a given test.
 
@@ -251,6 +745,8 @@ class BaseRunner(ABC):
 
         Args:
             test (Test): The test instance for which to generate the output directory path.
+            iteration (Optional[int]): The iteration of the job, when it is submitted ahead of the test's current
+                iteration. Defaults to the current iteration.
 
         Returns:
             str: The path to the job's output directory.
@@ -268,7 +764,8 @@ class BaseRunner(ABC):
             assert test.section_name is not None, "test.section_name must not be None"
             test_output_path = os.path.join(self.output_path, test.section_name)
             os.makedirs(test_output_path, exist_ok=True)
-            job_output_path = os.path.join(test_output_path, str(test.current_iteration))
+            job_iteration = test.current_iteration if iteration is None else iteration
+            job_output_path = os.path.join(test_output_path, str(job_iteration))
             os.makedirs(job_output_path, exist_ok=True)
         except PermissionError as e:
             raise PermissionError(f"Cannot create directory {job_output_path}: {e}") from e
@@ -285,25 +782,117 @@ class BaseRunner(ABC):
         successful_jobs_count = 0
 
         for job in list(self.jobs):
-            if self.is_job_completed(job):
-                if self.mode == "dry-run":
-                    successful_jobs_count += 1
-                    await self.handle_job_completion(job)
-                else:
-                    job_status_result = self.get_job_status(job)
-                    if job_status_result.is_successful:
-                        successful_jobs_count += 1
-                        await self.handle_job_completion(job)
-                    else:
-                        error_message = (
-                            f"Job {job.id} for test {job.test.section_name} failed: {job_status_result.error_message}"
-                        )
-                        logging.error(error_message)
-                        await self.shutdown()
-                        raise JobFailureError(job.test.section_name, error_message, job_status_result.error_message)
+            if not await self.is_job_completed(job):
+                job.last_poll_time = time.time()
+                continue
+
+            job.end_time = time.time()
+            if self.mode == "dry-run":
+                successful_jobs_count += 1
+                await self.handle_job_completion(job)
+                continue
+
+            job_status_result = self.get_job_status(job)
+            await self.record_job_nodes(job, job_status_result)
+            if job_status_result.is_successful:
+                self.record_job_timeline(job, "terminated" if job.terminated_by_dependency else "completed")
+                successful_jobs_count += 1
+                await self.handle_job_completion(job)
+            else:
+                self.record_job_timeline(job, "failed")
+                successful_jobs_count += await self.handle_job_failure(job, job_status_result)
 
         return successful_jobs_count
 
+    def get_failure_policy(self, test: Test) -> FailurePolicy:
+        """
+        Return the failure policy applied to the jobs of a test.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            FailurePolicy: The test's own policy, or the test scenario's policy if the test has none.
+        """
+        return test.failure_policy or self.test_scenario.failure_policy
+
+    async def handle_job_failure(self, failed_job: BaseJob, job_status_result: JobStatusResult) -> int:
+        """
+        Handle a failed job according to the failure policy of its test.
+
+        With the fail-fast action, all jobs are terminated and the failure is raised. Otherwise the failure is recorded
+        and the test is either submitted again after the policy's backoff, or its job is handled as completed, so that
+        the next iteration and the dependent tests still run.
+
+        Args:
+            failed_job (BaseJob): The job that has just failed.
+            job_status_result (JobStatusResult): The status of the failed job.
+
+        Returns:
+            int: 1 if the failed job counts as completed, 0 if its test is retried.
+
+        Raises:
+            JobFailureError: If the failure policy of the test is fail-fast.
+        """
+        test = failed_job.test
+        error_message = f"Job {failed_job.id} for test {test.section_name} failed: {job_status_result.error_message}"
+        logging.error(error_message)
+        policy = self.get_failure_policy(test)
+        if policy.action == "fail-fast":
+            self.record_job_event("failed", failed_job, error_message=job_status_result.error_message)
+            await self.shutdown()
+            raise JobFailureError(test.section_name, error_message, job_status_result.error_message)
+
+        retries = self.retry_counts.get(test, 0)
+        retry = policy.should_retry(retries)
+        self.failures.append(
+            {
+                "test": test.section_name,
+                "iteration": test.current_iteration,
+                "job_id": failed_job.id,
+                "error_message": job_status_result.error_message,
+                "retried": retry,
+            }
+        )
+        self.record_job_event("failed", failed_job, error_message=job_status_result.error_message, retried=retry)
+        if policy.exclude_failed_nodes:
+            await self.exclude_job_nodes(failed_job)
+
+        if not retry:
+            await self.handle_job_completion(failed_job)
+            return 1
+
+        self.jobs.remove(failed_job)
+        del self.test_to_job_map[test]
+        self.retry_counts[test] = retries + 1
+        delay = policy.get_retry_delay(retries)
+        logging.info(f"Retrying test {test.section_name} in {delay} seconds ({retries + 1}/{policy.max_retries}).")
+        self.pending_submissions[test] = self.schedule_task(self._delayed_submit_test(test, delay))
+        return 0
+
+    async def exclude_job_nodes(self, job: BaseJob) -> None:
+        """
+        Keep the nodes a failed job ran on out of the runner's later submissions.
+
+        The default implementation does nothing, for runners that do not choose the nodes of their jobs.
+
+        Args:
+            job (BaseJob): The failed job.
+        """
+        return
+
+    async def record_job_nodes(self, job: BaseJob, job_status_result: JobStatusResult) -> None:
+        """
+        Record the outcome of a finished job on the nodes it ran on, for later node selection.
+
+        The default implementation does nothing, for runners that do not choose the nodes of their jobs.
+
+        Args:
+            job (BaseJob): The finished job.
+            job_status_result (JobStatusResult): The status of the job.
+        """
+        return
+
     def get_job_status(self, job: BaseJob) -> JobStatusResult:
         """
         Retrieve the job status from a specified output directory.
@@ -324,9 +913,16 @@ class BaseRunner(ABC):
             completed_job (BaseJob): The job that has just been completed.
         """
         logging.info(f"Job completed: {completed_job.test.section_name}")
+        self.poller.on_activity()
         self.jobs.remove(completed_job)
         del self.test_to_job_map[completed_job.test]
         completed_job.increment_iteration()
+        self.record_job_event(
+            "completed",
+            completed_job,
+            terminated_by_dependency=completed_job.terminated_by_dependency,
+            **self.get_job_runtime_fields(completed_job),
+        )
         if not completed_job.terminated_by_dependency and completed_job.test.has_more_iterations():
             msg = f"Re-running job for iteration {completed_job.test.current_iteration}"
             logging.info(msg)
@@ -334,8 +930,28 @@ class BaseRunner(ABC):
         else:
             await self.handle_dependencies(completed_job)
 
+    def get_job_runtime_fields(self, job: BaseJob) -> Dict[str, Any]:
+        """
+        Return the timestamps of a finished job recorded in the run journal, from which later runs learn its runtime.
+
+        Args:
+            job (BaseJob): The finished job.
+
+        Returns:
+            Dict[str, Any]: The runtime key of the test and the submission, start, and end times of the job, or no
+                fields if the job's runtime is unknown or not representative.
+        """
+        if job.submit_time is None or job.terminated_by_dependency:
+            return {}
+        return {
+            "runtime_key": RuntimeModel.get_test_key(job.test),
+            "submit_time": job.submit_time,
+            "start_time": job.start_time if job.start_time is not None else job.submit_time,
+            "end_time": job.end_time if job.end_time is not None else time.time(),
+        }
+
     @abstractmethod
-    def is_job_running(self, job: BaseJob) -> bool:
+    async def is_job_running(self, job: BaseJob) -> bool:
         """
         Check if a job is currently running.
 
@@ -348,7 +964,7 @@ class BaseRunner(ABC):
         pass
 
     @abstractmethod
-    def is_job_completed(self, job: BaseJob) -> bool:
+    async def is_job_completed(self, job: BaseJob) -> bool:
         """
         Determine if a job is completed.
 
@@ -373,25 +989,22 @@ class BaseRunner(ABC):
         tasks = []
 
         # Handling start_post_comp dependencies
-        for test in self.test_scenario.tests:
-            if test not in self.test_to_job_map:
-                for dep_type, dep in test.dependencies.items():
-                    if dep_type == "start_post_comp" and dep.test == completed_job.test:
-                        task = await self.delayed_submit_test(test, dep.time)
-                        if task:
-                            tasks.append(task)
+        for test in self.test_scenario.get_dependents(completed_job.test, "start_post_comp"):
+            task = await self.delayed_submit_test(test, test.dependencies["start_post_comp"].time)
+            if task:
+                tasks.append(task)
 
         # Handling end_post_comp dependencies
-        for test, dependent_job in self.test_to_job_map.items():
-            for dep_type, dep in test.dependencies.items():
-                if dep_type == "end_post_comp" and dep.test == completed_job.test:
-                    task = await self.delayed_kill_job(dependent_job, dep.time)
-                    tasks.append(task)
+        for test in self.test_scenario.get_dependents(completed_job.test, "end_post_comp"):
+            dependent_job = self.test_to_job_map.get(test)
+            if dependent_job:
+                task = await self.delayed_kill_job(dependent_job, test.dependencies["end_post_comp"].time)
+                tasks.append(task)
 
         return tasks
 
     @abstractmethod
-    def kill_job(self, job: BaseJob):
+    async def kill_job(self, job: BaseJob):
         """
         Kill a specific job.
 
@@ -400,15 +1013,44 @@ class BaseRunner(ABC):
         """
         pass
 
-    async def delayed_kill_job(self, job: BaseJob, delay: int = 0):
+    async def kill_jobs(self, jobs: List[BaseJob]) -> None:
+        """
+        Kill several jobs concurrently.
+
+        Runners able to cancel several jobs with a single command override this.
+
+        Args:
+            jobs (List[BaseJob]): The jobs to be killed.
+        """
+        await asyncio.gather(*(self.kill_job(job) for job in jobs))
+
+    async def delayed_kill_job(self, job: BaseJob, delay: int = 0) -> Task:
         """
-        Schedule termination of a Standalone job after a specified delay.
+        Schedule termination of a job after a specified delay.
+
+        The termination runs as a timer task, so the caller and the monitoring loop are not blocked by the delay.
 
         Args:
             job (BaseJob): The job to be terminated.
             delay (int): Delay in seconds after which the job should be terminated.
+
+        Returns:
+            Task: The task that terminates the job.
         """
         logging.info(f"Scheduling termination of job {job.id} after {delay} seconds.")
+        return self.schedule_task(self._delayed_kill_job(job, delay))
+
+    async def _delayed_kill_job(self, job: BaseJob, delay: int) -> None:
+        """
+        Wait for the given delay and terminate the job if it is still tracked by the runner.
+
+        Args:
+            job (BaseJob): The job to be terminated.
+            delay (int): Delay in seconds after which the job should be terminated.
+        """
         await asyncio.sleep(delay)
+        if job not in self.jobs:
+            logging.debug(f"Job {job.id} has already finished, skipping its termination.")
+            return
         job.terminated_by_dependency = True
-        self.kill_job(job)
+        await self.kill_job(job)
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Any, Dict, Optional
+
+
+class FailurePolicy:
+    """
+    Policy applied by the runner when a job of a test fails.
+
+    Attributes
+        action (str): 'fail-fast' to terminate the run, 'continue' to record the failure and carry on with the next
+            iteration and the dependent tests, or 'retry' to submit the failed iteration again, and carry on once the
+            retries are exhausted.
+        max_retries (int): Maximum number of retries of a test, used by the 'retry' action.
+        backoff (float): Delay in seconds before the first retry, doubled for each further retry.
+        exclude_failed_nodes (bool): Whether retries avoid the nodes the failed jobs ran on.
+    """
+
+    ACTIONS = ("fail-fast", "continue", "retry")
+
+    def __init__(
+        self,
+        action: str = "fail-fast",
+        max_retries: int = 0,
+        backoff: float = 0.0,
+        exclude_failed_nodes: bool = False,
+    ) -> None:
+        """
+        Initialize a FailurePolicy instance.
+
+        Args:
+            action (str): The action taken when a job fails ('fail-fast', 'continue', 'retry').
+            max_retries (int): Maximum number of retries of a test.
+            backoff (float): Delay in seconds before the first retry.
+            exclude_failed_nodes (bool): Whether retries avoid the nodes the failed jobs ran on.
+
+        Raises:
+            ValueError: If the action is unknown, or the number of retries or the backoff is negative.
+        """
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unknown failure action '{action}', expected one of: {', '.join(self.ACTIONS)}.")
+        if max_retries < 0 or backoff < 0:
+            raise ValueError("The number of retries and the backoff of a failure policy must not be negative.")
+        self.action = action
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.exclude_failed_nodes = exclude_failed_nodes
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default: Optional["FailurePolicy"] = None) -> "FailurePolicy":
+        """
+        Create a failure policy from its TOML table, taking the fields it does not set from a default policy.
+
+        Args:
+            data (Dict[str, Any]): The failure policy table.
+            default (Optional[FailurePolicy]): The policy providing the fields missing from the table.
+
+        Returns:
+            FailurePolicy: The failure policy.
+        """
+        default = default or cls()
+        return cls(
+            action=str(data.get("action", default.action)),
+            max_retries=int(data.get("max_retries", default.max_retries)),
+            backoff=float(data.get("backoff", default.backoff)),
+            exclude_failed_nodes=bool(data.get("exclude_failed_nodes", default.exclude_failed_nodes)),
+        )
+
+    def should_retry(self, retries: int) -> bool:
+        """
+        Check if a failed test is submitted again.
+
+        Args:
+            retries (int): The number of times the test has already been retried.
+
+        Returns:
+            bool: True if the test is retried, False otherwise.
+        """
+        return self.action == "retry" and retries < self.max_retries
+
+    def get_retry_delay(self, retries: int) -> float:
+        """
+        Return the delay before a retry, doubling the backoff with each retry.
+
+        Args:
+            retries (int): The number of times the test has already been retried.
+
+        Returns:
+            float: The delay in seconds before submitting the test again.
+        """
+        return self.backoff * 2**retries
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the FailurePolicy instance.
+
+        Returns
+            str: String representation of the failure policy.
+        """
+        return (
+            f"FailurePolicy(action={self.action}, max_retries={self.max_retries}, backoff={self.backoff}, "
+            f"exclude_failed_nodes={self.exclude_failed_nodes})"
+        )
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import logging
+import signal
+import sys
+from types import FrameType
+from typing import List, Optional, Sequence, Tuple
+
+from .base_runner import BaseRunner
+from .runner import Runner
+from .submission_budget import SubmissionBudget
+from .system import System
+from .test_scenario import TestScenario
+
+
+class MultiScenarioRunner:
+    """
+    Runs several test scenarios concurrently in a single process, on the same system or on several systems.
+
+    Runners of test scenarios on the same system share the system object, so that the system is parsed and updated
+    once, and the job states they query are answered from shared snapshots. The tests in flight of all runners can be
+    limited by a shared budget. A test scenario stopped by a fail-fast failure terminates only its own jobs, and the
+    other test scenarios run to completion.
+
+    Attributes
+        runners (List[BaseRunner]): The runners of the test scenarios, in the given order.
+        submission_budget (Optional[SubmissionBudget]): Limit on the tests in flight across all test scenarios, or None
+            for no shared limit.
+        shutting_down (bool): A flag indicating whether a shutdown has been initiated.
+    """
+
+    def __init__(
+        self, mode: str, runs: Sequence[Tuple[System, TestScenario]], max_in_flight: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the MultiScenarioRunner, creating a runner for each test scenario.
+
+        Args:
+            mode (str): The operation mode ('dry-run', 'run').
+            runs (Sequence[Tuple[System, TestScenario]]): The test scenarios to run, each with the system to run it on.
+            max_in_flight (Optional[int]): Maximum number of tests in flight across all test scenarios, or None for no
+                shared limit.
+        """
+        for system in {id(system): system for system, _ in runs}.values():
+            system.share_state(system.monitor_interval)
+        self.runners: List[BaseRunner] = [Runner(mode, system, scenario).runner for system, scenario in runs]
+        for runner in self.runners:
+            runner.exit_on_shutdown = False
+        self.submission_budget = SubmissionBudget(max_in_flight) if max_in_flight is not None else None
+        if self.submission_budget is not None:
+            for runner in self.runners:
+                runner.submission_budget = self.submission_budget
+                self.submission_budget.register(runner.count_in_flight)
+        self.shutting_down = False
+        self.register_signal_handlers()
+
+    def register_signal_handlers(self) -> None:
+        """Register signal handlers shutting down all runners, replacing the handlers of the individual runners."""
+        for sig in [signal.SIGINT, signal.SIGTERM, signal.SIGHUP, signal.SIGQUIT]:
+            signal.signal(sig, self.signal_handler)
+
+    def signal_handler(
+        self,
+        signum: int,
+        frame: Optional[FrameType],  # noqa: Vulture
+    ) -> None:
+        """
+        Respond to termination-related signals by shutting down the runners of all test scenarios.
+
+        Args:
+            signum (int): The signal number indicating the type of signal received.
+            frame (Optional[FrameType]): The current stack frame when the signal was received, or None.
+        """
+        self.shutting_down = True
+        for runner in self.runners:
+            runner.shutting_down = True
+        logging.info(f"Signal {signum} received, shutting down all test scenarios...")
+        asyncio.create_task(self.shutdown())
+
+    async def shutdown(self) -> None:
+        """Terminate the outstanding jobs of all test scenarios and exit."""
+        await asyncio.gather(*(runner.terminate() for runner in self.runners))
+        sys.exit(0)
+
+    async def run(self) -> None:
+        """
+        Run all test scenarios concurrently until each of them has finished.
+
+        Raises
+            Exception: The first error that stopped a test scenario, raised once all test scenarios have finished.
+        """
+        results = await asyncio.gather(*(runner.run() for runner in self.runners), return_exceptions=True)
+        errors = []
+        for runner, result in zip(self.runners, results):
+            if isinstance(result, Exception):
+                logging.error(f"Test scenario {runner.test_scenario.name} failed: {result}")
+                errors.append(result)
+        if errors:
+            raise errors[0]
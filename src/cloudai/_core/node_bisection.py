@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import copy
+import logging
+import os
+from typing import Dict, List, Set, Tuple
+
+from .failure_policy import FailurePolicy
+from .runner import Runner
+from .system import System
+from .test import Test
+from .test_scenario import TestScenario
+
+
+class NodeBisection:
+    """
+    Finds the slow or broken nodes of a node set in adaptive rounds of runs of a test on subsets of the nodes.
+
+    Each round runs node-disjoint probes of the test concurrently, as one test scenario. A probe passes when its job
+    succeeds and performs at or above the threshold. With the 'halving' method, the whole node set is probed first and
+    the groups that fail are split in halves until they are too small to split, taking O(log N) rounds. With the
+    'pairwise' method, the nodes are probed in disjoint pairs first. In both methods, the remaining suspect nodes are
+    then each probed with a node that passed, which tells them apart in one more round when enough nodes passed.
+
+    Attributes
+        system (System): The system to run the test on.
+        test (Test): The test run by the probes, on the nodes of each probe.
+        threshold (float): Lowest performance of a passing probe, in the unit of the test's performance.
+        method (str): 'halving' or 'pairwise'.
+        mode (str): The operation mode of the runners ('dry-run', 'run').
+        good_nodes (Set[str]): Nodes that passed a probe.
+        bad_nodes (Set[str]): Nodes that failed a probe with a node that passed.
+        inconclusive_groups (List[List[str]]): Groups that failed as a whole while both of their halves passed.
+        groups (List[List[str]]): Groups to probe as a whole in the next round.
+        suspect_nodes (List[str]): Nodes to probe with a node that passed in the next round.
+        rounds (int): Number of rounds run.
+    """
+
+    METHODS = ("halving", "pairwise")
+    MIN_GROUP_SIZE_TO_SPLIT = 4
+
+    def __init__(
+        self, system: System, test: Test, nodes: List[str], threshold: float, method: str = "halving", mode: str = "run"
+    ) -> None:
+        """
+        Initialize a NodeBisection instance.
+
+        Args:
+            system (System): The system to run the test on.
+            test (Test): The test run by the probes.
+            nodes (List[str]): The nodes to check, at least two.
+            threshold (float): Lowest performance of a passing probe.
+            method (str): 'halving' or 'pairwise'.
+            mode (str): The operation mode of the runners ('dry-run', 'run').
+
+        Raises:
+            ValueError: If the method is unknown or fewer than two distinct nodes are given.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown bisection method '{method}', expected one of: {', '.join(self.METHODS)}.")
+        nodes = list(dict.fromkeys(nodes))
+        if len(nodes) < 2:
+            raise ValueError(f"Bisection needs at least two nodes, got: {', '.join(nodes) or 'none'}.")
+        self.system = system
+        self.test = test
+        self.threshold = threshold
+        self.method = method
+        self.mode = mode
+        self.good_nodes: Set[str] = set()
+        self.bad_nodes: Set[str] = set()
+        self.inconclusive_groups: List[List[str]] = []
+        self.groups: List[List[str]] = [nodes] if method == "halving" else []
+        self.suspect_nodes: List[str] = [] if method == "halving" else nodes
+        self.rounds = 0
+        self._halves: Dict[Tuple[str, ...], List[str]] = {}
+        self._paired_suspects: Set[str] = set()
+
+    @property
+    def unresolved_nodes(self) -> List[str]:
+        """Nodes still suspected once no more probes can be planned, for lack of a node that passed."""
+        return [node for group in self.groups for node in group] + self.suspect_nodes
+
+    def plan_round(self) -> List[List[str]]:
+        """
+        Plan the node-disjoint probes of the next round.
+
+        Groups are probed as a whole. Suspect nodes are each probed with a distinct node that passed; while no node has
+        passed yet, suspect nodes that have not been probed together are probed in disjoint pairs instead, the last pair
+        taking the odd node out.
+
+        Returns
+            List[List[str]]: The nodes of each probe, or no probes once the bisection is finished.
+        """
+        probes = [list(group) for group in self.groups]
+        reference_nodes = iter(sorted(self.good_nodes))
+        unpaired = []
+        for node in self.suspect_nodes:
+            reference_node = next(reference_nodes, None)
+            if reference_node is None:
+                unpaired.append(node)
+            else:
+                probes.append([node, reference_node])
+        if not self.good_nodes:
+            unpaired = [node for node in unpaired if node not in self._paired_suspects]
+            pairs = [unpaired[i : i + 2] for i in range(0, len(unpaired) - 1, 2)]
+            if pairs and len(unpaired) % 2:
+                pairs[-1].append(unpaired[-1])
+            probes.extend(pairs)
+        return probes
+
+    def record_round(self, probes: List[List[str]], passed: List[bool]) -> None:
+        """
+        Update the suspect groups and nodes with the outcome of the probes of a round.
+
+        Args:
+            probes (List[List[str]]): The nodes of each probe of the round, as planned.
+            passed (List[bool]): Whether each probe passed.
+        """
+        self.rounds += 1
+        probed_groups = {tuple(group) for group in self.groups}
+        known_good_nodes = set(self.good_nodes)
+        self.groups = []
+        suspects = [node for node in self.suspect_nodes if not any(node in probe for probe in probes)]
+        passed_halves: Dict[Tuple[str, ...], int] = {}
+        for probe, probe_passed in zip(probes, passed):
+            parent = self._halves.pop(tuple(probe), None)
+            if probe_passed:
+                self.good_nodes.update(probe)
+                if parent is not None:
+                    passed_halves[tuple(parent)] = passed_halves.get(tuple(parent), 0) + 1
+            elif tuple(probe) in probed_groups and len(probe) >= self.MIN_GROUP_SIZE_TO_SPLIT:
+                middle = len(probe) // 2
+                for half in (probe[:middle], probe[middle:]):
+                    self._halves[tuple(half)] = probe
+                    self.groups.append(half)
+            elif tuple(probe) in probed_groups or probe[1] not in known_good_nodes:
+                self._paired_suspects.update(probe)
+                suspects.extend(probe)
+            else:
+                self.bad_nodes.add(probe[0])
+        self.inconclusive_groups.extend(list(parent) for parent, count in passed_halves.items() if count == 2)
+        self.suspect_nodes = [node for node in suspects if node not in self.good_nodes]
+
+    def create_test_scenario(self, probes: List[List[str]]) -> TestScenario:
+        """
+        Create the test scenario running the probes of the next round concurrently.
+
+        Args:
+            probes (List[List[str]]): The nodes of each probe.
+
+        Returns:
+            TestScenario: One independent test per probe, whose failures do not stop the others.
+        """
+        tests = []
+        for index, nodes in enumerate(probes, start=1):
+            test = copy.deepcopy(self.test)
+            test.test_template = self.test.test_template
+            test.section_name = f"Tests.{index}"
+            test.num_nodes = len(nodes)
+            test.nodes = nodes
+            test.dependencies = {}
+            test.iterations = 1
+            test.current_iteration = 0
+            tests.append(test)
+        return TestScenario(
+            name=f"bisection_{self.test.name}_round_{self.rounds + 1}",
+            tests=tests,
+            failure_policy=FailurePolicy("continue"),
+        )
+
+    async def run_round(self, probes: List[List[str]]) -> List[bool]:
+        """
+        Run the probes of a round concurrently and tell which of them passed.
+
+        Args:
+            probes (List[List[str]]): The nodes of each probe.
+
+        Returns:
+            List[bool]: Whether each probe's job succeeded and performed at or above the threshold.
+        """
+        test_scenario = self.create_test_scenario(probes)
+        runner = Runner(self.mode, self.system, test_scenario).runner
+        await runner.run()
+        failed_tests = {failure["test"] for failure in runner.failures}
+        passed = []
+        for test, nodes in zip(test_scenario.tests, probes):
+            performance = test.get_performance(os.path.join(runner.output_path, test.section_name, "0"))
+            probe_passed = test.section_name not in failed_tests and (
+                self.mode == "dry-run" or (performance is not None and performance >= self.threshold)
+            )
+            logging.info(
+                f"Bisection round {self.rounds + 1}: {','.join(nodes)} {'passed' if probe_passed else 'failed'} "
+                f"with performance {performance}"
+            )
+            passed.append(probe_passed)
+        return passed
+
+    async def run(self) -> None:
+        """Run rounds of probes until every node is told apart or no more probes can be planned."""
+        probes = self.plan_round()
+        while probes:
+            self.record_round(probes, await self.run_round(probes))
+            probes = self.plan_round()
+        logging.info(
+            f"Bisection finished after {self.rounds} rounds. Bad nodes: {', '.join(sorted(self.bad_nodes)) or 'none'}."
+        )
+        if self.inconclusive_groups:
+            groups = "; ".join(",".join(group) for group in self.inconclusive_groups)
+            logging.warning(f"Groups failing only as a whole, while both of their halves passed: {groups}")
+        if self.unresolved_nodes:
+            logging.warning(
+                f"Nodes left suspected, since no probe passed to compare them with: {', '.join(self.unresolved_nodes)}"
+            )
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+import os
+import sqlite3
+import statistics
+import time
+from contextlib import closing
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .runtime_model import RuntimeModel
+from .test import Test
+
+
+class NodeLedger:
+    """
+    Persistent ledger of the jobs each node ran, with their performance and failures, stored in SQLite.
+
+    The ledger lives in the output directory shared by all runs, so every run of every campaign adds to it. A node is
+    flagged as slow when the jobs it ran consistently perform worse than the other jobs of the same test, and as flaky
+    when too many of its jobs fail. Only the jobs of the last `MAX_AGE` seconds count, so flags expire once a node
+    has been repaired and no longer fails or slows down its jobs.
+
+    Attributes
+        path (str): Path to the SQLite database.
+    """
+
+    FILE_NAME = "node_ledger.sqlite"
+    MIN_SAMPLES = 3
+    SLOW_RATIO = 0.9
+    MAX_FAILURE_RATE = 0.5
+    MAX_AGE = 7 * 24 * 60 * 60
+
+    def __init__(self, base_output_path: str) -> None:
+        """
+        Initialize a NodeLedger instance, creating its database if needed.
+
+        Args:
+            base_output_path (str): The output directory holding one subdirectory per run.
+        """
+        os.makedirs(base_output_path, exist_ok=True)
+        self.path = os.path.join(base_output_path, self.FILE_NAME)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS job_nodes ("
+                "test_key TEXT NOT NULL, job_id TEXT NOT NULL, node TEXT NOT NULL, failed INTEGER NOT NULL, "
+                "performance REAL, recorded_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the database, waiting for other CloudAI processes writing to it.
+
+        Returns
+            sqlite3.Connection: The connection.
+        """
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, test: Test, job_id: int, nodes: Sequence[str], failed: bool, performance: Optional[float]) -> None:
+        """
+        Record a finished job on each of its nodes.
+
+        The performance of jobs is only compared between tests with the same runtime key, which run the same
+        configuration on the same number of nodes.
+
+        Args:
+            test (Test): The test of the job.
+            job_id (int): The ID of the job.
+            nodes (Sequence[str]): The nodes the job ran on.
+            failed (bool): Whether the job failed.
+            performance (Optional[float]): The job's performance, higher is better, or None if unknown.
+        """
+        test_key = RuntimeModel.get_test_key(test)
+        recorded_at = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT INTO job_nodes VALUES (?, ?, ?, ?, ?, ?)",
+                [(test_key, str(job_id), node, int(failed), performance, recorded_at) for node in nodes],
+            )
+
+    def load(self) -> List[Tuple[str, str, str, int, Optional[float]]]:
+        """
+        Read the records of the ledger from the last `MAX_AGE` seconds.
+
+        Returns
+            List[Tuple[str, str, str, int, Optional[float]]]: The test key, job ID, node, failure flag and performance
+                of each record.
+        """
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT test_key, job_id, node, failed, performance FROM job_nodes WHERE recorded_at >= ?",
+                (time.time() - self.MAX_AGE,),
+            ).fetchall()
+
+    def get_flagged_nodes(self) -> Dict[str, str]:
+        """
+        Return the nodes flagged as slow or flaky, with at least `MIN_SAMPLES` recent jobs each.
+
+        A node is slow when the median ratio of its jobs' performance to the median performance of their test is below
+        `SLOW_RATIO`, and flaky when at least `MAX_FAILURE_RATE` of its jobs failed.
+
+        Returns
+            Dict[str, str]: Mapping of flagged node names to the reason they are flagged.
+        """
+        records = self.load()
+        job_performances: Dict[str, Dict[str, float]] = {}
+        for test_key, job_id, _, _, performance in records:
+            if performance is not None:
+                job_performances.setdefault(test_key, {})[job_id] = performance
+        test_medians = {key: statistics.median(perf.values()) for key, perf in job_performances.items()}
+
+        failures: Dict[str, List[int]] = {}
+        ratios: Dict[str, List[float]] = {}
+        for test_key, _, node, failed, performance in records:
+            failures.setdefault(node, []).append(failed)
+            if performance is not None and test_medians[test_key] > 0:
+                ratios.setdefault(node, []).append(performance / test_medians[test_key])
+
+        flagged: Dict[str, str] = {}
+        for node, node_failures in failures.items():
+            if len(node_failures) >= self.MIN_SAMPLES and statistics.mean(node_failures) >= self.MAX_FAILURE_RATE:
+                flagged[node] = f"{sum(node_failures)} of {len(node_failures)} jobs failed"
+        for node, node_ratios in ratios.items():
+            ratio = statistics.median(node_ratios)
+            if node not in flagged and len(node_ratios) >= self.MIN_SAMPLES and ratio < self.SLOW_RATIO:
+                flagged[node] = f"jobs performed at {ratio:.0%} of their test's median"
+        for node, reason in flagged.items():
+            logging.debug(f"Node {node} is flagged in {self.path}: {reason}")
+        return flagged
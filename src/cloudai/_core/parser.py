@@ -62,6 +62,27 @@ class Parser:
             Tuple[System, List[TestTemplate], TestScenario]: A tuple containing the system object, a list of test
                 template objects, and the test scenario object.
         """
+        system, tests, test_scenarios = self.parse_scenarios(
+            test_path, [test_scenario_path] if test_scenario_path else []
+        )
+        return system, tests, test_scenarios[0] if test_scenarios else None
+
+    def parse_scenarios(
+        self, test_path: Path, test_scenario_paths: List[Path]
+    ) -> Tuple[System, List[Test], List[TestScenario]]:
+        """
+        Parse configurations for system, test templates, and several test scenarios run together.
+
+        The system, test templates, and tests are parsed once and shared by all test scenarios.
+
+        Args:
+            test_path (Path): The directory of test configurations.
+            test_scenario_paths (List[Path]): The test scenario files. If empty, all tests are returned.
+
+        Returns:
+            Tuple[System, List[Test], List[TestScenario]]: A tuple containing the system object, the tests used by the
+                test scenarios, and the test scenario objects in the given order.
+        """
         if not test_path.exists():
             raise FileNotFoundError(f"Test path '{test_path}' not found.")
 
@@ -80,13 +101,36 @@ class Parser:
         logging.debug(f"Parsed {len(tests)} tests: {[t.name for t in tests]}")
 
         filtered_tests = tests
-        test_scenario: Optional[TestScenario] = None
-        if test_scenario_path:
+        test_scenarios: List[TestScenario] = []
+        for test_scenario_path in test_scenario_paths:
             test_scenario_parser = TestScenarioParser(str(test_scenario_path), system, test_mapping)
-            test_scenario = test_scenario_parser.parse()
-            logging.debug("Parsed test scenario")
+            test_scenarios.append(test_scenario_parser.parse())
+            logging.debug(f"Parsed test scenario {test_scenario_path}")
 
-            scenario_tests = set(t.name for t in test_scenario.tests)
+        if test_scenarios:
+            scenario_tests = set(t.name for test_scenario in test_scenarios for t in test_scenario.tests)
             filtered_tests = [t for t in tests if t.name in scenario_tests]
 
-        return system, filtered_tests, test_scenario
+        return system, filtered_tests, test_scenarios
+
+    def parse_systems(
+        self, system_config_paths: List[Path], test_path: Path, test_scenario_path: Optional[Path] = None
+    ) -> List[Tuple[System, List[Test], Optional[TestScenario]]]:
+        """
+        Parse configurations for the same tests and test scenario on several systems, to run them on each system.
+
+        The test templates, tests, and test scenario are parsed for each system, since they depend on it.
+
+        Args:
+            system_config_paths (List[Path]): The system configuration files.
+            test_path (Path): The directory of test configurations.
+            test_scenario_path (Optional[Path]): The test scenario file, if any.
+
+        Returns:
+            List[Tuple[System, List[Test], Optional[TestScenario]]]: For each system in the given order, a tuple
+                containing the system object, its tests, and its test scenario object.
+        """
+        return [
+            Parser(system_config_path, self.test_template_path).parse(test_path, test_scenario_path)
+            for system_config_path in system_config_paths
+        ]
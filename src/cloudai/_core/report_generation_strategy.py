@@ -50,3 +50,15 @@ class ReportGenerationStrategy:
             sol (Optional[float]): Speed-of-light performance for reference.
         """
         pass
+
+    def get_performance(self, directory_path: str) -> Optional[float]:
+        """
+        Read a single performance value of a finished job from the directory, where higher is better.
+
+        Args:
+            directory_path (str): Path to the directory.
+
+        Returns:
+            Optional[float]: The performance value, or None if the strategy does not report one.
+        """
+        return None
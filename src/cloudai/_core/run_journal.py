@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import logging
+import os
+from typing import Any, Dict, List
+
+
+class RunJournal:
+    """
+    Append-only journal of the submissions and completions of a run, stored as JSON lines in the run directory.
+
+    Every record is flushed to disk before the call returns, so that the journal describes the run up to the last
+    recorded event even if the CloudAI process dies. An interrupted run can then be resumed from it.
+
+    Attributes
+        path (str): Path to the journal file.
+    """
+
+    FILE_NAME = "journal.jsonl"
+
+    def __init__(self, run_path: str) -> None:
+        """
+        Initialize a RunJournal instance.
+
+        Args:
+            run_path (str): Path to the run directory holding the journal.
+        """
+        self.path = os.path.join(run_path, self.FILE_NAME)
+
+    def record(self, event: str, **fields: Any) -> None:
+        """
+        Append an event to the journal.
+
+        Args:
+            event (str): The event type (e.g., 'submitted', 'completed', 'failed').
+            **fields (Any): JSON-serializable details of the event.
+        """
+        with open(self.path, "a") as journal_file:
+            journal_file.write(json.dumps({"event": event, **fields}) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Read all events recorded in the journal.
+
+        A last line left incomplete by an interrupted write is ignored.
+
+        Returns
+            List[Dict[str, Any]]: The recorded events, in recording order.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        entries = []
+        with open(self.path, "r") as journal_file:
+            for line in journal_file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logging.warning(f"Ignoring malformed journal entry in {self.path}: {line.strip()}")
+        return entries
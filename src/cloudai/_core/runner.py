@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import logging
+from typing import Optional
 
 from .base_runner import BaseRunner
 from .registry import Registry
@@ -38,15 +39,18 @@ class Runner:
         mode (str): The operation mode ('dry-run', 'run').
         system (System): The system configuration object.
         test_scenario (TestScenario): The test scenario to be executed.
+        resume_path (Optional[str]): Output directory of an interrupted run to resume, or None to start a new run.
     """
 
     _runners = {}
 
-    def __init__(self, mode: str, system: System, test_scenario: TestScenario):
+    def __init__(self, mode: str, system: System, test_scenario: TestScenario, resume_path: Optional[str] = None):
         logging.info("Initializing Runner")
-        self.runner = self.create_runner(mode, system, test_scenario)
+        self.runner = self.create_runner(mode, system, test_scenario, resume_path)
 
-    def create_runner(self, mode: str, system: System, test_scenario: TestScenario) -> BaseRunner:
+    def create_runner(
+        self, mode: str, system: System, test_scenario: TestScenario, resume_path: Optional[str] = None
+    ) -> BaseRunner:
         """
         Dynamically create a runner instance based on the system's scheduler type.
 
@@ -54,6 +58,7 @@ class Runner:
             mode (str): The operation mode ('dry-run', 'run').
             system (System): The system configuration.
             test_scenario (TestScenario): The test scenario to run.
+            resume_path (Optional[str]): Output directory of an interrupted run to resume, or None to start a new run.
 
         Returns:
             BaseRunner: A runner instance suitable for the system.
@@ -69,7 +74,7 @@ class Runner:
             raise NotImplementedError(msg)
         runner_class = registry.runners_map[scheduler_type]
         logging.info(f"Creating {runner_class.__name__}")
-        return runner_class(mode, system, test_scenario)
+        return runner_class(mode, system, test_scenario, resume_path)
 
     async def run(self):
         """Run the test scenario using the instantiated runner."""
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import hashlib
+import json
+import logging
+import math
+import os
+import statistics
+from typing import Dict, List, Optional
+
+from .run_journal import RunJournal
+from .test import Test
+
+
+class RuntimeModel:
+    """
+    Runtime predictions of tests, learned from the job completions recorded in the journals of prior runs.
+
+    Runtimes are keyed by test name, test template, requested nodes, and a hash of the test's command arguments, so
+    that a test only learns from runs with the same configuration.
+
+    Attributes
+        runtimes (Dict[str, List[float]]): Observed runtimes in seconds per test key, oldest first.
+    """
+
+    MAX_SAMPLES = 20
+    MIN_SAMPLES_FOR_TIME_LIMIT = 3
+    TIME_LIMIT_MARGIN = 0.25
+    MIN_TIME_LIMIT = 300
+
+    def __init__(self, runtimes: Optional[Dict[str, List[float]]] = None) -> None:
+        """
+        Initialize a RuntimeModel instance.
+
+        Args:
+            runtimes (Optional[Dict[str, List[float]]]): Observed runtimes in seconds per test key.
+        """
+        self.runtimes = runtimes if runtimes is not None else {}
+        self._test_keys: Dict[Test, str] = {}
+        self._default_runtime: Optional[float] = None
+        self._default_runtime_known = False
+
+    @classmethod
+    def load(cls, base_output_path: str) -> "RuntimeModel":
+        """
+        Build a runtime model from the journals of the runs stored in an output directory.
+
+        Only successful job completions that record when the job started and ended are learned from; jobs terminated
+        by a dependency and jobs that failed are ignored.
+
+        Args:
+            base_output_path (str): The output directory holding one subdirectory per run.
+
+        Returns:
+            RuntimeModel: The runtime model.
+        """
+        model = cls()
+        if not os.path.isdir(base_output_path):
+            return model
+
+        for run_name in sorted(os.listdir(base_output_path)):
+            run_path = os.path.join(base_output_path, run_name)
+            if not os.path.isfile(os.path.join(run_path, RunJournal.FILE_NAME)):
+                continue
+            entries = RunJournal(run_path).load()
+            failed_job_ids = {entry.get("job_id") for entry in entries if entry["event"] == "failed"}
+            for entry in entries:
+                if (
+                    entry["event"] == "completed"
+                    and "runtime_key" in entry
+                    and not entry.get("terminated_by_dependency")
+                    and entry.get("job_id") not in failed_job_ids
+                ):
+                    model.add(entry["runtime_key"], entry["end_time"] - entry["start_time"])
+
+        logging.debug(f"Loaded runtimes of {len(model.runtimes)} test configurations from {base_output_path}")
+        return model
+
+    @staticmethod
+    def get_test_key(test: Test) -> str:
+        """
+        Return the key under which the runtimes of a test are recorded.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            str: The key of the test's configuration.
+        """
+        cmd_args = {key: value for key, value in test.cmd_args.items() if key not in ("time_limit", "job_array")}
+        cmd_args_hash = hashlib.sha1(json.dumps(cmd_args, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        nodes = ",".join(test.nodes) if test.nodes else str(test.num_nodes)
+        return f"{test.name}|{test.test_template.name}|{nodes}|{cmd_args_hash}"
+
+    def add(self, key: str, runtime: float) -> None:
+        """
+        Record an observed runtime, keeping only the most recent observations of each key.
+
+        Args:
+            key (str): The key of the test's configuration.
+            runtime (float): The observed runtime in seconds.
+        """
+        samples = self.runtimes.setdefault(key, [])
+        samples.append(runtime)
+        del samples[: -self.MAX_SAMPLES]
+        self._default_runtime_known = False
+
+    def get_cached_test_key(self, test: Test) -> str:
+        """
+        Return the key of a test, computed once per test and model since hashing its command arguments is costly.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            str: The key of the test's configuration.
+        """
+        key = self._test_keys.get(test)
+        if key is None:
+            key = self._test_keys[test] = self.get_test_key(test)
+        return key
+
+    def has_predictions(self, tests: List[Test]) -> bool:
+        """
+        Check whether the runtime of any of the given tests can be predicted.
+
+        Args:
+            tests (List[Test]): The tests.
+
+        Returns:
+            bool: True if at least one of the tests has run before.
+        """
+        return bool(self.runtimes) and any(self.get_cached_test_key(test) in self.runtimes for test in tests)
+
+    def predict(self, test: Test) -> Optional[float]:
+        """
+        Predict the runtime of a test as the median of its recent runtimes.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            Optional[float]: The predicted runtime in seconds, or None if the test has never run.
+        """
+        samples = self.runtimes.get(self.get_cached_test_key(test))
+        return statistics.median(samples) if samples else None
+
+    def get_default_runtime(self) -> Optional[float]:
+        """
+        Return the runtime assumed for tests that have never run, the median of the predictions of all known tests.
+
+        Returns
+            Optional[float]: The default runtime in seconds, or None if the model has no runtimes.
+        """
+        if not self._default_runtime_known:
+            predictions = [statistics.median(samples) for samples in self.runtimes.values() if samples]
+            self._default_runtime = statistics.median(predictions) if predictions else None
+            self._default_runtime_known = True
+        return self._default_runtime
+
+    def get_time_limit(self, test: Test) -> Optional[str]:
+        """
+        Return a tight time limit for a test, the longest of its recent runtimes with a safety margin.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            Optional[str]: The time limit in "hh:mm:ss" format, or None if the test has not run often enough.
+        """
+        samples = self.runtimes.get(self.get_cached_test_key(test), [])
+        if len(samples) < self.MIN_SAMPLES_FOR_TIME_LIMIT:
+            return None
+        limit = max(math.ceil(max(samples) * (1 + self.TIME_LIMIT_MARGIN) / 60) * 60, self.MIN_TIME_LIMIT)
+        return f"{limit // 3600:02d}:{limit % 3600 // 60:02d}:00"
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Callable, List
+
+
+class SubmissionBudget:
+    """
+    Limit on the number of tests in flight shared by several runners, such as those of test scenarios run together.
+
+    Attributes
+        limit (int): Maximum number of tests in flight across all runners.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize a SubmissionBudget instance.
+
+        Args:
+            limit (int): Maximum number of tests in flight across all runners.
+
+        Raises:
+            ValueError: If the limit is not positive.
+        """
+        if limit < 1:
+            raise ValueError(f"The limit of tests in flight must be positive, got {limit}")
+        self.limit = limit
+        self._counters: List[Callable[[], int]] = []
+
+    def register(self, count_in_flight: Callable[[], int]) -> None:
+        """
+        Add a runner to the runners sharing the budget.
+
+        Args:
+            count_in_flight (Callable[[], int]): Function returning the number of tests in flight of the runner.
+        """
+        self._counters.append(count_in_flight)
+
+    def has_room(self) -> bool:
+        """
+        Check if one more test can be submitted within the budget.
+
+        Returns
+            bool: True if the runners have fewer tests in flight than the limit.
+        """
+        return sum(count_in_flight() for count_in_flight in self._counters) < self.limit
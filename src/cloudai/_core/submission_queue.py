@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import bisect
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+from .test import Test
+
+
+class SubmissionQueue:
+    """
+    Queue of tests waiting for a free submission slot, ordered by priority and then by critical path.
+
+    Tests with equal priority are ordered so that the test starting the longest chain of dependent tests comes first,
+    which lets long chains start early and shortens the overall run. Chains may be measured in number of tests or in
+    predicted runtime. Remaining ties keep their queueing order.
+
+    Attributes
+        critical_path (Callable[[Test], float]): Function returning the critical path length or cost of a test.
+    """
+
+    def __init__(self, critical_path: Callable[[Test], float]) -> None:
+        """
+        Initialize a SubmissionQueue instance.
+
+        Args:
+            critical_path (Callable[[Test], float]): Function returning the critical path length or cost of a test.
+        """
+        self.critical_path = critical_path
+        self._entries: List[Tuple[Tuple[int, float], int, Test]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """
+        Return the number of queued tests.
+
+        Returns
+            int: The number of queued tests.
+        """
+        return len(self._entries)
+
+    def sort_key(self, test: Test) -> Tuple[int, float]:
+        """
+        Return the key ordering a test in the queue, lower keys being submitted first.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            Tuple[int, float]: The ordering key.
+        """
+        return (-test.priority, -self.critical_path(test))
+
+    def push(self, test: Test) -> None:
+        """
+        Queue a test.
+
+        Args:
+            test (Test): The test to queue.
+        """
+        bisect.insort(self._entries, (self.sort_key(test), next(self._counter), test))
+
+    def pop(self, can_submit: Callable[[Test], bool]) -> Optional[Test]:
+        """
+        Remove and return the first queued test that can be submitted.
+
+        Tests that cannot be submitted, for instance because their node group is full, do not hold back the tests
+        queued after them.
+
+        Args:
+            can_submit (Callable[[Test], bool]): Function telling whether a test can be submitted now.
+
+        Returns:
+            Optional[Test]: The test to submit, or None if no queued test can be submitted.
+        """
+        for index, (_, _, test) in enumerate(self._entries):
+            if can_submit(test):
+                del self._entries[index]
+                return test
+        return None
+
+    def clear(self) -> None:
+        """Drop all queued tests."""
+        self._entries.clear()
@@ -26,7 +26,9 @@ class System(ABC):
         name (str): Unique name of the system.
         scheduler (str): Type of scheduler used by the system, determining the specific subclass of System to be used.
         output_path (str): Path to the output directory.
-        monitor_interval (int): Interval in seconds for monitoring jobs.
+        monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+        max_monitor_interval (int): Longest interval in seconds for monitoring jobs, reached by backing off while job
+            states do not change.
     """
 
     def __init__(
@@ -35,6 +37,7 @@ class System(ABC):
         scheduler: str,
         output_path: str,
         monitor_interval: int = 1,
+        max_monitor_interval: int = 30,
     ) -> None:
         """
         Initialize a System instance.
@@ -43,25 +46,39 @@ class System(ABC):
             name (str): Name of the system.
             scheduler (str): Type of scheduler used by the system.
             output_path (str): Path to the output directory.
-            monitor_interval (int): Interval in seconds for monitoring jobs.
+            monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+            max_monitor_interval (int): Longest interval in seconds for monitoring jobs.
         """
         self.name = name
         self.scheduler = scheduler
         self.output_path = output_path
         self.monitor_interval = monitor_interval
+        self.max_monitor_interval = max_monitor_interval
 
     def __repr__(self) -> str:
         """
         Provide a detailed string representation of the System instance, including all its attributes.
 
         Returns
-            str: String representation of the system including name, scheduler, output_path, and monitor_interval.
+            str: String representation of the system including name, scheduler, output_path, and monitor intervals.
         """
         return (
             f"System(name='{self.name}', scheduler='{self.scheduler}', output_path='{self.output_path}', "
-            f"monitor_interval={self.monitor_interval})"
+            f"monitor_interval={self.monitor_interval}, max_monitor_interval={self.max_monitor_interval})"
         )
 
+    def share_state(self, max_age: float) -> None:
+        """
+        Let the runners of several test scenarios run together share the state they query from the system.
+
+        A query answered less than max_age seconds ago is answered again from the same snapshot instead of querying
+        the system again. The default implementation does nothing.
+
+        Args:
+            max_age (float): Longest time in seconds a snapshot of the system state is reused.
+        """
+        return
+
     @abstractmethod
     def update(self) -> None:
         raise NotImplementedError("Subclasses must implement this method.")
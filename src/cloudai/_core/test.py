@@ -17,6 +17,7 @@
 import sys
 from typing import Dict, List, Optional, Union
 
+from .failure_policy import FailurePolicy
 from .job_status_result import JobStatusResult
 from .test_template import TestTemplate
 
@@ -44,6 +45,10 @@ class Test:
         ideal_perf (float): The ideal performance value for comparison.
         time_limit (Optional[str]): Time limit for the test specified as a string in "hh:mm:ss" format, or None if no
             limit.
+        priority (int): Submission priority of the test. When submissions are limited, tests with a higher priority
+            are submitted first.
+        failure_policy (Optional[FailurePolicy]): Policy applied when a job of the test fails, or None to apply the
+            test scenario's policy.
     """
 
     __test__ = False
@@ -66,6 +71,8 @@ class Test:
         weight: float = 0.0,
         ideal_perf: float = 1.0,
         time_limit: Optional[str] = None,
+        priority: int = 0,
+        failure_policy: Optional[FailurePolicy] = None,
     ) -> None:
         """
         Initialize a Test instance.
@@ -88,6 +95,8 @@ class Test:
             weight (float): The weight of this test in a test scenario, indicating its relative importance or priority.
             ideal_perf (float): The ideal performance value for comparison.
             time_limit (Optional[str]): Time limit for the test specified as a string
+            priority (int): Submission priority of the test.
+            failure_policy (Optional[FailurePolicy]): Policy applied when a job of the test fails.
         """
         self.name = name
         self.description = description
@@ -106,6 +115,8 @@ class Test:
         self.weight = weight
         self.ideal_perf = ideal_perf
         self.time_limit = time_limit
+        self.priority = priority
+        self.failure_policy = failure_policy
 
     def __repr__(self) -> str:
         """
@@ -174,6 +185,18 @@ class Test:
         """
         return self.test_template.get_job_status(output_path)
 
+    def get_performance(self, output_path: str) -> Optional[float]:
+        """
+        Read a single performance value of a finished job from its output directory, where higher is better.
+
+        Args:
+            output_path (str): Path to the output directory.
+
+        Returns:
+            Optional[float]: The performance value, or None if the test template does not report one.
+        """
+        return self.test_template.get_performance(output_path)
+
     def has_more_iterations(self) -> bool:
         """
         Check if the test has more iterations to run.
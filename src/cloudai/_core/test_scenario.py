@@ -14,8 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+from typing import Callable, Dict, List, Optional
 
+from .failure_policy import FailurePolicy
 from .test import Test
 
 
@@ -26,20 +27,125 @@ class TestScenario:
     Attributes
         name (str): Unique name of the test scenario.
         tests (List[Test]): Tests in the scenario.
+        max_in_flight (Optional[int]): Maximum number of tests submitted and not yet completed at any time, or None for
+            no limit.
+        max_in_flight_per_group (Dict[str, int]): Maximum number of tests in flight per node group.
+        failure_policy (FailurePolicy): Policy applied when a job fails, unless its test has its own policy.
     """
 
     __test__ = False
 
-    def __init__(self, name: str, tests: List[Test]) -> None:
+    def __init__(
+        self,
+        name: str,
+        tests: List[Test],
+        max_in_flight: Optional[int] = None,
+        max_in_flight_per_group: Optional[Dict[str, int]] = None,
+        failure_policy: Optional[FailurePolicy] = None,
+    ) -> None:
         """
         Initialize a TestScenario instance.
 
         Args:
             name (str): Name of the test scenario.
             tests (List[Test]): List of tests in the scenario.
+            max_in_flight (Optional[int]): Maximum number of tests in flight at any time, or None for no limit.
+            max_in_flight_per_group (Optional[Dict[str, int]]): Maximum number of tests in flight per node group.
+            failure_policy (Optional[FailurePolicy]): Policy applied when a job fails, fail-fast by default.
         """
         self.name = name
         self.tests = tests
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_group = max_in_flight_per_group if max_in_flight_per_group is not None else {}
+        self.failure_policy = failure_policy if failure_policy is not None else FailurePolicy()
+        self._dependents: Optional[Dict[Test, Dict[str, List[Test]]]] = None
+        self._critical_path_costs: Dict[Callable[[Test], float], Dict[Test, float]] = {}
+
+    @staticmethod
+    def _build_dependents_index(tests: List[Test]) -> Dict[Test, Dict[str, List[Test]]]:
+        """
+        Build the reverse dependency index of the scenario.
+
+        Args:
+            tests (List[Test]): List of tests in the scenario.
+
+        Returns:
+            Dict[Test, Dict[str, List[Test]]]: Mapping of each upstream test to its dependent tests, grouped by
+                dependency type.
+        """
+        dependents: Dict[Test, Dict[str, List[Test]]] = {}
+        for test in tests:
+            for dep_type, dependency in test.dependencies.items():
+                if dependency:
+                    dependents.setdefault(dependency.test, {}).setdefault(dep_type, []).append(test)
+        return dependents
+
+    def get_dependents(self, test: Test, dep_type: str) -> List[Test]:
+        """
+        Return the tests that depend on the given test with the given dependency type.
+
+        The reverse dependency index is built on first use, so that dependency resolution costs O(out-degree) instead
+        of a scan over all tests of the scenario.
+
+        Args:
+            test (Test): The upstream test.
+            dep_type (str): The dependency type ('start_post_comp', 'start_post_init', 'end_post_comp').
+
+        Returns:
+            List[Test]: Tests depending on the given test, in scenario order.
+        """
+        if self._dependents is None:
+            self._dependents = self._build_dependents_index(self.tests)
+        return self._dependents.get(test, {}).get(dep_type, [])
+
+    def get_critical_path_length(self, test: Test) -> int:
+        """
+        Return the number of tests on the longest chain of tests started after the given test, including itself.
+
+        Only 'start_post_comp' and 'start_post_init' dependencies make a chain, since they delay the start of a test.
+
+        Args:
+            test (Test): The first test of the chains.
+
+        Returns:
+            int: The length of the longest chain.
+        """
+        return int(self.get_critical_path_cost(test, self._unit_cost))
+
+    @staticmethod
+    def _unit_cost(test: Test) -> float:
+        """
+        Return the cost of a test when chains are measured in number of tests.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            float: Always 1.
+        """
+        return 1.0
+
+    def get_critical_path_cost(self, test: Test, cost: Callable[[Test], float]) -> float:
+        """
+        Return the total cost of the costliest chain of tests started after the given test, including itself.
+
+        Costs are memoized per cost function, which therefore must not change its results during the run.
+
+        Args:
+            test (Test): The first test of the chains.
+            cost (Callable[[Test], float]): Function returning the cost of a single test, e.g., its predicted runtime.
+
+        Returns:
+            float: The total cost of the costliest chain.
+        """
+        costs = self._critical_path_costs.setdefault(cost, {})
+        if test not in costs:
+            costs[test] = cost(test)  # guards against dependency cycles
+            dependents = self.get_dependents(test, "start_post_comp") + self.get_dependents(test, "start_post_init")
+            costs[test] = cost(test) + max(
+                (self.get_critical_path_cost(dependent, cost) for dependent in dependents), default=0.0
+            )
+        return costs[test]
 
     def __repr__(self) -> str:
         """
@@ -20,6 +20,7 @@ from typing import Any, Dict
 
 import toml
 
+from .failure_policy import FailurePolicy
 from .system import System
 from .test import Test, TestDependency
 from .test_scenario import TestScenario
@@ -77,6 +78,8 @@ class TestScenarioParser:
         # Create section-specific test instances
         section_tests = {section: self._create_section_test(section, info) for section, info in tests_data.items()}
 
+        failure_policy = FailurePolicy.from_dict(data.get("failure_policy", {}))
+
         total_weight = sum(test_info.get("weight", 0) for test_info in tests_data.values())
         normalized_weight = 0 if total_weight == 0 else 100 / total_weight
 
@@ -101,7 +104,20 @@ class TestScenarioParser:
             if "time_limit" in test_info:
                 test.time_limit = test_info["time_limit"]
 
-        return TestScenario(name=test_scenario_name, tests=list(section_tests.values()))
+            if "priority" in test_info:
+                test.priority = int(test_info["priority"])
+
+            if "failure_policy" in test_info:
+                test.failure_policy = FailurePolicy.from_dict(test_info["failure_policy"], failure_policy)
+
+        max_in_flight = data.get("max_in_flight")
+        return TestScenario(
+            name=test_scenario_name,
+            tests=list(section_tests.values()),
+            max_in_flight=int(max_in_flight) if max_in_flight is not None else None,
+            max_in_flight_per_group={k: int(v) for k, v in data.get("max_in_flight_per_group", {}).items()},
+            failure_policy=failure_policy,
+        )
 
     def _create_section_test(self, section: str, test_info: Dict[str, Any]) -> Test:
         """
@@ -227,6 +227,20 @@ class TestTemplate:
         if self.report_generation_strategy is not None:
             return self.report_generation_strategy.generate_report(test_name, directory_path, sol)
 
+    def get_performance(self, directory_path: str) -> Optional[float]:
+        """
+        Read a single performance value of a finished job from the directory.
+
+        Args:
+            directory_path (str): Path to the directory.
+
+        Returns:
+            Optional[float]: The performance value, or None if unavailable.
+        """
+        if self.report_generation_strategy is not None:
+            return self.report_generation_strategy.get_performance(directory_path)
+        return None
+
     def grade(self, directory_path: str, ideal_perf: float) -> Optional[float]:
         """
         Read the performance value from the directory.
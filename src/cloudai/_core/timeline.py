@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+from typing import Any, Dict, List
+
+
+class Timeline:
+    """
+    Timeline of a run in the Chrome trace event format, viewable in Perfetto or chrome://tracing.
+
+    Each track of the timeline, such as a test, is shown as a thread of a single process. Events are kept in memory and
+    written to the run directory by `write`.
+
+    Attributes
+        path (str): Path to the timeline file.
+        events (List[Dict[str, Any]]): The trace events recorded so far.
+    """
+
+    FILE_NAME = "timeline.json"
+    PID = 1
+
+    def __init__(self, run_path: str, name: str) -> None:
+        """
+        Initialize a Timeline instance.
+
+        Args:
+            run_path (str): Path to the run directory holding the timeline.
+            name (str): Name of the timeline, shown as the name of its process.
+        """
+        self.path = os.path.join(run_path, self.FILE_NAME)
+        self.events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": self.PID, "tid": 0, "args": {"name": name}}
+        ]
+        self._tids: Dict[str, int] = {}
+
+    def get_tid(self, track: str) -> int:
+        """
+        Return the thread ID of a track, declaring the track on first use.
+
+        Args:
+            track (str): Name of the track.
+
+        Returns:
+            int: The thread ID of the track.
+        """
+        if track not in self._tids:
+            self._tids[track] = len(self._tids) + 1
+            self.events.append(
+                {"name": "thread_name", "ph": "M", "pid": self.PID, "tid": self._tids[track], "args": {"name": track}}
+            )
+        return self._tids[track]
+
+    def add_span(self, track: str, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """
+        Record a span of time on a track as a complete event.
+
+        Args:
+            track (str): Name of the track.
+            name (str): Name of the span.
+            category (str): Category of the span, used to filter events in trace viewers.
+            start (float): Start of the span, as an epoch timestamp.
+            end (float): End of the span, as an epoch timestamp.
+            **args (Any): JSON-serializable details of the span.
+        """
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round(start * 1e6),
+                "dur": max(round(end * 1e6) - round(start * 1e6), 0),
+                "pid": self.PID,
+                "tid": self.get_tid(track),
+                "args": args,
+            }
+        )
+
+    def write(self) -> None:
+        """Write the timeline to the run directory, replacing any timeline written before."""
+        with open(self.path, "w") as timeline_file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, timeline_file)
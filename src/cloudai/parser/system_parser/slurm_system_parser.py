@@ -15,10 +15,10 @@
 # limitations under the License.
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from cloudai import BaseSystemParser
-from cloudai.systems.slurm import SlurmNode, SlurmNodeState, SlurmSystem
+from cloudai.systems.slurm import SlurmNode, SlurmNodeState, SlurmSystem, SlurmTopology
 
 
 class SlurmSystemParser(BaseSystemParser):
@@ -87,6 +87,19 @@ class SlurmSystemParser(BaseSystemParser):
         ntasks_per_node = safe_int(data.get("ntasks_per_node"))
 
         cache_docker_images_locally = str_to_bool(data.get("cache_docker_images_locally", "False"))
+        native_dependencies = str_to_bool(data.get("native_dependencies", "False"))
+        job_arrays = str_to_bool(data.get("job_arrays", "False"))
+        job_array_max_running = safe_int(data.get("job_array_max_running"))
+        persistent_allocation = str_to_bool(data.get("persistent_allocation", "False"))
+        auto_time_limit = str_to_bool(data.get("auto_time_limit", "False"))
+        pipelined_iterations = str_to_bool(data.get("pipelined_iterations", "False"))
+        monitor_interval = int(data.get("monitor_interval", 1))
+        max_monitor_interval = int(data.get("max_monitor_interval", 30))
+        node_state_ttl = float(data.get("node_state_ttl", 10))
+        columnar_node_states = str_to_bool(data.get("columnar_node_states", "False"))
+        node_ledger = str_to_bool(data.get("node_ledger", "False"))
+        topology = self.parse_topology(data)
+        query_topology = str_to_bool(data.get("query_topology", "False"))
 
         nodes_dict: Dict[str, SlurmNode] = {}
         updated_partitions: Dict[str, List[SlurmNode]] = {}
@@ -156,6 +169,44 @@ class SlurmSystemParser(BaseSystemParser):
             gpus_per_node=gpus_per_node,
             ntasks_per_node=ntasks_per_node,
             cache_docker_images_locally=cache_docker_images_locally,
+            native_dependencies=native_dependencies,
+            job_arrays=job_arrays,
+            job_array_max_running=job_array_max_running,
+            persistent_allocation=persistent_allocation,
+            auto_time_limit=auto_time_limit,
+            pipelined_iterations=pipelined_iterations,
+            monitor_interval=monitor_interval,
+            max_monitor_interval=max_monitor_interval,
+            node_state_ttl=node_state_ttl,
+            columnar_node_states=columnar_node_states,
+            topology=topology,
+            query_topology=query_topology,
+            node_ledger=node_ledger,
             groups=updated_groups,
             global_env_vars=global_env_vars,
+            node_index=nodes_dict,
         )
+
+    def parse_topology(self, data: Dict[str, Any]) -> Optional[SlurmTopology]:
+        """
+        Parse the network topology of a Slurm system, given inline or as a topology file.
+
+        Args:
+            data (Dict[str, Any]): The loaded configuration data.
+
+        Returns:
+            Optional[SlurmTopology]: The topology, or None if the configuration has none.
+
+        Raises:
+            ValueError: If both 'topology' and 'topology_file' are given.
+        """
+        topology = data.get("topology")
+        topology_file = data.get("topology_file")
+        if topology and topology_file:
+            raise ValueError("Only one of 'topology' and 'topology_file' can be given.")
+        if topology:
+            return SlurmTopology.from_dict(topology)
+        if topology_file:
+            with open(topology_file, "r") as f:
+                return SlurmTopology.from_string(f.read())
+        return None
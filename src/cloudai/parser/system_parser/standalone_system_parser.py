@@ -47,4 +47,12 @@ class StandaloneSystemParser(BaseSystemParser):
             raise ValueError("Field 'output_path' is required.")
         output_path = os.path.abspath(output_path)
 
-        return StandaloneSystem(name=name, output_path=output_path)
+        monitor_interval = int(data.get("monitor_interval", 1))
+        max_monitor_interval = int(data.get("max_monitor_interval", 30))
+
+        return StandaloneSystem(
+            name=name,
+            output_path=output_path,
+            monitor_interval=monitor_interval,
+            max_monitor_interval=max_monitor_interval,
+        )
@@ -15,7 +15,9 @@
 # limitations under the License.
 
 from .report_generator import ReportGenerator
+from .system_comparison_report import SystemComparisonReport
 
 __all__ = [
     "ReportGenerator",
+    "SystemComparisonReport",
 ]
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import logging
+import os
+import statistics
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from cloudai import RunJournal, Test, TestScenario
+
+from .tool.csv_report_tool import CSVReportTool
+
+
+class SystemComparisonReport:
+    """
+    Compares the runs of the same test scenario on several systems, test by test.
+
+    The comparison is taken from the run journals, so it covers every test template: for each test and system, the
+    number of succeeded jobs, the number of failed jobs, and the median runtime of the succeeded jobs. Runtimes are
+    measured from the runner's polling, so they are only as precise as the monitoring interval. For test templates
+    reporting a performance value, such as the average bus bandwidth of NCCL tests, the median performance of the
+    succeeded jobs is read from their outputs and compared as well.
+
+    Attributes
+        output_path (str): Directory the comparison is written to.
+    """
+
+    FILE_NAME = "system_comparison.csv"
+
+    def __init__(self, output_path: str) -> None:
+        """
+        Initialize the SystemComparisonReport.
+
+        Args:
+            output_path (str): Directory the comparison is written to.
+        """
+        self.output_path = output_path
+
+    def generate(self, test_scenario: TestScenario, run_paths: Dict[str, str]) -> str:
+        """
+        Write the comparison of the runs of a test scenario on several systems as a CSV file.
+
+        Args:
+            test_scenario (TestScenario): The test scenario run on every system.
+            run_paths (Dict[str, str]): Mapping of system names to the output directories of their runs.
+
+        Returns:
+            str: Path to the comparison file.
+        """
+        rows: Dict[str, Dict[str, Any]] = {
+            str(test.section_name): {"test": test.section_name} for test in test_scenario.tests
+        }
+        tests = {str(test.section_name): test for test in test_scenario.tests}
+        for system_name, run_path in run_paths.items():
+            stats = self.get_test_stats(RunJournal(run_path).load(), tests)
+            for test_name, row in rows.items():
+                test_stats = stats.get(test_name, {"succeeded": 0, "failed": 0, "runtimes": [], "performances": []})
+                runtimes = test_stats["runtimes"]
+                performances = test_stats["performances"]
+                row[f"{system_name} succeeded"] = test_stats["succeeded"]
+                row[f"{system_name} failed"] = test_stats["failed"]
+                row[f"{system_name} median runtime (s)"] = round(statistics.median(runtimes), 1) if runtimes else None
+                row[f"{system_name} median performance"] = statistics.median(performances) if performances else None
+
+        csv_tool = CSVReportTool(self.output_path)
+        csv_tool.set_dataframe(pd.DataFrame(list(rows.values())))
+        csv_tool.finalize_report(self.FILE_NAME)
+        report_path = os.path.join(self.output_path, self.FILE_NAME)
+        logging.info(f"Comparison of the systems written to {report_path}")
+        return report_path
+
+    @staticmethod
+    def get_test_stats(
+        entries: List[Dict[str, Any]], tests: Optional[Dict[str, Test]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize the jobs of each test of a run from its journal.
+
+        Args:
+            entries (List[Dict[str, Any]]): The entries of the run journal.
+            tests (Optional[Dict[str, Test]]): Mapping of test section names to the tests of the run, used to read the
+                performance of succeeded jobs from their outputs. No performance is read if not provided.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of test section names to the number of succeeded jobs, the number of
+                failed jobs, and the runtimes and performance values of the succeeded jobs.
+        """
+        tests = tests or {}
+        failed_jobs = {(entry["test"], entry["job_id"]) for entry in entries if entry["event"] == "failed"}
+        stats: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            test_stats = stats.setdefault(
+                entry.get("test", ""), {"succeeded": 0, "failed": 0, "runtimes": [], "performances": []}
+            )
+            if entry["event"] == "failed":
+                test_stats["failed"] += 1
+            elif entry["event"] == "completed" and not entry.get("terminated_by_dependency"):
+                if (entry["test"], entry["job_id"]) in failed_jobs:
+                    continue
+                test_stats["succeeded"] += 1
+                if "end_time" in entry:
+                    test_stats["runtimes"].append(entry["end_time"] - entry["start_time"])
+                test = tests.get(entry["test"])
+                if test is not None and "output_path" in entry:
+                    performance = test.get_performance(entry["output_path"])
+                    if performance is not None:
+                        test_stats["performances"].append(performance)
+        return stats
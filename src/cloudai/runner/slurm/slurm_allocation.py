@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import List, Optional
+
+
+class SlurmAllocation:
+    """
+    Represents a persistent Slurm allocation whose nodes are shared by the job steps of a test scenario.
+
+    Attributes
+        job_id (int): The job ID of the allocation.
+        nodes (List[str]): The names of the allocated nodes, in allocation order.
+        free_nodes (List[str]): The allocated nodes that are not used by any job step.
+    """
+
+    def __init__(self, job_id: int, nodes: List[str]) -> None:
+        """
+        Initialize a SlurmAllocation instance.
+
+        Args:
+            job_id (int): The job ID of the allocation.
+            nodes (List[str]): The names of the allocated nodes.
+        """
+        self.job_id = job_id
+        self.nodes = nodes
+        self.free_nodes = list(nodes)
+        self._nodes_released: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """
+        Return the condition signaling released nodes, creating it on first use in the running event loop.
+
+        Returns
+            asyncio.Condition: The condition signaling released nodes.
+        """
+        if self._nodes_released is None:
+            self._nodes_released = asyncio.Condition()
+        return self._nodes_released
+
+    async def acquire(self, num_nodes: int) -> List[str]:
+        """
+        Reserve nodes of the allocation for a job step, waiting for running job steps to release them if needed.
+
+        Nodes are handed out in allocation order, so that a job step gets nodes that are close to each other when the
+        allocation follows the network topology.
+
+        Args:
+            num_nodes (int): The number of nodes to reserve.
+
+        Returns:
+            List[str]: The names of the reserved nodes.
+
+        Raises:
+            ValueError: If the allocation has, or is left with after excluding nodes, fewer nodes than requested.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: len(self.free_nodes) >= num_nodes or num_nodes > len(self.nodes))
+            if num_nodes > len(self.nodes):
+                raise ValueError(
+                    f"Requested {num_nodes} nodes, but the allocation {self.job_id} only has {len(self.nodes)} nodes."
+                )
+            self.free_nodes.sort(key=self.nodes.index)
+            reserved_nodes = self.free_nodes[:num_nodes]
+            del self.free_nodes[:num_nodes]
+        return reserved_nodes
+
+    async def release(self, nodes: List[str]) -> None:
+        """
+        Return nodes reserved by a finished job step to the allocation.
+
+        Args:
+            nodes (List[str]): The names of the nodes to release.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.free_nodes.extend(node for node in nodes if node in self.nodes)
+            condition.notify_all()
+
+    async def exclude(self, nodes: List[str]) -> None:
+        """
+        Stop handing out nodes of the allocation, e.g., after a job step failed on them.
+
+        Nodes excluded while reserved by a job step are not returned to the allocation when the job step releases them.
+
+        Args:
+            nodes (List[str]): The names of the nodes to exclude.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.nodes = [node for node in self.nodes if node not in nodes]
+            self.free_nodes = [node for node in self.free_nodes if node not in nodes]
+            condition.notify_all()
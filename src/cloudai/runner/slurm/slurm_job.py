@@ -14,10 +14,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cloudai import BaseJob
+
+from asyncio.subprocess import Process
+from typing import List, Optional
+
+from cloudai import BaseJob, Test
 
 
 class SlurmJob(BaseJob):
-    """Represents a job in a Slurm environment."""
+    """
+    Represents a job in a Slurm environment.
+
+    Attributes
+        array_size (Optional[int]): Number of iterations run by the job when it is submitted as a job array, or None
+            for a regular job running a single iteration.
+    """
+
+    def __init__(self, job_id: int, test: Test, output_path: str, array_size: Optional[int] = None):
+        """
+        Initialize a SlurmJob instance.
+
+        Args:
+            job_id (int): The unique identifier of the job.
+            test (Test): The test instance associated with the job.
+            output_path (str): The path where the job's output is stored. For a job array, each iteration writes to a
+                subdirectory named after its iteration.
+            array_size (Optional[int]): Number of iterations run by the job when it is submitted as a job array.
+        """
+        super().__init__(job_id, test, output_path)
+        self.array_size = array_size
+
+    def increment_iteration(self):
+        """Advance the iteration count of the associated test by the number of iterations run by the job."""
+        self.test.current_iteration += self.array_size or 1
+
+
+class SlurmJobStep(SlurmJob):
+    """
+    Represents a test running as a job step of a persistent Slurm allocation.
+
+    The job ID of a job step is the PID of the local process running the test's batch script.
+
+    Attributes
+        process (Process): The local process running the test's batch script inside the allocation.
+        nodes (List[str]): The allocation nodes reserved for the job step.
+    """
+
+    def __init__(self, test: Test, output_path: str, process: Process, nodes: List[str]):
+        """
+        Initialize a SlurmJobStep instance.
 
-    pass
+        Args:
+            test (Test): The test instance associated with the job step.
+            output_path (str): The path where the job step's output is stored.
+            process (Process): The local process running the test's batch script inside the allocation.
+            nodes (List[str]): The allocation nodes reserved for the job step.
+        """
+        super().__init__(process.pid, test, output_path)
+        self.process = process
+        self.nodes = nodes
@@ -14,14 +14,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import getpass
 import logging
-from typing import cast
+import os
+import re
+import signal
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
-from cloudai import BaseJob, BaseRunner, JobIdRetrievalError, System, Test, TestScenario
+from cloudai import BaseJob, BaseRunner, JobIdRetrievalError, JobStatusResult, System, Test, TestScenario
 from cloudai.systems import SlurmSystem
-from cloudai.util import CommandShell
+from cloudai.systems.slurm.strategy import SlurmCommandGenStrategy
+from cloudai.util import AsyncCommandShell
 
-from .slurm_job import SlurmJob
+from .slurm_allocation import SlurmAllocation
+from .slurm_job import SlurmJob, SlurmJobStep
 
 
 class SlurmRunner(BaseRunner):
@@ -34,11 +42,27 @@ class SlurmRunner(BaseRunner):
     Attributes
         slurm_system (SlurmSystem): This attribute is a casted version of the `system` attribute to `SlurmSystem` type,
             ensuring that Slurm-specific properties and methods are accessible.
-        cmd_shell (CommandShell): An instance of CommandShell for executing system commands.
+        cmd_shell (AsyncCommandShell): An instance of AsyncCommandShell for executing system commands.
+        job_states (Dict[int, str]): Snapshot of Slurm job states taken at the beginning of the current monitoring tick.
+        polled_job_ids (Set[int]): IDs of the jobs that were queried when the current snapshot was taken.
+        native_dependency_map (Dict[Test, str]): Slurm dependency expressions to attach to the next submission of each
+            test, used when the system enables native dependencies.
+        allocation (Optional[SlurmAllocation]): The persistent allocation running the tests as job steps, when the
+            system enables persistent allocations.
+        pipelined_jobs (Dict[Test, Tuple[int, SlurmJob]]): Jobs submitted ahead of time for the next iteration of each
+            test, with the iteration they run, when the system enables pipelined iterations.
         Inherits all other attributes from the BaseRunner class.
     """
 
-    def __init__(self, mode: str, system: System, test_scenario: TestScenario) -> None:
+    JOB_STEP_OPTIONS = {
+        "gpus-per-node": "SLURM_GPUS_PER_NODE",
+        "ntasks-per-node": "SLURM_NTASKS_PER_NODE",
+        "time": "SLURM_TIMELIMIT",
+    }
+
+    def __init__(
+        self, mode: str, system: System, test_scenario: TestScenario, resume_path: Optional[str] = None
+    ) -> None:
         """
         Initialize the SlurmRunner.
 
@@ -46,28 +70,359 @@ class SlurmRunner(BaseRunner):
             mode (str): The operation mode ('dry-run', 'run').
             system (System): The system configuration.
             test_scenario (TestScenario): The test scenario to run.
+            resume_path (Optional[str]): Output directory of an interrupted run to resume, or None to start a new run.
         """
-        super().__init__(mode, system, test_scenario)
+        super().__init__(mode, system, test_scenario, resume_path)
         self.slurm_system: SlurmSystem = cast(SlurmSystem, system)
-        self.cmd_shell = CommandShell()
+        self.cmd_shell = AsyncCommandShell()
+        self.job_states: Dict[int, str] = {}
+        self.polled_job_ids: Set[int] = set()
+        self.native_dependency_map: Dict[Test, str] = {}
+        self.allocation: Optional[SlurmAllocation] = None
+        self.pipelined_jobs: Dict[Test, Tuple[int, SlurmJob]] = {}
+
+    async def run(self):
+        """Run the test scenario, inside a single persistent allocation if the system enables it."""
+        if self.mode == "run" and self.slurm_system.persistent_allocation and not self.shutting_down:
+            self.allocation = await self.allocate()
+        try:
+            await super().run()
+        finally:
+            await self.release_allocation()
+
+    async def terminate(self):
+        """Terminate all outstanding jobs and release the allocation."""
+        try:
+            await super().terminate()
+        finally:
+            await self.release_allocation()
+
+    def get_test_node_group(self, test: Test) -> Optional[str]:
+        """
+        Return the node group a test runs on, as 'partition:group', from the test's first group node specification.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            Optional[str]: The node group, or None if the test does not request nodes from a group.
+        """
+        for node_spec in test.nodes:
+            if ":" in node_spec:
+                partition_name, group_name = node_spec.split(":")[:2]
+                return f"{partition_name}:{group_name}"
+        return None
+
+    def submits_sbatch_script(self, test: Test) -> bool:
+        """
+        Check if a test is submitted as a plain sbatch script generated by CloudAI.
+
+        Args:
+            test (Test): The test to check.
+
+        Returns:
+            bool: True if the test's command generation strategy writes a batch script, False otherwise.
+        """
+        strategy = test.test_template.command_gen_strategy
+        return isinstance(strategy, SlurmCommandGenStrategy) and strategy.SUBMITS_SBATCH_SCRIPT
+
+    def can_run_as_job_step(self, test: Test) -> bool:
+        """
+        Check if a test can run as a job step of a persistent allocation.
+
+        Args:
+            test (Test): The test to check.
+
+        Returns:
+            bool: True if the test's batch script can be run inside an existing allocation, False otherwise.
+        """
+        return self.submits_sbatch_script(test)
+
+    def get_test_num_nodes(self, test: Test) -> int:
+        """
+        Get the number of nodes a test runs on.
+
+        Args:
+            test (Test): The test.
+
+        Returns:
+            int: The number of nodes requested by the test.
+        """
+        return self.slurm_system.count_nodes(test.nodes) if test.nodes else test.num_nodes
+
+    def estimate_peak_num_nodes(self) -> int:
+        """
+        Estimate the number of nodes needed to run the test scenario as job steps of a single allocation.
+
+        Tests with a 'start_post_comp' dependency start once another test has finished and are assumed to reuse its
+        nodes. All other tests may run at the same time.
+
+        Returns
+            int: The estimated peak number of nodes, or 0 if no test can run as a job step.
+        """
+        tests = [test for test in self.test_scenario.tests if self.can_run_as_job_step(test)]
+        if not tests:
+            return 0
+        concurrent_num_nodes = sum(
+            self.get_test_num_nodes(test) for test in tests if "start_post_comp" not in test.dependencies
+        )
+        return max(concurrent_num_nodes, *(self.get_test_num_nodes(test) for test in tests))
+
+    async def allocate(self) -> Optional[SlurmAllocation]:
+        """
+        Acquire a persistent allocation sized to the test scenario's peak node requirement.
+
+        Returns
+            Optional[SlurmAllocation]: The allocation, or None if no test can run as a job step.
+
+        Raises
+            RuntimeError: If the allocation cannot be acquired.
+        """
+        num_nodes = self.estimate_peak_num_nodes()
+        if num_nodes == 0:
+            return None
+
+        command = self.slurm_system.gen_salloc_command(num_nodes, f"cloudai_{self.test_scenario.name}")
+        logging.info(f"Acquiring a persistent allocation of {num_nodes} nodes: {command}")
+        stdout, stderr = await self.cmd_shell.execute(command)
+        match = re.search(r"Granted job allocation (\d+)", stdout + stderr)
+        if match is None:
+            raise RuntimeError(f"Failed to acquire a persistent allocation: {stderr.strip() or stdout.strip()}")
+
+        job_id = int(match.group(1))
+        nodes = await self.slurm_system.get_job_nodes(job_id)
+        logging.info(f"Persistent allocation {job_id} granted on nodes {self.slurm_system.format_node_list(nodes)}")
+        return SlurmAllocation(job_id, nodes)
+
+    async def release_allocation(self) -> None:
+        """Release the persistent allocation, if any."""
+        if self.allocation is None:
+            return
+        allocation, self.allocation = self.allocation, None
+        logging.info(f"Releasing persistent allocation {allocation.job_id}")
+        await self.slurm_system.scancel(allocation.job_id)
+
+    async def submit_test(self, test: Test):
+        """
+        Start a test and, if native dependencies are enabled, submit the tests that Slurm can hold back for it.
+
+        Args:
+            test (Test): The test to be started.
+        """
+        await super().submit_test(test)
+        if self.slurm_system.native_dependencies and self.allocation is None and test in self.test_to_job_map:
+            await self.submit_native_dependents(test)
 
-    def _submit_test(self, test: Test) -> SlurmJob:
+    async def submit_native_dependents(self, upstream_test: Test) -> None:
+        """
+        Submit right away the tests depending on a just-submitted test, letting Slurm enforce their dependencies.
+
+        Only tests whose start dependencies can all be expressed as Slurm job dependencies are submitted. The other
+        tests are left to the runner's regular dependency handling.
+
+        Args:
+            upstream_test (Test): The test that has just been submitted.
+        """
+        for dep_type in ("start_post_comp", "start_post_init"):
+            for test in self.test_scenario.get_dependents(upstream_test, dep_type):
+                if test in self.scheduled_tests:
+                    continue
+                dependency = self.get_native_dependency(test)
+                if dependency is None:
+                    continue
+                logging.info(f"Submitting test {test.section_name} with Slurm dependency {dependency}")
+                self.native_dependency_map[test] = dependency
+                await self.submit_test(test)
+
+    def get_native_dependency(self, test: Test) -> Optional[str]:
+        """
+        Translate the start dependencies of a test into a Slurm dependency expression.
+
+        A 'start_post_comp' dependency with no delay on a test whose iterations all run in a single job (a
+        single-iteration test or a job array) maps to 'afterany:<job_id>', and a 'start_post_init' dependency whose
+        delay is a whole number of minutes maps to 'after:<job_id>+<minutes>'.
+        Several dependencies are combined with '?', since a test starts as soon as any of them is met.
+
+        Args:
+            test (Test): The dependent test.
+
+        Returns:
+            Optional[str]: The Slurm dependency expression, or None if any start dependency cannot be expressed
+                natively or its upstream test has not been submitted.
+        """
+        strategy = test.test_template.command_gen_strategy
+        if not isinstance(strategy, SlurmCommandGenStrategy) or not strategy.SUBMITS_SBATCH_SCRIPT:
+            return None
+
+        conditions = []
+        for dep_type, dep in test.dependencies.items():
+            if dep_type == "end_post_comp" or not dep:
+                continue
+            upstream_job = self.test_to_job_map.get(dep.test)
+            if upstream_job is None:
+                return None
+            runs_all_iterations = dep.test.iterations == 1 or cast(SlurmJob, upstream_job).array_size is not None
+            if dep_type == "start_post_comp" and dep.time == 0 and runs_all_iterations:
+                conditions.append(f"afterany:{upstream_job.id}")
+            elif dep_type == "start_post_init" and dep.time % 60 == 0:
+                minutes = dep.time // 60
+                conditions.append(f"after:{upstream_job.id}+{minutes}" if minutes else f"after:{upstream_job.id}")
+            else:
+                return None
+
+        return "?".join(conditions) if conditions else None
+
+    def get_job_array_spec(self, test: Test) -> Optional[str]:
+        """
+        Build the Slurm array specification used to run all iterations of a test as a single job array.
+
+        Args:
+            test (Test): The test to be submitted.
+
+        Returns:
+            Optional[str]: The value of the sbatch '--array' option (e.g., '0-19%4'), or None if the test should be
+                submitted as a regular job, one iteration at a time.
+        """
+        if not self.slurm_system.job_arrays:
+            return None
+        strategy = test.test_template.command_gen_strategy
+        if not isinstance(strategy, SlurmCommandGenStrategy) or not strategy.SUPPORTS_JOB_ARRAYS:
+            return None
+        if test.current_iteration != 0 or not 1 < test.iterations < sys.maxsize:
+            return None
+
+        array_spec = f"0-{test.iterations - 1}"
+        if self.slurm_system.job_array_max_running:
+            array_spec += f"%{self.slurm_system.job_array_max_running}"
+        return array_spec
+
+    def get_job_array_output_path(self, test: Test) -> str:
+        """
+        Create the output directories of all iterations of a test submitted as a job array.
+
+        Args:
+            test (Test): The test to be submitted.
+
+        Returns:
+            str: The path to the test's output directory, holding one subdirectory per iteration.
+        """
+        test_output_path = os.path.dirname(self.get_job_output_path(test))
+        for iteration in range(test.current_iteration + 1, test.iterations):
+            os.makedirs(os.path.join(test_output_path, str(iteration)), exist_ok=True)
+        return test_output_path
+
+    def get_auto_time_limit(self, test: Test) -> Optional[str]:
+        """
+        Get the time limit predicted for a test from its runtimes in prior runs, when the system enables it.
+
+        Tests with a configured time limit, and tests that are not submitted with a plain sbatch script, keep their
+        own time limit.
+
+        Args:
+            test (Test): The test to be submitted.
+
+        Returns:
+            Optional[str]: The time limit in "hh:mm:ss" format, or None if no time limit should be added.
+        """
+        if not self.slurm_system.auto_time_limit or test.time_limit is not None or "time_limit" in test.cmd_args:
+            return None
+        if not self.submits_sbatch_script(test):
+            return None
+        return self.runtime_model.get_time_limit(test)
+
+    def gen_exec_command(self, test: Test, job_output_path: str, slurm_args: Dict[str, str]) -> str:
+        """
+        Generate the command submitting a test, with additional Slurm arguments chosen by the runner.
+
+        Args:
+            test (Test): The test to be submitted.
+            job_output_path (str): The path to the job's output directory.
+            slurm_args (Dict[str, str]): Slurm arguments passed to the command generation strategy through the test's
+                command arguments, e.g., 'job_array' and 'time_limit'.
+
+        Returns:
+            str: The submission command.
+        """
+        test.cmd_args.update(slurm_args)
+        try:
+            return test.gen_exec_command(job_output_path)
+        finally:
+            for key in slurm_args:
+                del test.cmd_args[key]
+
+    async def _submit_test(self, test: Test) -> SlurmJob:
         """
         Submit a test for execution on Slurm and returns a SlurmJob.
 
+        Within a persistent allocation, the test runs as a job step, as long as the allocation has enough nodes left.
+        Otherwise it is submitted as a batch job, unless its current iteration has already been submitted ahead of time
+        by iteration pipelining. The runner is woken up when the batch job starts and creates its output file.
+
         Args:
             test (Test): The test to be executed.
 
+        Returns:
+            SlurmJob: A SlurmJob object
+        """
+        if (
+            self.allocation is not None
+            and self.can_run_as_job_step(test)
+            and self.get_test_num_nodes(test) <= len(self.allocation.nodes)
+        ):
+            return await self.launch_job_step(test)
+
+        job = self.adopt_pipelined_job(test)
+        if job is None:
+            await self.cancel_pipelined_job(test)
+            job = await self.submit_batch_job(test, test.current_iteration, self.native_dependency_map.pop(test, None))
+        if job.array_size is None and self.submits_sbatch_script(test):
+            stdout_path = os.path.join(job.output_path, "stdout.txt")
+            self.wake_on(job, lambda: os.path.exists(stdout_path))
+        await self.pipeline_next_iteration(job)
+        return job
+
+    async def submit_batch_job(self, test: Test, iteration: int, dependency: Optional[str] = None) -> SlurmJob:
+        """
+        Submit an iteration of a test as a Slurm batch job.
+
+        When job arrays are enabled and supported by the test, all iterations of the test are submitted at once. When
+        automatic time limits are enabled, the time limit predicted from prior runs is added to the batch script. Nodes
+        excluded after failed jobs are excluded from the submission of tests that do not name their nodes.
+
+        Args:
+            test (Test): The test to be executed.
+            iteration (int): The iteration to submit, ahead of the test's current iteration when pipelining.
+            dependency (Optional[str]): Slurm dependency expression holding the job back, if any.
+
         Returns:
             SlurmJob: A SlurmJob object
         """
         logging.info(f"Running test: {test.section_name}")
-        job_output_path = self.get_job_output_path(test)
-        exec_cmd = test.gen_exec_command(job_output_path)
+        slurm_args: Dict[str, str] = {}
+        time_limit = self.get_auto_time_limit(test)
+        if time_limit:
+            logging.info(f"Using time limit {time_limit} predicted from prior runs for test {test.section_name}")
+            slurm_args["time_limit"] = time_limit
+        array_spec = self.get_job_array_spec(test) if iteration == test.current_iteration else None
+        array_size = None
+        if array_spec:
+            array_size = test.iterations
+            slurm_args["job_array"] = array_spec
+            job_output_path = self.get_job_array_output_path(test)
+        else:
+            job_output_path = self.get_job_output_path(test, iteration)
+        exec_cmd = self.gen_exec_command(test, job_output_path, slurm_args)
+        sbatch_options = []
+        if dependency:
+            sbatch_options.append(f"--dependency={dependency}")
+        if self.slurm_system.excluded_nodes and not test.nodes:
+            sbatch_options.append(f"--exclude={','.join(sorted(self.slurm_system.excluded_nodes))}")
+        if sbatch_options and exec_cmd.startswith("sbatch "):
+            exec_cmd = f"sbatch {' '.join(sbatch_options)} {exec_cmd[len('sbatch '):]}"
         logging.info(f"Executing command for test {test.section_name}: {exec_cmd}")
         job_id = 0
         if self.mode == "run":
-            stdout, stderr = self.cmd_shell.execute(exec_cmd).communicate()
+            stdout, stderr = await self.cmd_shell.execute(exec_cmd)
             job_id = test.get_job_id(stdout, stderr)
             if job_id is None:
                 raise JobIdRetrievalError(
@@ -77,12 +432,350 @@ class SlurmRunner(BaseRunner):
                     stderr=stderr,
                     message="Failed to retrieve job ID from command output.",
                 )
-        return SlurmJob(job_id, test, job_output_path)
+        return SlurmJob(job_id, test, job_output_path, array_size)
+
+    async def pipeline_next_iteration(self, job: SlurmJob) -> None:
+        """
+        Submit the next iteration of a test ahead of time, held back by Slurm until the given job has finished.
+
+        The next iteration is queued while the current one runs, so that it starts as soon as the nodes are released,
+        instead of after the runner has noticed the completion and submitted it. Its output directory is created
+        ahead of time.
 
-    def is_job_running(self, job: BaseJob) -> bool:
+        Args:
+            job (SlurmJob): The job running the test's current iteration.
+        """
+        test = job.test
+        next_iteration = test.current_iteration + 1
+        if (
+            not self.slurm_system.pipelined_iterations
+            or job.array_size is not None
+            or next_iteration >= test.iterations
+            or not self.submits_sbatch_script(test)
+        ):
+            return
+        next_job = await self.submit_batch_job(test, next_iteration, f"afterany:{job.id}")
+        logging.info(f"Pipelined iteration {next_iteration} of test {test.section_name} as job {next_job.id}")
+        self.pipelined_jobs[test] = (next_iteration, next_job)
+        self.record_job_event("pipelined", next_job, iteration=next_iteration)
+
+    def adopt_pipelined_job(self, test: Test) -> Optional[SlurmJob]:
+        """
+        Take the job submitted ahead of time for the current iteration of a test, if any.
+
+        Args:
+            test (Test): The test to be executed.
+
+        Returns:
+            Optional[SlurmJob]: The job running the test's current iteration, or None if it has to be submitted.
+        """
+        iteration, job = self.pipelined_jobs.get(test, (None, None))
+        if job is None or iteration != test.current_iteration:
+            return None
+        del self.pipelined_jobs[test]
+        logging.info(f"Iteration {iteration} of test {test.section_name} was submitted ahead of time as job {job.id}")
+        return job
+
+    async def cancel_pipelined_job(self, test: Test) -> None:
+        """
+        Cancel the job submitted ahead of time for the next iteration of a test, if any.
+
+        Args:
+            test (Test): The test.
+        """
+        iteration, job = self.pipelined_jobs.pop(test, (None, None))
+        if job is None:
+            return
+        logging.info(f"Cancelling job {job.id} pipelined for iteration {iteration} of test {test.section_name}")
+        if self.mode == "run":
+            await self.slurm_system.scancel(job.id)
+        self.record_job_event("pipeline_cancelled", job, iteration=iteration)
+
+    async def launch_job_step(self, test: Test) -> SlurmJobStep:
+        """
+        Run a test's batch script as a job step of the persistent allocation, on nodes reserved for it.
+
+        The script runs locally with the environment of the allocation, so that its srun command launches a job step
+        on the reserved nodes without going through the Slurm queue.
+
+        Args:
+            test (Test): The test to be executed.
+
+        Returns:
+            SlurmJobStep: A SlurmJobStep object
+        """
+        allocation = cast(SlurmAllocation, self.allocation)
+        logging.info(f"Running test as a job step of allocation {allocation.job_id}: {test.section_name}")
+        job_output_path = self.get_job_output_path(test)
+        exec_cmd = test.gen_exec_command(job_output_path)
+        script_path = exec_cmd[len("sbatch ") :]
+        options = self.get_job_step_options(script_path)
+
+        nodes = await allocation.acquire(self.get_test_num_nodes(test))
+        logging.info(f"Executing script for test {test.section_name} on nodes {','.join(nodes)}: {script_path}")
+        hostfile_path = os.path.join(job_output_path, "hostfile")
+        tasks_per_node = int(options.get("ntasks-per-node", self.slurm_system.ntasks_per_node or 1))
+        with open(hostfile_path, "w") as hostfile:
+            hostfile.writelines(f"{node}\n" for node in nodes for _ in range(tasks_per_node))
+        stdout_path, stderr_path = (os.path.join(job_output_path, name) for name in ("stdout.txt", "stderr.txt"))
+        with open(stdout_path, "w") as stdout, open(stderr_path, "w") as stderr:
+            process = await asyncio.create_subprocess_exec(
+                "/bin/bash",
+                script_path,
+                stdout=stdout,
+                stderr=stderr,
+                env=self.gen_job_step_env(allocation, nodes, hostfile_path, options),
+                start_new_session=True,
+            )
+
+        job = SlurmJobStep(test, job_output_path, process, nodes)
+        self.schedule_task(self._release_job_step_nodes(allocation, job))
+        return job
+
+    def get_job_step_options(self, script_path: str) -> Dict[str, str]:
+        """
+        Read the #SBATCH options of a batch script that also apply to its job step.
+
+        The script runs with bash rather than sbatch, so its #SBATCH lines are comments, and the options they set
+        have to be passed to srun through its environment instead.
+
+        Args:
+            script_path (str): The path of the batch script.
+
+        Returns:
+            Dict[str, str]: The values of the options in JOB_STEP_OPTIONS set by the script, by option name.
+        """
+        options = {}
+        with open(script_path, "r") as script:
+            for line in script:
+                match = re.match(r"#SBATCH\s+--([\w-]+)=(\S+)", line)
+                if match and match.group(1) in self.JOB_STEP_OPTIONS:
+                    options[match.group(1)] = match.group(2)
+        return options
+
+    def gen_job_step_env(
+        self, allocation: SlurmAllocation, nodes: List[str], hostfile_path: str, options: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Generate the environment attaching the srun commands of a batch script to nodes of the allocation.
+
+        srun reads the job ID, node count and task layout from this environment. The arbitrary distribution makes it
+        place the tasks on the hosts listed in the hostfile, which limits the job step to the reserved nodes.
+
+        Args:
+            allocation (SlurmAllocation): The persistent allocation.
+            nodes (List[str]): The allocation nodes reserved for the job step.
+            hostfile_path (str): The path of the file listing the host of each task of the job step.
+            options (Dict[str, str]): The #SBATCH options of the batch script that apply to the job step.
+
+        Returns:
+            Dict[str, str]: The environment of the batch script.
+        """
+        env = dict(os.environ)
+        env.update(
+            {
+                "SLURM_JOB_ID": str(allocation.job_id),
+                "SLURM_JOBID": str(allocation.job_id),
+                "SLURM_JOB_NODELIST": ",".join(nodes),
+                "SLURM_NNODES": str(len(nodes)),
+                "SLURM_HOSTFILE": hostfile_path,
+                "SLURM_DISTRIBUTION": "arbitrary",
+            }
+        )
+        if self.slurm_system.ntasks_per_node:
+            env["SLURM_NTASKS_PER_NODE"] = str(self.slurm_system.ntasks_per_node)
+        for option, value in options.items():
+            env[self.JOB_STEP_OPTIONS[option]] = value
+        return env
+
+    async def _release_job_step_nodes(self, allocation: SlurmAllocation, job: SlurmJobStep) -> None:
+        """
+        Wait for a job step to finish, return its nodes to the allocation and wake the runner up.
+
+        Args:
+            allocation (SlurmAllocation): The persistent allocation.
+            job (SlurmJobStep): The job step.
+        """
+        await job.process.wait()
+        await allocation.release(job.nodes)
+        self.poller.notify()
+
+    async def get_job_nodes(self, job: BaseJob) -> Optional[List[str]]:
+        """
+        Return the nodes a finished job ran on.
+
+        Args:
+            job (BaseJob): The finished job.
+
+        Returns:
+            Optional[List[str]]: The names of the nodes, or None if they cannot be retrieved.
+        """
+        if isinstance(job, SlurmJobStep):
+            return job.nodes
+        try:
+            return await self.slurm_system.get_finished_job_nodes(job.id)
+        except RuntimeError as e:
+            logging.warning(f"Cannot retrieve the nodes of job {job.id}: {e}")
+            return None
+
+    async def exclude_job_nodes(self, job: BaseJob) -> None:
+        """
+        Keep the nodes a failed job ran on out of later submissions and of the persistent allocation.
+
+        Args:
+            job (BaseJob): The failed job.
+        """
+        nodes = await self.get_job_nodes(job)
+        if nodes is None:
+            return
+        if isinstance(job, SlurmJobStep) and self.allocation is not None:
+            await self.allocation.exclude(nodes)
+        logging.info(f"Excluding the nodes of failed job {job.id} from later submissions: {', '.join(nodes)}")
+        self.slurm_system.excluded_nodes.update(nodes)
+
+    async def record_job_nodes(self, job: BaseJob, job_status_result: JobStatusResult) -> None:
+        """
+        Record the outcome and performance of a finished job on its nodes, when the system keeps a node ledger.
+
+        Jobs terminated by a dependency and job arrays, whose tasks may run on different nodes, are not recorded.
+
+        Args:
+            job (BaseJob): The finished job.
+            job_status_result (JobStatusResult): The status of the job.
+        """
+        if not self.slurm_system.node_ledger or job.terminated_by_dependency or cast(SlurmJob, job).array_size:
+            return
+        nodes = await self.get_job_nodes(job)
+        if not nodes:
+            return
+        failed = not job_status_result.is_successful
+        performance = None if failed else job.test.get_performance(job.output_path)
+        self.slurm_system.record_job_nodes(job.test, job.id, nodes, failed, performance)
+
+    def get_job_journal_fields(self, job: BaseJob) -> Dict[str, Any]:
+        """
+        Return the details of a job recorded in the run journal, including whether it is a job array or a job step.
+
+        Args:
+            job (BaseJob): The job.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable details of the job.
+        """
+        fields = super().get_job_journal_fields(job)
+        fields["array_size"] = cast(SlurmJob, job).array_size
+        fields["job_step"] = isinstance(job, SlurmJobStep)
+        return fields
+
+    async def handle_job_failure(self, failed_job: BaseJob, job_status_result: JobStatusResult) -> int:
+        """
+        Handle a failed job, cancelling the next iteration submitted ahead of time if the failed one is retried.
+
+        Args:
+            failed_job (BaseJob): The job that has just failed.
+            job_status_result (JobStatusResult): The status of the failed job.
+
+        Returns:
+            int: 1 if the failed job counts as completed, 0 if its test is retried.
+        """
+        test = failed_job.test
+        if self.get_failure_policy(test).should_retry(self.retry_counts.get(test, 0)):
+            await self.cancel_pipelined_job(test)
+        return await super().handle_job_failure(failed_job, job_status_result)
+
+    async def resume_from_journal(self) -> int:
+        """
+        Restore the state of an interrupted run, cancelling the jobs it submitted ahead of time for later iterations.
+
+        Returns
+            int: The number of job completions recorded by the interrupted run.
+        """
+        entries = self.journal.load()
+        adopted_job_ids = {entry["job_id"] for entry in entries if entry["event"] == "submitted"}
+        stale_job_ids = [
+            entry["job_id"]
+            for entry in entries
+            if entry["event"] == "pipelined" and entry["job_id"] not in adopted_job_ids
+        ]
+        if stale_job_ids:
+            logging.info(f"Cancelling jobs {stale_job_ids} submitted ahead of time by the interrupted run.")
+            await self.slurm_system.scancel_jobs(stale_job_ids, user=getpass.getuser())
+        return await super().resume_from_journal()
+
+    def recover_job(self, test: Test, entry: Dict[str, Any]) -> Optional[BaseJob]:
+        """
+        Rebuild a Slurm job submitted by an interrupted run from its journal entry.
+
+        Job steps run by the interrupted process are not recovered, since the allocation they ran in is gone.
+
+        Args:
+            test (Test): The test of the job.
+            entry (Dict[str, Any]): The journal entry recording the job's submission.
+
+        Returns:
+            Optional[BaseJob]: The job, or None if the test has to be submitted again.
+        """
+        if entry.get("job_step"):
+            return None
+        return SlurmJob(entry["job_id"], test, entry["output_path"], entry.get("array_size"))
+
+    def get_job_runtime_fields(self, job: BaseJob) -> Dict[str, Any]:
+        """
+        Return the timestamps of a finished job recorded in the run journal, except for job arrays.
+
+        The iterations of a job array run concurrently, so the array's runtime is not the runtime of a single test.
+
+        Args:
+            job (BaseJob): The finished job.
+
+        Returns:
+            Dict[str, Any]: The runtime key of the test and the timestamps of the job, or no fields.
+        """
+        if cast(SlurmJob, job).array_size is not None:
+            return {}
+        return super().get_job_runtime_fields(job)
+
+    def get_job_status(self, job: BaseJob) -> JobStatusResult:
+        """
+        Retrieve the job status from the job's output directory.
+
+        A job array is successful only if every iteration is, and reports the error of the first failed iteration.
+
+        Args:
+            job (BaseJob): The job to be checked.
+
+        Returns:
+            JobStatusResult: The result containing the job status and an optional error message.
+        """
+        s_job = cast(SlurmJob, job)
+        if s_job.array_size is None:
+            return super().get_job_status(job)
+        for iteration in range(s_job.array_size):
+            result = job.test.get_job_status(os.path.join(job.output_path, str(iteration)))
+            if not result.is_successful:
+                return result
+        return JobStatusResult(is_successful=True)
+
+    async def update_job_states(self) -> None:
+        """
+        Take a snapshot of the states of all tracked jobs with a single Slurm query.
+
+        The node states of the system are invalidated when a job has finished, since it released its nodes.
+        """
+        if self.mode == "dry-run":
+            return
+        job_ids = [job.id for job in self.jobs if not isinstance(job, SlurmJobStep)]
+        self.job_states = await self.slurm_system.get_job_states(job_ids)
+        self.polled_job_ids = set(job_ids)
+        if any(self.slurm_system.is_job_state_completed(self.job_states.get(job_id)) for job_id in job_ids):
+            self.slurm_system.invalidate_node_states()
+
+    async def is_job_running(self, job: BaseJob) -> bool:
         """
         Check if the specified job is currently running.
 
+        Jobs submitted after the current snapshot was taken are reported as not running until the next tick.
+
         Args:
             job (BaseJob): The job to check.
 
@@ -91,12 +784,18 @@ class SlurmRunner(BaseRunner):
         """
         if self.mode == "dry-run":
             return True
-        return self.slurm_system.is_job_running(job.id)
+        if isinstance(job, SlurmJobStep):
+            return job.process.returncode is None
+        if job.id not in self.polled_job_ids:
+            return False
+        return self.slurm_system.is_job_state_running(self.job_states.get(job.id))
 
-    def is_job_completed(self, job: BaseJob) -> bool:
+    async def is_job_completed(self, job: BaseJob) -> bool:
         """
         Check if a Slurm job is completed.
 
+        Jobs submitted after the current snapshot was taken are reported as not completed until the next tick.
+
         Args:
             job (BaseJob): The job to check.
 
@@ -105,15 +804,49 @@ class SlurmRunner(BaseRunner):
         """
         if self.mode == "dry-run":
             return True
+        if isinstance(job, SlurmJobStep):
+            return job.process.returncode is not None
         s_job = cast(SlurmJob, job)
-        return self.slurm_system.is_job_completed(s_job.id)
+        if s_job.id not in self.polled_job_ids:
+            return False
+        return self.slurm_system.is_job_state_completed(self.job_states.get(s_job.id))
 
-    def kill_job(self, job: BaseJob) -> None:
+    async def kill_job(self, job: BaseJob) -> None:
         """
-        Terminate a Slurm job.
+        Terminate a Slurm job, along with the job submitted ahead of time for the next iteration of its test.
 
         Args:
             job (BaseJob): The job to be terminated.
         """
+        if isinstance(job, SlurmJobStep):
+            try:
+                os.killpg(job.process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                logging.debug(f"Job step {job.id} has already finished.")
+            return
         s_job = cast(SlurmJob, job)
-        self.slurm_system.scancel(s_job.id)
+        await self.slurm_system.scancel(s_job.id)
+        await self.cancel_pipelined_job(s_job.test)
+
+    async def kill_jobs(self, jobs: List[BaseJob]) -> None:
+        """
+        Terminate several Slurm jobs, along with the jobs submitted ahead of time for their tests.
+
+        Job steps are signalled directly, and all batch jobs are cancelled with as few scancel commands as possible,
+        restricted to the current user's jobs.
+
+        Args:
+            jobs (List[BaseJob]): The jobs to be terminated.
+        """
+        job_ids: List[int] = []
+        for job in jobs:
+            if isinstance(job, SlurmJobStep):
+                await self.kill_job(job)
+                continue
+            job_ids.append(cast(SlurmJob, job).id)
+            iteration, pipelined_job = self.pipelined_jobs.pop(job.test, (None, None))
+            if pipelined_job is not None:
+                job_ids.append(pipelined_job.id)
+                self.record_job_event("pipeline_cancelled", pipelined_job, iteration=iteration)
+        if job_ids:
+            await self.slurm_system.scancel_jobs(job_ids, user=getpass.getuser())
@@ -15,10 +15,11 @@
 # limitations under the License.
 
 import logging
-from typing import cast
+import subprocess
+from typing import Any, Dict, List, Optional, cast
 
 from cloudai import BaseJob, BaseRunner, JobIdRetrievalError, System, Test, TestScenario
-from cloudai.util import CommandShell
+from cloudai.util import AsyncCommandShell, CommandShell
 
 from .standalone_job import StandaloneJob
 
@@ -31,7 +32,9 @@ class StandaloneRunner(BaseRunner):
     class, implementing the abstract methods to work with standalone jobs.
 
     Attributes
-        cmd_shell (CommandShell): An instance of CommandShell for executing system commands.
+        cmd_shell (CommandShell): An instance of CommandShell for launching test processes.
+        async_cmd_shell (AsyncCommandShell): An instance of AsyncCommandShell for querying and terminating processes.
+        processes (Dict[int, subprocess.Popen]): Processes launched by this runner, keyed by their PIDs.
         Inherits all other attributes from the BaseRunner class.
     """
 
@@ -40,6 +43,7 @@ class StandaloneRunner(BaseRunner):
         mode: str,
         system: System,
         test_scenario: TestScenario,
+        resume_path: Optional[str] = None,
     ):
         """
         Initialize the StandaloneRunner with a system object, test scenario, and monitor interval.
@@ -48,14 +52,19 @@ class StandaloneRunner(BaseRunner):
             mode (str): The operation mode ('run', 'dry-run').
             system (System): The system configuration.
             test_scenario (TestScenario): The test scenario to run.
+            resume_path (Optional[str]): Output directory of an interrupted run to resume, or None to start a new run.
         """
-        super().__init__(mode, system, test_scenario)
+        super().__init__(mode, system, test_scenario, resume_path)
         self.cmd_shell = CommandShell()
+        self.async_cmd_shell = AsyncCommandShell()
+        self.processes: Dict[int, subprocess.Popen] = {}
 
-    def _submit_test(self, test: Test) -> StandaloneJob:
+    async def _submit_test(self, test: Test) -> StandaloneJob:
         """
         Submit a test for execution on Standalone and returns a StandaloneJob.
 
+        The runner is woken up as soon as the test's process exits.
+
         Args:
             test (Test): The test to be executed.
 
@@ -67,9 +76,11 @@ class StandaloneRunner(BaseRunner):
         exec_cmd = test.gen_exec_command(job_output_path)
         logging.info(f"Executing command for test {test.section_name}: {exec_cmd}")
         job_id = 0
+        process = None
         if self.mode == "run":
-            pid = self.cmd_shell.execute(exec_cmd).pid
-            job_id = test.get_job_id(str(pid), "")
+            process = self.cmd_shell.execute(exec_cmd)
+            self.processes[process.pid] = process
+            job_id = test.get_job_id(str(process.pid), "")
             if job_id is None:
                 raise JobIdRetrievalError(
                     test_name=str(test.section_name),
@@ -78,9 +89,28 @@ class StandaloneRunner(BaseRunner):
                     stderr="",
                     message="Failed to retrieve job ID from command output.",
                 )
-        return StandaloneJob(job_id, test, job_output_path)
+        job = StandaloneJob(job_id, test, job_output_path)
+        if process is not None:
+            launched = process
+            self.wake_on(job, lambda: launched.poll() is not None)
+        return job
+
+    def recover_job(self, test: Test, entry: Dict[str, Any]) -> Optional[BaseJob]:
+        """
+        Rebuild a standalone job launched by an interrupted run from its journal entry.
+
+        The job's process is then checked by its PID.
+
+        Args:
+            test (Test): The test of the job.
+            entry (Dict[str, Any]): The journal entry recording the job's submission.
+
+        Returns:
+            Optional[BaseJob]: The job.
+        """
+        return StandaloneJob(entry["job_id"], test, entry["output_path"])
 
-    def is_job_running(self, job: BaseJob) -> bool:
+    async def is_job_running(self, job: BaseJob) -> bool:
         """
         Check if the specified job is currently running.
 
@@ -92,10 +122,12 @@ class StandaloneRunner(BaseRunner):
         """
         return True
 
-    def is_job_completed(self, job: BaseJob) -> bool:
+    async def is_job_completed(self, job: BaseJob) -> bool:
         """
         Check if a standalone job is completed.
 
+        Processes launched by this runner are polled directly, without forking a new command.
+
         Args:
             job (StandaloneJob): The job to check.
 
@@ -106,12 +138,16 @@ class StandaloneRunner(BaseRunner):
             return True
 
         s_job = cast(StandaloneJob, job)
+        process = self.processes.get(s_job.id)
+        if process is not None:
+            return process.poll() is not None
+
         command = f"ps -p {s_job.id}"
         logging.debug(f"Checking job status with command: {command}")
-        stdout = self.cmd_shell.execute(command).communicate()[0]
+        stdout, _ = await self.async_cmd_shell.execute(command)
         return str(s_job.id) not in stdout
 
-    def kill_job(self, job: BaseJob):
+    async def kill_job(self, job: BaseJob):
         """
         Terminate a standalone job.
 
@@ -121,4 +157,25 @@ class StandaloneRunner(BaseRunner):
         s_job = cast(StandaloneJob, job)
         cmd = f"kill -9 {s_job.id}"
         logging.info(f"Executing termination command for job {s_job.id}: {cmd}")
-        self.cmd_shell.execute(cmd)
+        await self.async_cmd_shell.execute(cmd)
+
+    async def kill_jobs(self, jobs: List[BaseJob]) -> None:
+        """
+        Terminate several standalone jobs.
+
+        Processes launched by this runner are killed directly, and the others with a single kill command.
+
+        Args:
+            jobs (List[BaseJob]): The jobs to be terminated.
+        """
+        pids = []
+        for job in jobs:
+            process = self.processes.get(cast(StandaloneJob, job).id)
+            if process is not None:
+                process.kill()
+            else:
+                pids.append(str(job.id))
+        if pids:
+            cmd = f"kill -9 {' '.join(pids)}"
+            logging.info(f"Executing termination command for {len(pids)} jobs: {cmd}")
+            await self.async_cmd_shell.execute(cmd)
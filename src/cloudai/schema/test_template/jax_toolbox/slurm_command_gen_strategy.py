@@ -25,6 +25,8 @@ from .slurm_install_strategy import JaxToolboxSlurmInstallStrategy
 class JaxToolboxSlurmCommandGenStrategy(SlurmCommandGenStrategy):
     """Command generation strategy for JaxToolbox tests on Slurm systems."""
 
+    SUPPORTS_JOB_ARRAYS = False
+
     def gen_exec_command(
         self,
         env_vars: Dict[str, str],
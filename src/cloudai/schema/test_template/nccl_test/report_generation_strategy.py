@@ -78,6 +78,10 @@ class NcclTestReportGenerationStrategy(ReportGenerationStrategy):
             self._generate_bokeh_report(test_name, df, directory_path, sol)
             self._generate_csv_report(df, directory_path)
 
+    def get_performance(self, directory_path: str) -> Optional[float]:
+        _, avg_bus_bw = self._parse_output(directory_path)
+        return avg_bus_bw
+
     def _parse_output(self, directory_path: str) -> Tuple[List[List[str]], Optional[float]]:
         """
         Extract data from 'stdout.txt' for report generation.
@@ -97,9 +101,9 @@ class NcclTestReportGenerationStrategy(ReportGenerationStrategy):
                     line = line.strip()
                     if re.match(r"^\d", line):
                         data.append(re.split(r"\s+", line))
-                content = file.read()
-                avg_bus_bw_match = re.search(r"Avg bus bandwidth\s+:\s+(\d+\.\d+)", content)
-                avg_bus_bw = float(avg_bus_bw_match.group(1)) if avg_bus_bw_match else None
+                    avg_bus_bw_match = re.search(r"Avg bus bandwidth\s+:\s+(\d+\.\d+)", line)
+                    if avg_bus_bw_match:
+                        avg_bus_bw = float(avg_bus_bw_match.group(1))
         return data, avg_bus_bw
 
     def _generate_bokeh_report(
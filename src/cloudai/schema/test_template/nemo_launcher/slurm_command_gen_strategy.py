@@ -30,6 +30,9 @@ class NeMoLauncherSlurmCommandGenStrategy(SlurmCommandGenStrategy):
         install_path (str): The installation path of CloudAI.
     """
 
+    SUBMITS_SBATCH_SCRIPT = False
+    SUPPORTS_JOB_ARRAYS = False
+
     def gen_exec_command(
         self,
         env_vars: Dict[str, str],
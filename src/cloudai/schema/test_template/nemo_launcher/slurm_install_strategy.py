@@ -215,6 +215,7 @@ class NeMoLauncherSlurmInstallStrategy(SlurmInstallStrategy):
         Returns:
             DatasetCheckResult: Result object containing success status and nodes without datasets.
         """
+        self.slurm_system.update()
         partition_nodes = self.slurm_system.get_partition_nodes(self.slurm_system.default_partition)
 
         idle_nodes = [node.name for node in partition_nodes if node.state == SlurmNodeState.IDLE]
@@ -14,11 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .hostlist import HostList
 from .slurm_node import SlurmNode, SlurmNodeState
+from .slurm_node_table import SlurmNodeTable
 from .slurm_system import SlurmSystem
+from .slurm_topology import SlurmTopology
 
 __all__ = [
+    "HostList",
     "SlurmNode",
     "SlurmNodeState",
+    "SlurmNodeTable",
     "SlurmSystem",
+    "SlurmTopology",
 ]
@@ -0,0 +1,359 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+HostKey = Tuple[str, int]
+HostRanges = Tuple[array, array]
+
+
+class HostList:
+    """
+    Set of host names kept as sorted ranges of host numbers, in the spirit of Slurm host lists like 'node-[001-064]'.
+
+    Host names are split into a prefix and a zero-padded number. The hosts sharing a prefix and a number width are
+    stored as disjoint, sorted ranges, with their start and end numbers in two arrays, so large node ranges are never
+    expanded into names unless iterated over. Host names without a trailing number are stored with a width of 0.
+
+    Attributes
+        ranges (Dict[Tuple[str, int], Tuple[array, array]]): Mapping of (prefix, number width) pairs to the start and
+            end numbers of the ranges of hosts.
+    """
+
+    NAME_PATTERN = re.compile(r"^(.*?)(\d+)$")
+
+    def __init__(self, ranges: Optional[Dict[HostKey, HostRanges]] = None) -> None:
+        """
+        Initialize a HostList from ranges of host numbers.
+
+        Args:
+            ranges (Optional[Dict[Tuple[str, int], Tuple[array, array]]]): Mapping of (prefix, number width) pairs to
+                the start and end numbers of disjoint, sorted and non-adjacent ranges of hosts. Empty if not provided.
+        """
+        self.ranges: Dict[HostKey, HostRanges] = {key: value for key, value in (ranges or {}).items() if value[0]}
+
+    @classmethod
+    def from_string(cls, host_list: str) -> "HostList":
+        """
+        Parse a Slurm host list like 'node-[001-004,010],login01'.
+
+        As in Slurm, the numbers of a range are zero-padded to the width of its first number.
+
+        Args:
+            host_list (str): The host list.
+
+        Returns:
+            HostList: The parsed host list.
+
+        Raises:
+            ValueError: If a bracketed range of the host list is malformed.
+        """
+        spans: Dict[HostKey, List[Tuple[int, int]]] = {}
+        for component in cls.split(host_list):
+            if "[" not in component:
+                key, number = cls.split_name(component)
+                spans.setdefault(key, []).append((number, number))
+                continue
+            match = re.fullmatch(r"([^\[\]]*)\[([\d,\-\s]+)\]", component)
+            if not match:
+                raise ValueError(f"Malformed host list '{component}'.")
+            prefix, numbers = match.groups()
+            for number_range in numbers.split(","):
+                first, _, last = number_range.strip().partition("-")
+                for width, start, end in cls._split_by_width(first, last or first):
+                    spans.setdefault((prefix, width), []).append((start, end))
+        return cls({key: _merge(key_spans) for key, key_spans in spans.items()})
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "HostList":
+        """
+        Build a HostList from host names.
+
+        Args:
+            names (Iterable[str]): The host names.
+
+        Returns:
+            HostList: The host list.
+        """
+        spans: Dict[HostKey, List[Tuple[int, int]]] = {}
+        for name in names:
+            key, number = cls.split_name(name)
+            spans.setdefault(key, []).append((number, number))
+        return cls({key: _merge(key_spans) for key, key_spans in spans.items()})
+
+    @staticmethod
+    def split(host_list: str) -> List[str]:
+        """
+        Split a host list into its comma-separated components, leaving the commas within brackets alone.
+
+        Args:
+            host_list (str): The host list.
+
+        Returns:
+            List[str]: The components, like 'node-[001-004,010]' or 'login01'.
+        """
+        host_list = host_list.strip()
+        if not host_list:
+            return []
+        return [component.strip() for component in re.split(r",\s*(?![^[]*\])", host_list) if component.strip()]
+
+    @classmethod
+    def split_name(cls, name: str) -> Tuple[HostKey, int]:
+        """
+        Split a host name into its prefix, number width and number.
+
+        Args:
+            name (str): The host name.
+
+        Returns:
+            Tuple[Tuple[str, int], int]: The (prefix, number width) pair and the number, with a width and number of 0
+                for names without a trailing number.
+        """
+        match = cls.NAME_PATTERN.match(name)
+        if not match:
+            return (name, 0), 0
+        prefix, digits = match.groups()
+        return (prefix, len(digits)), int(digits)
+
+    @staticmethod
+    def _split_by_width(first: str, last: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Split a range of host numbers into ranges of numbers rendered with the same width.
+
+        Args:
+            first (str): The first number of the range, whose width is the minimum width of the range's numbers.
+            last (str): The last number of the range.
+
+        Returns:
+            Iterator[Tuple[int, int, int]]: The width, start and end of each range.
+
+        Raises:
+            ValueError: If the range is malformed or decreasing.
+        """
+        if not first.isdigit() or not last.isdigit() or int(last) < int(first):
+            raise ValueError(f"Malformed host number range '{first}-{last}'.")
+        start, end, width = int(first), int(last), len(first)
+        while start <= end:
+            width = max(width, len(str(start)))
+            width_end = min(end, 10**width - 1)
+            yield width, start, width_end
+            start = width_end + 1
+
+    def __len__(self) -> int:
+        """Return the number of hosts."""
+        return sum(end - start + 1 for starts, ends in self.ranges.values() for start, end in zip(starts, ends))
+
+    def __bool__(self) -> bool:
+        """Return whether the host list has any host."""
+        return bool(self.ranges)
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a host name is part of the host list, without expanding its ranges."""
+        if not isinstance(name, str):
+            return False
+        key, number = self.split_name(name)
+        if key not in self.ranges:
+            return False
+        starts, ends = self.ranges[key]
+        index = bisect_right(starts, number) - 1
+        return index >= 0 and ends[index] >= number
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the host names lazily, by prefix, number width and number."""
+        for (prefix, width), (starts, ends) in sorted(self.ranges.items()):
+            for start, end in zip(starts, ends):
+                for number in range(start, end + 1):
+                    yield f"{prefix}{number:0{width}d}" if width else prefix
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two host lists hold the same hosts."""
+        if not isinstance(other, HostList):
+            return NotImplemented
+        return self.ranges == other.ranges
+
+    def __or__(self, other: "HostList") -> "HostList":
+        """Return the hosts of either host list."""
+        return self.union(other)
+
+    def __and__(self, other: "HostList") -> "HostList":
+        """Return the hosts of both host lists."""
+        return self.intersection(other)
+
+    def __sub__(self, other: "HostList") -> "HostList":
+        """Return the hosts of this host list missing from the other one."""
+        return self.difference(other)
+
+    def union(self, other: "HostList") -> "HostList":
+        """
+        Return the hosts of either host list.
+
+        Args:
+            other (HostList): The other host list.
+
+        Returns:
+            HostList: The union of the host lists.
+        """
+        ranges = dict(self.ranges)
+        for key, (starts, ends) in other.ranges.items():
+            if key in ranges:
+                ranges[key] = _merge([*zip(*ranges[key]), *zip(starts, ends)])
+            else:
+                ranges[key] = (starts, ends)
+        return HostList(ranges)
+
+    def intersection(self, other: "HostList") -> "HostList":
+        """
+        Return the hosts of both host lists.
+
+        Args:
+            other (HostList): The other host list.
+
+        Returns:
+            HostList: The intersection of the host lists.
+        """
+        return HostList(
+            {key: _intersect(value, other.ranges[key]) for key, value in self.ranges.items() if key in other.ranges}
+        )
+
+    def difference(self, other: "HostList") -> "HostList":
+        """
+        Return the hosts of this host list missing from the other one.
+
+        Args:
+            other (HostList): The other host list.
+
+        Returns:
+            HostList: The difference of the host lists.
+        """
+        return HostList(
+            {
+                key: _subtract(value, other.ranges[key]) if key in other.ranges else value
+                for key, value in self.ranges.items()
+            }
+        )
+
+    def __str__(self) -> str:
+        """
+        Format the host list the way Slurm does, like 'node-[001-004,010],login01'.
+
+        Ranges of a prefix that differ only in the width of their numbers are joined, like 'node[8-10]'.
+        """
+        spans_by_prefix: Dict[str, List[Tuple[int, int, int]]] = {}
+        for (prefix, width), (starts, ends) in self.ranges.items():
+            spans_by_prefix.setdefault(prefix, []).extend((start, end, width) for start, end in zip(starts, ends))
+
+        components = []
+        for prefix, spans in sorted(spans_by_prefix.items()):
+            items = []
+            joined: List[List[int]] = []
+            for start, end, width in sorted(spans):
+                if width == 0:
+                    components.append(prefix)
+                    continue
+                last = joined[-1] if joined else None
+                if last is not None and last[1] + 1 == start and max(last[2], len(str(start))) == width:
+                    last[1] = end
+                else:
+                    joined.append([start, end, width])
+            for start, end, width in joined:
+                items.append(f"{start:0{width}d}" if start == end else f"{start:0{width}d}-{end:0{width}d}")
+            if len(items) == 1 and "-" not in items[0]:
+                components.append(f"{prefix}{items[0]}")
+            elif items:
+                components.append(f"{prefix}[{','.join(items)}]")
+        return ",".join(components)
+
+    def __repr__(self) -> str:
+        """Return a representation of the host list."""
+        return f"HostList('{self}')"
+
+
+def _merge(spans: Iterable[Tuple[int, int]]) -> HostRanges:
+    """
+    Merge ranges of host numbers into disjoint, sorted and non-adjacent ranges.
+
+    Args:
+        spans (Iterable[Tuple[int, int]]): The start and end of each range, in any order.
+
+    Returns:
+        Tuple[array, array]: The start and end numbers of the merged ranges.
+    """
+    starts, ends = array("q"), array("q")
+    for start, end in sorted(spans):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _intersect(first: HostRanges, second: HostRanges) -> HostRanges:
+    """
+    Intersect two sets of disjoint, sorted ranges of host numbers.
+
+    Args:
+        first (Tuple[array, array]): The start and end numbers of the first ranges.
+        second (Tuple[array, array]): The start and end numbers of the second ranges.
+
+    Returns:
+        Tuple[array, array]: The start and end numbers of the ranges of numbers in both.
+    """
+    starts, ends = array("q"), array("q")
+    i = j = 0
+    while i < len(first[0]) and j < len(second[0]):
+        start, end = max(first[0][i], second[0][j]), min(first[1][i], second[1][j])
+        if start <= end:
+            starts.append(start)
+            ends.append(end)
+        if first[1][i] < second[1][j]:
+            i += 1
+        else:
+            j += 1
+    return starts, ends
+
+
+def _subtract(first: HostRanges, second: HostRanges) -> HostRanges:
+    """
+    Remove the numbers of a set of disjoint, sorted ranges of host numbers from another.
+
+    Args:
+        first (Tuple[array, array]): The start and end numbers of the ranges to remove numbers from.
+        second (Tuple[array, array]): The start and end numbers of the ranges of numbers to remove.
+
+    Returns:
+        Tuple[array, array]: The start and end numbers of the remaining ranges.
+    """
+    starts, ends = array("q"), array("q")
+    j = 0
+    for start, end in zip(*first):
+        while j < len(second[0]) and second[1][j] < start:
+            j += 1
+        k = j
+        while start <= end and k < len(second[0]) and second[0][k] <= end:
+            if second[0][k] > start:
+                starts.append(start)
+                ends.append(second[0][k] - 1)
+            start = max(start, second[1][k] + 1)
+            k += 1
+        if start <= end:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
@@ -15,6 +15,10 @@
 # limitations under the License.
 
 from enum import Enum
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .slurm_node_table import SlurmNodeTable
 
 
 class SlurmNodeState(Enum):
@@ -98,6 +102,8 @@ class SlurmNode:
     """
     Represents a Slurm compute node with detailed state and partition info.
 
+    A node bound to a SlurmNodeTable is a view over the table, reading and writing its state and user from it.
+
     Attributes
         name (str): The name of the node.
         partition (str): The partition to which the node belongs.
@@ -105,6 +111,8 @@ class SlurmNode:
         user (str): The name of the user currently using the node. Defaults to N/A if the node is not being used.
     """
 
+    __slots__ = ("name", "partition", "_state", "_user", "_table", "_row")
+
     def __init__(
         self,
         name: str,
@@ -114,8 +122,50 @@ class SlurmNode:
     ) -> None:
         self.name = name
         self.partition = partition
-        self.state = state
-        self.user = user
+        self._state = state
+        self._user = user
+        self._table: Optional["SlurmNodeTable"] = None
+        self._row = -1
+
+    def bind(self, table: "SlurmNodeTable", row: int) -> None:
+        """
+        Make the node a view over a row of a node table, moving its state and user to the table.
+
+        Args:
+            table (SlurmNodeTable): The node table.
+            row (int): The row of the node in the table.
+        """
+        state, user = self.state, self.user
+        self._table, self._row = table, row
+        self.state, self.user = state, user
+
+    @property
+    def state(self) -> SlurmNodeState:
+        """The current state of the node."""
+        if self._table is not None:
+            return self._table.get_state(self._row)
+        return self._state
+
+    @state.setter
+    def state(self, state: SlurmNodeState) -> None:
+        if self._table is not None:
+            self._table.set_state(self._row, state)
+        else:
+            self._state = state
+
+    @property
+    def user(self) -> str:
+        """The name of the user currently using the node."""
+        if self._table is not None:
+            return self._table.get_user(self._row)
+        return self._user
+
+    @user.setter
+    def user(self, user: str) -> None:
+        if self._table is not None:
+            self._table.set_user(self._row, user)
+        else:
+            self._user = user
 
     def allocatable(self, free_only: bool = True) -> bool:
         """
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from .slurm_node import SlurmNode, SlurmNodeState
+
+
+class SlurmNodeTable:
+    """
+    Columnar table of the states of Slurm nodes, for systems with tens of thousands of nodes.
+
+    Node states are stored as int8 codes, users as interned integer IDs and partition membership as a bitmask per node,
+    so filtering nodes by state, user or partition is a vectorised mask operation. SlurmNodes bound to the table read
+    and write their state and user from it.
+
+    Attributes
+        STATES (List[SlurmNodeState]): The node states, indexed by their code.
+        names (List[str]): The names of the nodes, indexed by their row.
+        rows (Dict[str, int]): Mapping of node names to their row.
+        states (np.ndarray): The state code of each node.
+        users (np.ndarray): The ID of the user of each node.
+        user_names (List[str]): The user names, indexed by their ID, with 'N/A' as ID 0.
+        partitions (np.ndarray): The bitmask of the partitions of each node.
+        partition_bits (Dict[str, int]): Mapping of partition names to their bit in the partition bitmasks.
+    """
+
+    STATES: List[SlurmNodeState] = list(SlurmNodeState)
+    STATE_CODES: Dict[SlurmNodeState, int] = {state: code for code, state in enumerate(STATES)}
+    MAX_PARTITIONS = 64
+
+    def __init__(self, names: Sequence[str]) -> None:
+        """
+        Initialize a table of nodes in an unknown state, without users nor partitions.
+
+        Args:
+            names (Sequence[str]): The names of the nodes.
+        """
+        self.names = list(names)
+        self.rows: Dict[str, int] = {name: row for row, name in enumerate(self.names)}
+        self.states = np.full(len(self.names), self.STATE_CODES[SlurmNodeState.UNKNOWN_STATE], dtype=np.int8)
+        self.users = np.zeros(len(self.names), dtype=np.int32)
+        self.user_names: List[str] = ["N/A"]
+        self._user_ids: Dict[str, int] = {"N/A": 0}
+        self.partitions = np.zeros(len(self.names), dtype=np.uint64)
+        self.partition_bits: Dict[str, int] = {}
+
+    @classmethod
+    def from_partitions(cls, partitions: Dict[str, List[SlurmNode]]) -> "SlurmNodeTable":
+        """
+        Build a table of the nodes of the given partitions and bind the nodes to it.
+
+        Args:
+            partitions (Dict[str, List[SlurmNode]]): Mapping of partition names to their nodes.
+
+        Returns:
+            SlurmNodeTable: The table.
+
+        Raises:
+            ValueError: If there are more than `MAX_PARTITIONS` partitions.
+        """
+        nodes: Dict[str, SlurmNode] = {}
+        for partition_nodes in partitions.values():
+            for node in partition_nodes:
+                nodes.setdefault(node.name, node)
+        table = cls(list(nodes))
+        for partition_name, partition_nodes in partitions.items():
+            table.add_to_partition(partition_name, table.get_rows(node.name for node in partition_nodes))
+        for node in nodes.values():
+            node.bind(table, table.rows[node.name])
+        return table
+
+    def get_rows(self, names: Iterable[str]) -> np.ndarray:
+        """
+        Return the rows of the given nodes.
+
+        Args:
+            names (Iterable[str]): The names of the nodes.
+
+        Returns:
+            np.ndarray: The rows of the nodes, in the order of the names.
+        """
+        return np.fromiter((self.rows[name] for name in names), dtype=np.int64)
+
+    def add_to_partition(self, partition_name: str, rows: np.ndarray) -> None:
+        """
+        Add nodes to a partition.
+
+        Args:
+            partition_name (str): The name of the partition.
+            rows (np.ndarray): The rows of the nodes.
+
+        Raises:
+            ValueError: If the partition would exceed `MAX_PARTITIONS` partitions.
+        """
+        if partition_name not in self.partition_bits:
+            if len(self.partition_bits) >= self.MAX_PARTITIONS:
+                raise ValueError(f"A node table supports at most {self.MAX_PARTITIONS} partitions.")
+            self.partition_bits[partition_name] = len(self.partition_bits)
+        self.partitions[rows] |= np.uint64(1 << self.partition_bits[partition_name])
+
+    def get_state(self, row: int) -> SlurmNodeState:
+        """
+        Return the state of a node.
+
+        Args:
+            row (int): The row of the node.
+
+        Returns:
+            SlurmNodeState: The state of the node.
+        """
+        return self.STATES[self.states[row]]
+
+    def set_state(self, row: int, state: SlurmNodeState) -> None:
+        """
+        Set the state of a node.
+
+        Args:
+            row (int): The row of the node.
+            state (SlurmNodeState): The state of the node.
+        """
+        self.states[row] = self.STATE_CODES[state]
+
+    def get_user(self, row: int) -> str:
+        """
+        Return the user of a node.
+
+        Args:
+            row (int): The row of the node.
+
+        Returns:
+            str: The name of the user of the node, or 'N/A'.
+        """
+        return self.user_names[self.users[row]]
+
+    def set_user(self, row: int, user: str) -> None:
+        """
+        Set the user of a node.
+
+        Args:
+            row (int): The row of the node.
+            user (str): The name of the user of the node, or 'N/A'.
+        """
+        self.users[row] = self.get_user_id(user)
+
+    def get_user_id(self, user: str) -> int:
+        """
+        Return the ID of a user, interning the user name if it is new.
+
+        Args:
+            user (str): The name of the user.
+
+        Returns:
+            int: The ID of the user.
+        """
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            user_id = self._user_ids[user] = len(self.user_names)
+            self.user_names.append(user)
+        return user_id
+
+    def update(self, rows: np.ndarray, states: np.ndarray, users: np.ndarray) -> None:
+        """
+        Set the states and users of several nodes at once.
+
+        Args:
+            rows (np.ndarray): The rows of the nodes.
+            states (np.ndarray): The state codes of the nodes.
+            users (np.ndarray): The user IDs of the nodes.
+        """
+        self.states[rows] = states
+        self.users[rows] = users
+
+    def in_states(self, states: Iterable[SlurmNodeState]) -> np.ndarray:
+        """
+        Return the mask of the nodes in any of the given states.
+
+        Args:
+            states (Iterable[SlurmNodeState]): The states.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows of the table.
+        """
+        return np.isin(self.states, [self.STATE_CODES[state] for state in states])
+
+    def in_partition(self, partition_name: str) -> np.ndarray:
+        """
+        Return the mask of the nodes of a partition.
+
+        Args:
+            partition_name (str): The name of the partition.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows of the table.
+        """
+        if partition_name not in self.partition_bits:
+            return np.zeros(len(self.names), dtype=bool)
+        return (self.partitions & np.uint64(1 << self.partition_bits[partition_name])) != 0
+
+    def used_by(self, user: str) -> np.ndarray:
+        """
+        Return the mask of the nodes used by a user.
+
+        Args:
+            user (str): The name of the user.
+
+        Returns:
+            np.ndarray: A boolean mask over the rows of the table.
+        """
+        if user not in self._user_ids:
+            return np.zeros(len(self.names), dtype=bool)
+        return self.users == self._user_ids[user]
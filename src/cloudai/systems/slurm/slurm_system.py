@@ -14,15 +14,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import getpass
 import logging
-import re
-from typing import Any, Dict, List, Optional, Tuple
+import shlex
+import subprocess
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
-from cloudai import System
-from cloudai.util import CommandShell
+import numpy as np
 
+from cloudai import NodeLedger, System, Test
+from cloudai.util import AsyncCommandShell, CommandShell
+
+from .hostlist import HostList
 from .slurm_node import SlurmNode, SlurmNodeState
+from .slurm_node_table import SlurmNodeTable
+from .slurm_topology import SlurmTopology
+
+SLURM_TERMINAL_JOB_STATES = {
+    "BOOT_FAIL",
+    "CANCELLED",
+    "COMPLETED",
+    "DEADLINE",
+    "FAILED",
+    "NODE_FAIL",
+    "OUT_OF_MEMORY",
+    "PREEMPTED",
+    "TIMEOUT",
+}
 
 
 class SlurmSystem(System):
@@ -42,24 +62,68 @@ class SlurmSystem(System):
         gpus_per_node (Optional[int]): Specifies the number of GPUs available per node.
         ntasks_per_node (Optional[int]): Specifies the number of tasks that can run concurrently on a single node.
         cache_docker_images_locally (bool): Whether to cache Docker images locally for the Slurm system.
+        native_dependencies (bool): Whether to express test scenario dependencies as native Slurm job dependencies
+            (sbatch --dependency) when possible, instead of enforcing them by polling.
+        job_arrays (bool): Whether to submit all iterations of a multi-iteration test at once as a Slurm job array.
+        job_array_max_running (Optional[int]): Maximum number of array tasks of a test allowed to run simultaneously,
+            or None for no limit.
+        persistent_allocation (bool): Whether to run a whole test scenario as job steps of a single Slurm allocation,
+            instead of submitting a batch job per test.
+        auto_time_limit (bool): Whether to add a time limit predicted from the runtimes of prior runs to the batch
+            scripts of tests without a configured time limit.
+        pipelined_iterations (bool): Whether to submit the next iteration of a multi-iteration test while the current
+            one runs, held back by an 'afterany' dependency.
+        monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+        max_monitor_interval (int): Longest interval in seconds for monitoring jobs.
+        node_state_ttl (float): Longest time in seconds a snapshot of node states is reused by `update`, or 0 to query
+            the node states on every update.
+        columnar_node_states (bool): Whether to keep node states in a columnar node table, for very large clusters.
+        topology (Optional[SlurmTopology]): Network topology used to place the nodes of 'partition:group:num_nodes'
+            specifications.
+        query_topology (bool): Whether to read the network topology from 'scontrol show topology' when none is given.
+        node_ledger (bool): Whether to record the performance and failures of finished jobs per node in a ledger in
+            the output directory, and to leave the nodes it flags as slow or flaky out when nodes are selected from a
+            group.
         groups (Dict[str, Dict[str, List[SlurmNode]]]): Nested mapping where the key is the partition name and the
             value is another dictionary with group names as keys and lists of SlurmNodes as values, representing the
             group composition within each partition.
+        node_index (Dict[str, SlurmNode]): Mapping of node names to SlurmNodes, for constant time node lookups.
+        partition_node_names (Dict[str, Set[str]]): Mapping of partition names to the names of their nodes.
+        node_table (Optional[SlurmNodeTable]): Columnar table the nodes are bound to with `columnar_node_states`.
         global_env_vars (Optional[Dict[str, Any]]): Dictionary containing additional configuration settings for the
             system.
         cmd_shell (CommandShell): An instance of CommandShell for executing system commands.
+        async_cmd_shell (AsyncCommandShell): An instance of AsyncCommandShell for job queries and cancellations issued
+            from the runner's event loop.
+        excluded_nodes (Set[str]): Names of nodes that failed jobs ran on, left out when nodes are selected from a
+            group.
+        job_state_max_age (float): Longest time in seconds a snapshot of job states is reused to answer job state
+            queries of test scenarios run together, or 0 to query the states of the requested jobs every time.
+        watched_job_ids (Set[int]): IDs of the jobs included in shared job state snapshots until they leave the queue.
     """
 
+    SLURM_COMMAND_TIMEOUT = 60
+    SCANCEL_MAX_COMMAND_LENGTH = 65536
+    SINFO_FORMAT = "%N|%P|%T"
+
     def update(self) -> None:
         """
         Update the system object for a SLURM system.
 
         This method updates the system object by querying the current state of each node using the 'sinfo' and 'squeue'
         commands, and correlating this information to determine the state of each node and the user running jobs on
-        each node.
+        each node. The node states are only queried if the last snapshot is older than `node_state_ttl` seconds or
+        was invalidated.
         """
+        if self._node_states_time is not None and time.monotonic() - self._node_states_time < self.node_state_ttl:
+            logging.debug(f"Reusing the node states of {self.name} taken less than {self.node_state_ttl}s ago.")
+            return
         self.update_node_states()
 
+    def invalidate_node_states(self) -> None:
+        """Make the next update query the node states, after the node states are known to have changed."""
+        self._node_states_time = None
+
     @classmethod
     def parse_node_list(cls, node_list: str) -> List[str]:
         """
@@ -71,32 +135,9 @@ class SlurmSystem(System):
         Returns:
             List[str]: A flat list of expanded node names with preserved zeroes.
         """
-        node_list = node_list.strip()
         nodes = []
-        if not node_list:
-            return []
-
-        components = re.split(r",\s*(?![^[]*\])", node_list)
-        for component in components:
-            if "[" not in component:
-                nodes.append(component)
-            else:
-                header, node_number = component.split("[")
-                node_number = node_number.replace("]", "")
-                ranges = node_number.split(",")
-                for r in ranges:
-                    if "-" in r:
-                        start_node, end_node = r.split("-")
-                        number_of_digits = len(end_node)
-                        nodes.extend(
-                            [
-                                f"{header}{str(i).zfill(number_of_digits)}"
-                                for i in range(int(start_node), int(end_node) + 1)
-                            ]
-                        )
-                    else:
-                        nodes.append(f"{header}{r}")
-
+        for component in HostList.split(node_list):
+            nodes.extend(HostList.from_string(component))
         return nodes
 
     @classmethod
@@ -113,68 +154,7 @@ class SlurmSystem(System):
         Returns:
             A string representing the condensed node list, with numerically adjacent nodes shown as ranges.
         """
-
-        def extract_parts(name: str) -> tuple:
-            """
-            Extract the prefix and numeric part of a node name, along with the length of the numeric part.
-
-            Zero-padding is used.
-
-            Args:
-                name: The node name to be parsed.
-
-            Returns:
-                A tuple containing the prefix (str), numeric part (int), and
-                the length of the numeric part (int).
-            """
-            match = re.match(r"^(.*?-)(\d+)$", name)
-            if not match:
-                raise ValueError(f"Cannot extract numeric part from '{name}'")
-            prefix, num = match.groups()
-            return prefix, int(num), len(num)
-
-        def format_range(lst: List[int], padding: int) -> List[str]:
-            """
-            Format a list of integers into string ranges, considering zero-padding.
-
-            Args:
-                lst: A sorted list of node numbers.
-                padding: The number of digits for zero-padding the node numbers.
-
-            Returns:
-                A list of formatted string ranges.
-            """
-            if not lst:
-                return []
-            lst.sort()
-            start = lst[0]
-            end = lst[0]
-            ranges = []
-            for num in lst[1:]:
-                if num == end + 1:
-                    end = num
-                else:
-                    range_str = f"{start:0{padding}d}-{end:0{padding}d}" if start != end else f"{start:0{padding}d}"
-                    ranges.append(range_str)
-                    start = end = num
-            range_str = f"{start:0{padding}d}-{end:0{padding}d}" if start != end else f"{start:0{padding}d}"
-            ranges.append(range_str)
-            return ranges
-
-        nodes_by_prefix = {}
-        for name in node_names:
-            prefix, num, length = extract_parts(name)
-            nodes_by_prefix.setdefault(prefix, {"nums": [], "padding": 0})
-            nodes_by_prefix[prefix]["nums"].append(num)
-            nodes_by_prefix[prefix]["padding"] = max(nodes_by_prefix[prefix]["padding"], length)
-
-        formatted_ranges = []
-        for prefix, details in nodes_by_prefix.items():
-            ranges = format_range(details["nums"], details["padding"])
-            range_str = f"[{','.join(ranges)}]" if ranges else ""
-            formatted_ranges.append(f"{prefix}{range_str}")
-
-        return ", ".join(formatted_ranges)
+        return str(HostList.from_names(node_names))
 
     def __init__(
         self,
@@ -189,8 +169,22 @@ class SlurmSystem(System):
         gpus_per_node: Optional[int] = None,
         ntasks_per_node: Optional[int] = None,
         cache_docker_images_locally: bool = False,
+        native_dependencies: bool = False,
+        job_arrays: bool = False,
+        job_array_max_running: Optional[int] = None,
+        persistent_allocation: bool = False,
+        auto_time_limit: bool = False,
+        pipelined_iterations: bool = False,
+        monitor_interval: int = 1,
+        max_monitor_interval: int = 30,
+        node_state_ttl: float = 10.0,
+        columnar_node_states: bool = False,
+        topology: Optional[SlurmTopology] = None,
+        query_topology: bool = False,
+        node_ledger: bool = False,
         groups: Optional[Dict[str, Dict[str, List[SlurmNode]]]] = None,
         global_env_vars: Optional[Dict[str, Any]] = None,
+        node_index: Optional[Dict[str, SlurmNode]] = None,
     ) -> None:
         """
         Initialize a SlurmSystem instance.
@@ -208,13 +202,39 @@ class SlurmSystem(System):
             gpus_per_node (Optional[int]): Specifies the number of GPUs available per node.
             ntasks_per_node (Optional[int]): Specifies the number of tasks that can run concurrently on a single node.
             cache_docker_images_locally (bool): Whether to cache Docker images locally for the Slurm system.
+            native_dependencies (bool): Whether to express test scenario dependencies as native Slurm job
+                dependencies when possible.
+            job_arrays (bool): Whether to submit all iterations of a multi-iteration test at once as a Slurm job array.
+            job_array_max_running (Optional[int]): Maximum number of array tasks of a test allowed to run
+                simultaneously, or None for no limit.
+            persistent_allocation (bool): Whether to run a whole test scenario as job steps of a single Slurm
+                allocation.
+            auto_time_limit (bool): Whether to add a time limit predicted from prior runs to the batch scripts of
+                tests without a configured time limit.
+            pipelined_iterations (bool): Whether to submit the next iteration of a multi-iteration test while the
+                current one runs.
+            monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+            max_monitor_interval (int): Longest interval in seconds for monitoring jobs, reached by backing off while
+                job states do not change.
+            node_state_ttl (float): Longest time in seconds a snapshot of node states is reused by `update`, or 0 to
+                query the node states on every update.
+            columnar_node_states (bool): Whether to keep node states in a columnar node table, for very large
+                clusters.
+            topology (Optional[SlurmTopology]): Network topology used to place the nodes of 'partition:group:num_nodes'
+                specifications.
+            query_topology (bool): Whether to read the network topology from 'scontrol show topology' when none is
+                given.
+            node_ledger (bool): Whether to record finished jobs per node in a ledger in the output directory and to
+                leave the nodes it flags as slow or flaky out of node selection.
             groups (Optional[Dict[str, Dict[str, List[SlurmNode]]]]): Nested mapping of group names to lists of
                 SlurmNodes within partitions, defining the group composition within each partition. Defaults to an
                 empty dictionary if not provided.
             global_env_vars (Optional[Dict[str, Any]]): Dictionary containing additional configuration settings for
                 the system.
+            node_index (Optional[Dict[str, SlurmNode]]): Mapping of node names to the SlurmNodes of the partitions.
+                Built from the partitions if not provided.
         """
-        super().__init__(name, "slurm", output_path)
+        super().__init__(name, "slurm", output_path, monitor_interval, max_monitor_interval)
         self.install_path = install_path
         self.default_partition = default_partition
         self.partitions = partitions
@@ -224,9 +244,36 @@ class SlurmSystem(System):
         self.gpus_per_node = gpus_per_node
         self.ntasks_per_node = ntasks_per_node
         self.cache_docker_images_locally = cache_docker_images_locally
+        self.native_dependencies = native_dependencies
+        self.job_arrays = job_arrays
+        self.job_array_max_running = job_array_max_running
+        self.persistent_allocation = persistent_allocation
+        self.auto_time_limit = auto_time_limit
+        self.pipelined_iterations = pipelined_iterations
+        self.node_state_ttl = node_state_ttl
+        self.columnar_node_states = columnar_node_states
+        self.topology = topology
+        self.query_topology = query_topology
+        self.node_ledger = node_ledger
+        self._ledger: Optional[NodeLedger] = None
+        self._flagged_nodes: Optional[Dict[str, str]] = None
+        self._ledger_updated = False
         self.groups = groups if groups is not None else {}
         self.global_env_vars = global_env_vars if global_env_vars is not None else {}
+        self.node_index: Dict[str, SlurmNode] = {}
+        self.node_table: Optional[SlurmNodeTable] = None
+        self.partition_node_names: Dict[str, Set[str]] = {}
+        self.index_nodes(node_index)
+        self._node_states_time: Optional[float] = None
         self.cmd_shell = CommandShell()
+        self.async_cmd_shell = AsyncCommandShell(timeout=self.SLURM_COMMAND_TIMEOUT)
+        self.excluded_nodes: Set[str] = set()
+        self.job_state_max_age = 0.0
+        self.watched_job_ids: Set[int] = set()
+        self._job_states: Dict[int, str] = {}
+        self._job_states_ids: Set[int] = set()
+        self._job_states_time = 0.0
+        self._job_states_query: Optional[asyncio.Task] = None
         logging.debug(f"{self.__class__.__name__} initialized")
 
     def __repr__(self) -> str:
@@ -247,6 +294,40 @@ class SlurmSystem(System):
                 parts.append(f"\t{partition_name:<10} {state.name:<7} {node_list_str}")
         return "\n".join(parts)
 
+    def index_nodes(self, node_index: Optional[Dict[str, SlurmNode]] = None) -> None:
+        """
+        Index the nodes of the partitions by name, to be called again whenever the partitions are modified.
+
+        With `columnar_node_states`, the nodes are also bound to a new node table.
+
+        Args:
+            node_index (Optional[Dict[str, SlurmNode]]): Mapping of node names to the SlurmNodes of the partitions, as
+                built while parsing the system configuration. Built from the partitions if not provided.
+        """
+        self.partition_node_names = {
+            partition_name: {node.name for node in nodes} for partition_name, nodes in self.partitions.items()
+        }
+        if node_index is None:
+            node_index = {}
+            for nodes in self.partitions.values():
+                for node in nodes:
+                    node_index.setdefault(node.name, node)
+        self.node_index = node_index
+        self.node_table = SlurmNodeTable.from_partitions(self.partitions) if self.columnar_node_states else None
+        self._group_rows: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def get_node(self, node_name: str) -> Optional[SlurmNode]:
+        """
+        Return the node with the given name.
+
+        Args:
+            node_name (str): The name of the node.
+
+        Returns:
+            Optional[SlurmNode]: The node, or None if it is not part of the system.
+        """
+        return self.node_index.get(node_name)
+
     def get_partition_names(self) -> List[str]:
         """Return a list of all partition names."""
         return list(self.partitions.keys())
@@ -334,18 +415,21 @@ class SlurmSystem(System):
         return [node.name for node in self.get_group_nodes(partition_name, group_name)]
 
     def get_available_nodes_from_group(
-        self, partition_name: str, group_name: str, number_of_nodes: int
+        self, partition_name: str, group_name: str, number_of_nodes: int, placement: Optional[str] = None
     ) -> List[SlurmNode]:
         """
         Retrieve a specific number of potentially available nodes from a group within a partition.
 
         Prioritizes nodes by their current state, preferring idle nodes first, then completing nodes, and finally
-        allocated nodes, while excluding nodes that are down and allocated nodes to the current user.
+        allocated nodes, while excluding nodes that are down, allocated nodes to the current user, and nodes excluded
+        after failed jobs. With a network topology, the nodes are then placed by their switches.
 
         Args:
             partition_name (str): The name of the partition.
             group_name (str): The name of the group.
             number_of_nodes (int): The number of nodes to retrieve.
+            placement (Optional[str]): How to place the nodes on the network topology, 'pack' or 'spread'. Defaults
+                to 'pack' when the system has a topology.
 
         Returns:
             List[SlurmNode]: Objects that are potentially available for use.
@@ -360,32 +444,26 @@ class SlurmSystem(System):
             raise ValueError(f"Group '{group_name}' not found in partition '{partition_name}'.")
 
         current_user = getpass.getuser()
-        self.update_node_states()
-
-        # Group nodes by their states
-        grouped_nodes = {
-            SlurmNodeState.IDLE: [],
-            SlurmNodeState.COMPLETING: [],
-            SlurmNodeState.ALLOCATED: [],
-        }
-
-        for node in self.groups[partition_name][group_name]:
-            if node.state in grouped_nodes:
-                # Exclude nodes allocated to the current user
-                if node.state == SlurmNodeState.ALLOCATED and node.user == current_user:
-                    continue
-                if node.state in grouped_nodes:
-                    grouped_nodes[node.state].append(node)
+        self.update()
+        topology = self.get_topology()
+        if topology is None and placement is not None:
+            logging.warning(f"Ignoring node placement '{placement}', since {self.name} has no network topology.")
+        grouped_nodes = self.group_nodes_by_state(
+            partition_name, group_name, current_user, None if topology is not None else number_of_nodes
+        )
 
         # Allocate nodes based on priority: idle, then completing, then allocated
         allocated_nodes = []
-        for state in [
-            SlurmNodeState.IDLE,
-            SlurmNodeState.COMPLETING,
-            SlurmNodeState.ALLOCATED,
-        ]:
-            while grouped_nodes[state] and len(allocated_nodes) < number_of_nodes:
-                allocated_nodes.append(grouped_nodes[state].pop(0))
+        if topology is not None:
+            allocated_nodes = topology.select(list(grouped_nodes.values()), number_of_nodes, placement or "pack")
+        else:
+            for state in [
+                SlurmNodeState.IDLE,
+                SlurmNodeState.COMPLETING,
+                SlurmNodeState.ALLOCATED,
+            ]:
+                while grouped_nodes[state] and len(allocated_nodes) < number_of_nodes:
+                    allocated_nodes.append(grouped_nodes[state].pop(0))
 
         if len(allocated_nodes) < number_of_nodes:
             raise ValueError(
@@ -405,6 +483,121 @@ class SlurmSystem(System):
 
         return allocated_nodes
 
+    def get_topology(self) -> Optional[SlurmTopology]:
+        """
+        Return the network topology of the system, reading it from 'scontrol show topology' once if configured so.
+
+        Returns
+            Optional[SlurmTopology]: The topology, or None if the system has none.
+        """
+        if self.topology is None and self.query_topology:
+            self.query_topology = False
+            stdout, _ = self.fetch_command_output("scontrol show topology")
+            if stdout.strip():
+                self.topology = SlurmTopology.from_string(stdout)
+            else:
+                logging.warning(f"No network topology reported by Slurm for {self.name}.")
+        return self.topology
+
+    def get_node_ledger(self) -> Optional[NodeLedger]:
+        """
+        Return the node ledger of the system, opening it in the output directory on first use.
+
+        Returns
+            Optional[NodeLedger]: The ledger, or None if the system does not keep one.
+        """
+        if self.node_ledger and self._ledger is None:
+            self._ledger = NodeLedger(self.output_path)
+        return self._ledger
+
+    def get_flagged_nodes(self) -> Dict[str, str]:
+        """
+        Return the nodes the node ledger flags as slow or flaky, reading the ledger again after new records.
+
+        Returns
+            Dict[str, str]: Mapping of flagged node names to the reason they are flagged, empty without a ledger.
+        """
+        ledger = self.get_node_ledger()
+        if ledger is None:
+            return {}
+        if self._flagged_nodes is None or self._ledger_updated:
+            flagged_nodes = ledger.get_flagged_nodes()
+            for node_name in sorted(flagged_nodes.keys() - (self._flagged_nodes or {}).keys()):
+                if node_name in self.node_index:
+                    logging.info(f"Skipping node {node_name} flagged in the node ledger: {flagged_nodes[node_name]}")
+            self._flagged_nodes = flagged_nodes
+            self._ledger_updated = False
+        return self._flagged_nodes
+
+    def record_job_nodes(
+        self, test: Test, job_id: int, nodes: Sequence[str], failed: bool, performance: Optional[float]
+    ) -> None:
+        """
+        Record a finished job on each of its nodes in the node ledger, if the system keeps one.
+
+        Args:
+            test (Test): The test of the job.
+            job_id (int): The ID of the job.
+            nodes (Sequence[str]): The nodes the job ran on.
+            failed (bool): Whether the job failed.
+            performance (Optional[float]): The job's performance, higher is better, or None if unknown.
+        """
+        ledger = self.get_node_ledger()
+        if ledger is not None:
+            ledger.record(test, job_id, nodes, failed, performance)
+            self._ledger_updated = True
+
+    def group_nodes_by_state(
+        self, partition_name: str, group_name: str, current_user: str, limit: Optional[int] = None
+    ) -> Dict[SlurmNodeState, List[SlurmNode]]:
+        """
+        Group the potentially available nodes of a group by their state, in the order of the group.
+
+        Nodes that are down, allocated to the current user, excluded after failed jobs, or flagged in the node ledger
+        are left out. With a node table, the nodes are filtered with vectorised mask operations.
+
+        Args:
+            partition_name (str): The name of the partition.
+            group_name (str): The name of the group.
+            current_user (str): The name of the current user.
+            limit (Optional[int]): Largest number of nodes needed from each state, or None for all nodes. Only
+                applied with a node table, where it avoids building lists of all the nodes of large groups.
+
+        Returns:
+            Dict[SlurmNodeState, List[SlurmNode]]: The idle, completing and allocated nodes of the group.
+        """
+        group_nodes = self.groups[partition_name][group_name]
+        states = [SlurmNodeState.IDLE, SlurmNodeState.COMPLETING, SlurmNodeState.ALLOCATED]
+        skipped_nodes = self.excluded_nodes.union(self.get_flagged_nodes())
+        table = self.node_table
+        if table is not None:
+            rows = self._group_rows.get((partition_name, group_name))
+            if rows is None or len(rows) != len(group_nodes):
+                rows = self._group_rows[(partition_name, group_name)] = table.get_rows(
+                    node.name for node in group_nodes
+                )
+            available = table.in_partition(partition_name) & table.in_states(states)
+            available &= ~(table.in_states([SlurmNodeState.ALLOCATED]) & table.used_by(current_user))
+            available[table.get_rows(name for name in skipped_nodes if name in table.rows)] = False
+            row_states, usable = table.states[rows], available[rows]
+            return {
+                state: [
+                    group_nodes[i] for i in np.flatnonzero(usable & (row_states == table.STATE_CODES[state]))[:limit]
+                ]
+                for state in states
+            }
+
+        grouped_nodes: Dict[SlurmNodeState, List[SlurmNode]] = {state: [] for state in states}
+        for node in group_nodes:
+            if node.name in skipped_nodes:
+                continue
+            if node.state in grouped_nodes:
+                # Exclude nodes allocated to the current user
+                if node.state == SlurmNodeState.ALLOCATED and node.user == current_user:
+                    continue
+                grouped_nodes[node.state].append(node)
+        return grouped_nodes
+
     def is_node_in_system(self, node_name: str) -> bool:
         """
         Check if a given node is part of the Slurm system.
@@ -415,16 +608,12 @@ class SlurmSystem(System):
         Returns:
             True if the node is part of the system, otherwise False.
         """
-        return any(any(node.name == node_name for node in nodes) for nodes in self.partitions.values())
+        return node_name in self.node_index
 
-    def is_job_running(self, job_id: int, retry_threshold: int = 3) -> bool:
+    async def is_job_running(self, job_id: int, retry_threshold: int = 3) -> bool:
         """
         Determine if a specified Slurm job is currently running by checking its presence and state in the job queue.
 
-        This method queries the Slurm job queue using 'squeue' to identify if the
-        job with the specified ID is running. It handles transient network or
-        system errors by retrying the query a limited number of times.
-
         Args:
             job_id (int): The ID of the job to check.
             retry_threshold (int): The maximum number of retry attempts for the
@@ -439,76 +628,323 @@ class SlurmSystem(System):
                           job's running status, or if the status cannot be
                           determined after the specified number of retries.
         """
-        retry_count = 0
-        command = f"squeue -j {job_id} --noheader --format=%T"
+        job_states = await self.get_job_states([job_id], retry_threshold)
+        return self.is_job_state_running(job_states.get(job_id))
 
-        while retry_count < retry_threshold:
-            logging.debug(f"Executing command to check job status: {command}")
-            stdout, stderr = self.cmd_shell.execute(command).communicate()
+    async def is_job_completed(self, job_id: int, retry_threshold: int = 3) -> bool:
+        """
+        Check if a Slurm job is completed by querying its status.
 
-            if "Socket timed out" in stderr or "slurm_load_jobs error" in stderr:
-                retry_count += 1
-                logging.warning(f"Transient error encountered. Retrying... " f"({retry_count}/{retry_threshold})")
-                continue
+        Args:
+            job_id (int): The ID of the job to check.
+            retry_threshold (int): Maximum number of retries for transient errors.
 
-            if stderr:
-                raise RuntimeError(f"Error checking job status: {stderr}")
+        Returns:
+            bool: True if the job is completed, False otherwise.
 
-            job_state = stdout.strip()
-            # If the job is listed with a "RUNNING" state, it's considered active
-            if job_state == "RUNNING":
-                return True
+        Raises:
+            RuntimeError: If unable to determine job status after retries, or if a non-retryable error is encountered.
+        """
+        job_states = await self.get_job_states([job_id], retry_threshold)
+        return self.is_job_state_completed(job_states.get(job_id))
 
-            # No need for further retries if we got a clear answer
-            break
+    def share_state(self, max_age: float) -> None:
+        """
+        Let the runners of several test scenarios run together share job state snapshots.
+
+        Args:
+            max_age (float): Longest time in seconds a snapshot of job states is reused.
+        """
+        self.job_state_max_age = max_age
 
-        if retry_count == retry_threshold:
-            raise RuntimeError("Failed to confirm job running status after " f"{retry_threshold} attempts.")
+    async def get_job_states(self, job_ids: List[int], retry_threshold: int = 3) -> Dict[int, str]:
+        """
+        Return the states of several Slurm jobs, from a shared snapshot when test scenarios are run together.
 
-        # Job is not active if not "RUNNING" or not found
-        return False
+        Shared snapshots cover the jobs of all runners with a single 'squeue' call. A snapshot is reused while it is
+        younger than the maximum age and covers the requested jobs, and runners asking while a snapshot is being taken
+        wait for it instead of querying Slurm again.
 
-    def is_job_completed(self, job_id: int, retry_threshold: int = 3) -> bool:
+        Args:
+            job_ids (List[int]): The IDs of the jobs to query.
+            retry_threshold (int): Maximum number of retries for transient errors.
+
+        Returns:
+            Dict[int, str]: A mapping of job IDs to their Slurm job states, omitting the jobs that have left the queue.
+
+        Raises:
+            RuntimeError: If unable to query job states after retries, or if a non-retryable error is encountered.
         """
-        Check if a Slurm job is completed by querying its status.
+        if not job_ids or self.job_state_max_age <= 0:
+            return await self.query_job_states(job_ids, retry_threshold)
+
+        requested = set(job_ids)
+        self.watched_job_ids |= requested
+        while time.time() - self._job_states_time > self.job_state_max_age or not requested <= self._job_states_ids:
+            if self._job_states_query is None:
+                self._job_states_query = asyncio.ensure_future(self._take_job_states_snapshot(retry_threshold))
+            await asyncio.shield(self._job_states_query)
+        return {job_id: state for job_id, state in self._job_states.items() if job_id in requested}
+
+    async def _take_job_states_snapshot(self, retry_threshold: int) -> None:
+        """
+        Query the states of all watched jobs at once, and stop watching the jobs that have left the queue.
 
-        Retries the query a specified number of times if certain errors are encountered.
+        Args:
+            retry_threshold (int): Maximum number of retries for transient errors.
+        """
+        try:
+            job_ids = sorted(self.watched_job_ids)
+            self._job_states = await self.query_job_states(job_ids, retry_threshold)
+            self._job_states_ids = set(job_ids)
+            self._job_states_time = time.time()
+            self.watched_job_ids -= self._job_states_ids - set(self._job_states)
+        finally:
+            self._job_states_query = None
+
+    async def query_job_states(self, job_ids: List[int], retry_threshold: int = 3) -> Dict[int, str]:
+        """
+        Query the states of several Slurm jobs with a single 'squeue' call.
+
+        Jobs that are no longer known to the Slurm controller are omitted from the returned mapping, which callers
+        should interpret as completed. Job arrays are reported under their base job ID, with the state of their most
+        active task.
 
         Args:
-            job_id (int): The ID of the job to check.
+            job_ids (List[int]): The IDs of the jobs to query.
             retry_threshold (int): Maximum number of retries for transient errors.
 
         Returns:
-            bool: True if the job is completed, False otherwise.
+            Dict[int, str]: A mapping of job IDs to their Slurm job states (e.g., 'PENDING', 'RUNNING').
 
         Raises:
-            RuntimeError: If unable to determine job status after retries, or if a non-retryable error is encountered.
+            RuntimeError: If unable to query job states after retries, or if a non-retryable error is encountered.
         """
+        if not job_ids:
+            return {}
+
+        job_id_list = ",".join(str(job_id) for job_id in job_ids)
+        command = f"squeue --jobs={job_id_list} --noheader --format='%F|%T'"
+
         retry_count = 0
         while retry_count < retry_threshold:
-            command = f"squeue -j {job_id}"
-            logging.debug(f"Checking job status with command: {command}")
-            stdout, stderr = self.cmd_shell.execute(command).communicate()
-            if "Socket timed out" in stderr:
+            logging.debug(f"Executing command to check job states: {command}")
+            try:
+                stdout, stderr = await self.async_cmd_shell.execute(command)
+            except subprocess.TimeoutExpired:
                 retry_count += 1
-                logging.warning(f"Retrying job status check (attempt {retry_count}/" f"{retry_threshold})")
+                logging.warning(f"Job state query timed out. Retrying... ({retry_count}/{retry_threshold})")
+                continue
+
+            if "Invalid job id specified" in stderr:
+                # None of the requested jobs is known to the controller anymore.
+                return {}
+
+            if "Socket timed out" in stderr or "slurm_load_jobs error" in stderr:
+                retry_count += 1
+                logging.warning(f"Transient error encountered. Retrying... ({retry_count}/{retry_threshold})")
                 continue
 
             if stderr:
                 raise RuntimeError(f"Error checking job status: {stderr}")
 
-            return str(job_id) not in stdout
+            return self.parse_job_states_output(stdout)
+
+        raise RuntimeError(f"Failed to query job states after {retry_threshold} attempts.")
+
+    def parse_job_states_output(self, squeue_output: str) -> Dict[int, str]:
+        """
+        Parse the output of 'squeue --format=%F|%T' into a mapping of job IDs to job states.
+
+        The tasks of a job array are listed on separate lines sharing the base job ID. They are merged into a single
+        entry, which is running if any task is running, otherwise active if any task has not finished yet.
 
-        raise RuntimeError("Failed to confirm job completion status after " f"{retry_threshold} attempts.")
+        Args:
+            squeue_output (str): The raw output from the squeue command.
 
-    def scancel(self, job_id: int) -> None:
+        Returns:
+            Dict[int, str]: A mapping of job IDs to their Slurm job states.
+        """
+        job_states = {}
+        for line in squeue_output.splitlines():
+            parts = line.strip().split("|")
+            if len(parts) != 2:
+                continue
+            job_id_str, state = parts
+            if not job_id_str.isdigit():
+                continue
+            job_id, state = int(job_id_str), state.strip()
+            current_state = job_states.get(job_id)
+            if current_state is None or self._job_state_rank(state) > self._job_state_rank(current_state):
+                job_states[job_id] = state
+        return job_states
+
+    @staticmethod
+    def _job_state_rank(job_state: str) -> int:
+        """
+        Rank a job state by activity, used to pick the state representing a job array.
+
+        Args:
+            job_state (str): The job state.
+
+        Returns:
+            int: 2 for running jobs, 1 for other unfinished jobs, 0 for finished jobs.
+        """
+        if job_state == "RUNNING":
+            return 2
+        return 0 if job_state in SLURM_TERMINAL_JOB_STATES else 1
+
+    @staticmethod
+    def is_job_state_running(job_state: Optional[str]) -> bool:
+        """
+        Check if a Slurm job state, as returned by `get_job_states`, denotes a running job.
+
+        Args:
+            job_state (Optional[str]): The job state, or None if the job is not in the queue.
+
+        Returns:
+            bool: True if the job is running, False otherwise.
+        """
+        return job_state == "RUNNING"
+
+    @staticmethod
+    def is_job_state_completed(job_state: Optional[str]) -> bool:
+        """
+        Check if a Slurm job state, as returned by `get_job_states`, denotes a job that has finished.
+
+        Args:
+            job_state (Optional[str]): The job state, or None if the job is not in the queue.
+
+        Returns:
+            bool: True if the job has left the queue or reached a terminal state, False otherwise.
+        """
+        return job_state is None or job_state in SLURM_TERMINAL_JOB_STATES
+
+    async def scancel(self, job_id: int) -> None:
         """
         Terminates a specified Slurm job by sending a cancellation command.
 
         Args:
             job_id (int): The ID of the job to cancel.
         """
-        self.cmd_shell.execute(f"scancel {job_id}")
+        await self.scancel_jobs([job_id])
+
+    async def scancel_jobs(self, job_ids: Sequence[int], user: Optional[str] = None) -> None:
+        """
+        Cancel several Slurm jobs at once, with as few scancel commands as the command line length allows.
+
+        Args:
+            job_ids (Sequence[int]): The IDs of the jobs to cancel.
+            user (Optional[str]): Only cancel the jobs of this user, guarding against job IDs reused by other users.
+        """
+        await asyncio.gather(*(self._run_scancel(command) for command in self.gen_scancel_commands(job_ids, user)))
+
+    def gen_scancel_commands(self, job_ids: Sequence[int], user: Optional[str] = None) -> List[str]:
+        """
+        Generate the scancel commands cancelling the given jobs, splitting the job IDs across commands.
+
+        Args:
+            job_ids (Sequence[int]): The IDs of the jobs to cancel.
+            user (Optional[str]): Only cancel the jobs of this user.
+
+        Returns:
+            List[str]: The scancel commands, each shorter than `SCANCEL_MAX_COMMAND_LENGTH`, or no command if there
+                are no job IDs.
+        """
+        prefix = "scancel"
+        if user:
+            prefix += f" --user={shlex.quote(user)}"
+
+        commands = []
+        command = prefix
+        for job_id in dict.fromkeys(job_ids):
+            if command != prefix and len(command) + len(str(job_id)) + 1 > self.SCANCEL_MAX_COMMAND_LENGTH:
+                commands.append(command)
+                command = prefix
+            command += f" {job_id}"
+        if command != prefix:
+            commands.append(command)
+        return commands
+
+    async def _run_scancel(self, command: str) -> None:
+        """
+        Run a scancel command, logging its errors.
+
+        Args:
+            command (str): The scancel command.
+        """
+        logging.debug(f"Executing command: {command}")
+        _, stderr = await self.async_cmd_shell.execute(command)
+        if stderr:
+            logging.error(f"Error executing command '{command}': {stderr}")
+
+    def gen_salloc_command(self, num_nodes: int, job_name: str) -> str:
+        """
+        Generate the command acquiring a Slurm allocation without starting a shell in it.
+
+        The command blocks until the allocation is granted, and reports the allocation's job ID on its output.
+
+        Args:
+            num_nodes (int): The number of nodes to allocate.
+            job_name (str): The name of the allocation.
+
+        Returns:
+            str: The salloc command.
+        """
+        command_parts = ["salloc", "--no-shell", f"--job-name={job_name}", f"--partition={self.default_partition}"]
+        command_parts.append(f"-N {num_nodes}")
+        if self.account:
+            command_parts.append(f"--account={self.account}")
+        if self.gpus_per_node:
+            command_parts.append(f"--gpus-per-node={self.gpus_per_node}")
+        if self.ntasks_per_node:
+            command_parts.append(f"--ntasks-per-node={self.ntasks_per_node}")
+        return " ".join(command_parts)
+
+    async def get_job_nodes(self, job_id: int) -> List[str]:
+        """
+        Retrieve the names of the nodes allocated to a Slurm job.
+
+        Args:
+            job_id (int): The ID of the job.
+
+        Returns:
+            List[str]: The names of the allocated nodes, in allocation order.
+
+        Raises:
+            RuntimeError: If the nodes of the job cannot be retrieved.
+        """
+        command = f"squeue --jobs={job_id} --noheader --format='%N'"
+        logging.debug(f"Executing command: {command}")
+        stdout, stderr = await self.async_cmd_shell.execute(command)
+        if stderr:
+            raise RuntimeError(f"Error retrieving the nodes of job {job_id}: {stderr}")
+        return self.parse_node_list(stdout.strip())
+
+    async def get_finished_job_nodes(self, job_id: int) -> List[str]:
+        """
+        Retrieve the names of the nodes a finished Slurm job ran on from the Slurm accounting database.
+
+        Args:
+            job_id (int): The ID of the job. For a job array, the nodes of all its tasks are returned.
+
+        Returns:
+            List[str]: The names of the nodes, without duplicates.
+
+        Raises:
+            RuntimeError: If the nodes of the job cannot be retrieved.
+        """
+        command = f"sacct --jobs={job_id} --allocations --noheader --parsable2 --format=NodeList"
+        logging.debug(f"Executing command: {command}")
+        stdout, stderr = await self.async_cmd_shell.execute(command)
+        if stderr:
+            raise RuntimeError(f"Error retrieving the nodes of job {job_id}: {stderr}")
+        hosts = HostList()
+        for line in stdout.splitlines():
+            node_list = line.strip()
+            if node_list and node_list != "None assigned":
+                hosts |= HostList.from_string(node_list)
+        return list(hosts)
 
     def update_node_states(self) -> None:
         """
@@ -522,6 +958,7 @@ class SlurmSystem(System):
         sinfo_output = self.get_sinfo()
         node_user_map = self.parse_squeue_output(squeue_output)
         self.parse_sinfo_output(sinfo_output, node_user_map)
+        self._node_states_time = time.monotonic()
 
     def get_squeue(self) -> str:
         """
@@ -535,12 +972,15 @@ class SlurmSystem(System):
 
     def get_sinfo(self) -> str:
         """
-        Fetch the output from the 'sinfo' command.
+        Fetch the state of every node from the 'sinfo' command.
+
+        The output has one 'node|partition|state' line per node and partition, whatever the user's SINFO_FORMAT, so
+        node lists are never truncated nor need to be expanded.
 
         Returns
             str: The stdout from the 'sinfo' command execution.
         """
-        sinfo_output, _ = self.fetch_command_output("sinfo")
+        sinfo_output, _ = self.fetch_command_output(f"sinfo --Node --noheader --format='{self.SINFO_FORMAT}'")
         return sinfo_output
 
     def fetch_command_output(self, command: str) -> Tuple[str, str]:
@@ -582,42 +1022,41 @@ class SlurmSystem(System):
 
                 node_list_part, user = parts[0], "|".join(parts[1:])
                 # Handle cases where multiple node groups or ranges are specified
-                for node in self.parse_node_list(node_list_part):
+                for node in HostList.from_string(node_list_part):
                     node_user_map[node] = user.strip()
 
         return node_user_map
 
     def parse_sinfo_output(self, sinfo_output: str, node_user_map: Dict[str, str]) -> None:
         """
-        Parse the output from the 'sinfo' command to update node states.
+        Parse the output from the 'sinfo' command to update node states, in a single pass over its lines.
 
         Args:
-            sinfo_output (str): The output from the sinfo command.
+            sinfo_output (str): The output from the sinfo command, with one 'node|partition|state' line per node and
+                partition.
             node_user_map (dict): A dictionary mapping node names to users.
         """
-        for line in sinfo_output.split("\n")[1:]:  # Skip the header line
-            if not line.strip():
+        table = self.node_table
+        state_enums: Dict[str, SlurmNodeState] = {}
+        rows, state_codes, user_ids = [], [], []
+        for line in sinfo_output.splitlines():
+            node_name, _, partition_state = line.strip().partition("|")
+            partition, _, state = partition_state.partition("|")
+            if not state or node_name not in self.partition_node_names.get(partition.rstrip("*"), ()):
                 continue
-            parts = line.split()
-            if len(parts) < 6:
+            state_enum = state_enums.get(state)
+            if state_enum is None:
+                state_enum = state_enums[state] = self.convert_state_to_enum(state)
+            if table is not None:
+                rows.append(table.rows[node_name])
+                state_codes.append(table.STATE_CODES[state_enum])
+                user_ids.append(table.get_user_id(node_user_map.get(node_name, "N/A")))
                 continue
-            partition, _, _, _, state, nodelist = parts[:6]
-            partition = partition.rstrip("*")
-            node_names = self.parse_node_list(nodelist)
-
-            # Convert state to enum, handling states with suffixes
-            state_enum = self.convert_state_to_enum(state)
-
-            for node_name in node_names:
-                # Find the partition and node to update the state
-                for part_name, nodes in self.partitions.items():
-                    if part_name != partition:
-                        continue
-                    for node in nodes:
-                        if node.name == node_name:
-                            node.state = state_enum
-                            node.user = node_user_map.get(node_name, "N/A")
-                            break
+            node = self.node_index[node_name]
+            node.state = state_enum
+            node.user = node_user_map.get(node_name, "N/A")
+        if table is not None:
+            table.update(np.array(rows, dtype=np.int64), np.array(state_codes, dtype=np.int8), np.array(user_ids))
 
     def convert_state_to_enum(self, state_str: str) -> SlurmNodeState:
         """
@@ -686,7 +1125,8 @@ class SlurmSystem(System):
         Args:
             nodes (List[str]): A list containing node names or specifications. Specifications should follow
                 "partition:group:num_nodes", where "partition" is the partition name, "group" is a group within that
-                partition, and "num_nodes" is the number of nodes requested. Node ranges should be specified with
+                partition, and "num_nodes" is the number of nodes requested. An optional fourth field, 'pack' or
+                'spread', sets how the nodes are placed on the network topology. Node ranges should be specified with
                 square brackets and dashes, e.g., "node[01-03]" for "node01", "node02", "node03".
 
         Returns:
@@ -701,20 +1141,41 @@ class SlurmSystem(System):
         for node_spec in nodes:
             if ":" in node_spec:
                 parts = node_spec.split(":")
-                if len(parts) != 3:
-                    raise ValueError("Format should be partition:group:num_nodes")
-                partition_name, group_name, num_nodes_str = parts
+                if len(parts) not in (3, 4):
+                    raise ValueError(
+                        "Format should be partition:group:num_nodes or partition:group:num_nodes:placement"
+                    )
+                partition_name, group_name, num_nodes_str = parts[:3]
                 num_nodes = int(num_nodes_str)
-                group_nodes = self.get_available_nodes_from_group(partition_name, group_name, num_nodes)
+                placement = parts[3] if len(parts) == 4 else None
+                group_nodes = self.get_available_nodes_from_group(partition_name, group_name, num_nodes, placement)
                 parsed_nodes += [node.name for node in group_nodes]
             else:
                 # Handle both individual node names and ranges
                 if self.is_node_in_system(node_spec) or "[" in node_spec:
-                    expanded_nodes = self.parse_node_list(node_spec)
-                    parsed_nodes += expanded_nodes
+                    parsed_nodes.extend(HostList.from_string(node_spec))
                 else:
                     raise ValueError(f"Node '{node_spec}' not found.")
 
         # Remove duplicates while preserving order
         parsed_nodes = list(dict.fromkeys(parsed_nodes))
         return parsed_nodes
+
+    def count_nodes(self, nodes: List[str]) -> int:
+        """
+        Count the nodes requested by a list of node specifications without resolving them against the system state.
+
+        Args:
+            nodes (List[str]): A list containing node names, node ranges, or "partition:group:num_nodes"
+                specifications, as accepted by `parse_nodes`.
+
+        Returns:
+            int: The number of requested nodes.
+        """
+        num_nodes = 0
+        for node_spec in nodes:
+            if ":" in node_spec:
+                num_nodes += int(node_spec.split(":")[2])
+            else:
+                num_nodes += len(HostList.from_string(node_spec))
+        return num_nodes
@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .hostlist import HostList
+from .slurm_node import SlurmNode
+
+
+class SlurmTopology:
+    """
+    Tree of network switches, as described by Slurm's topology/tree plugin, used to place the nodes of a test.
+
+    Attributes
+        PLACEMENTS (List[str]): The supported node placements. 'pack' selects nodes under as few switch hops as
+            possible, and 'spread' selects nodes round-robin across leaf switches.
+        switch_leaves (Dict[str, Set[str]]): Mapping of switch names to the leaf switches below them, or to
+            themselves for leaf switches.
+        switch_levels (Dict[str, int]): Mapping of switch names to their level, 0 for leaf switches.
+        node_leaves (Dict[str, str]): Mapping of node names to their leaf switch.
+    """
+
+    PLACEMENTS = ["pack", "spread"]
+
+    def __init__(self, switch_nodes: Dict[str, HostList], switch_children: Dict[str, List[str]]) -> None:
+        """
+        Initialize a SlurmTopology from the nodes of leaf switches and the children of upper level switches.
+
+        Args:
+            switch_nodes (Dict[str, HostList]): Mapping of leaf switch names to their nodes.
+            switch_children (Dict[str, List[str]]): Mapping of upper level switch names to the switches below them.
+
+        Raises:
+            ValueError: If a switch is below an unknown switch, or if switches form a cycle.
+        """
+        self.switch_leaves: Dict[str, Set[str]] = {}
+        self.switch_levels: Dict[str, int] = {}
+        self.node_leaves: Dict[str, str] = {}
+        for switch, nodes in switch_nodes.items():
+            self.switch_leaves[switch] = {switch}
+            self.switch_levels[switch] = 0
+            for node in nodes:
+                self.node_leaves.setdefault(node, switch)
+
+        def resolve(switch: str, path: Sequence[str]) -> None:
+            if switch in self.switch_levels:
+                return
+            if switch in path:
+                raise ValueError(f"Switch '{switch}' is part of a cycle.")
+            if switch not in switch_children:
+                raise ValueError(f"Unknown switch '{switch}' below switch '{path[-1]}'.")
+            leaves: Set[str] = set()
+            level = 0
+            for child in switch_children[switch]:
+                resolve(child, [*path, switch])
+                leaves |= self.switch_leaves[child]
+                level = max(level, self.switch_levels[child] + 1)
+            self.switch_leaves[switch] = leaves
+            self.switch_levels[switch] = level
+
+        for switch in switch_children:
+            resolve(switch, [])
+
+    @classmethod
+    def from_string(cls, topology: str) -> "SlurmTopology":
+        """
+        Parse a topology.conf file or the output of 'scontrol show topology'.
+
+        Lines look like 'SwitchName=leaf1 Nodes=node-[001-016]' or 'SwitchName=spine Switches=leaf[1-2]'. Other keys,
+        like 'Level' and 'LinkSpeed', and comments are ignored.
+
+        Args:
+            topology (str): The topology description.
+
+        Returns:
+            SlurmTopology: The parsed topology.
+
+        Raises:
+            ValueError: If a switch has no name, or has neither nodes nor switches below it.
+        """
+        switch_nodes: Dict[str, HostList] = {}
+        switch_children: Dict[str, List[str]] = {}
+        for line in topology.splitlines():
+            fields = dict(field.split("=", 1) for field in line.split("#", 1)[0].split() if "=" in field)
+            if not fields:
+                continue
+            switch = fields.get("SwitchName")
+            if not switch:
+                raise ValueError(f"Topology line without a SwitchName: '{line.strip()}'")
+            if fields.get("Nodes"):
+                switch_nodes[switch] = HostList.from_string(fields["Nodes"])
+            elif fields.get("Switches"):
+                switch_children[switch] = list(HostList.from_string(fields["Switches"]))
+            else:
+                raise ValueError(f"Switch '{switch}' has neither nodes nor switches below it.")
+        return cls(switch_nodes, switch_children)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, List[str]]]) -> "SlurmTopology":
+        """
+        Build a SlurmTopology from the 'topology' table of a system configuration.
+
+        Args:
+            data (Dict[str, Dict[str, List[str]]]): Mapping of switch names to a table with either a 'nodes' list of
+                node names and ranges, or a 'switches' list of the switches below it.
+
+        Returns:
+            SlurmTopology: The topology.
+
+        Raises:
+            ValueError: If a switch has neither nodes nor switches below it.
+        """
+        switch_nodes: Dict[str, HostList] = {}
+        switch_children: Dict[str, List[str]] = {}
+        for switch, switch_data in data.items():
+            if switch_data.get("nodes"):
+                switch_nodes[switch] = HostList.from_string(",".join(switch_data["nodes"]))
+            elif switch_data.get("switches"):
+                switch_children[switch] = list(switch_data["switches"])
+            else:
+                raise ValueError(f"Switch '{switch}' has neither nodes nor switches below it.")
+        return cls(switch_nodes, switch_children)
+
+    def select(
+        self, candidate_tiers: Sequence[Sequence[SlurmNode]], number_of_nodes: int, placement: str
+    ) -> List[SlurmNode]:
+        """
+        Select nodes among tiers of candidates, placing them by their switches.
+
+        Candidates of a tier are only used when the better tiers do not have enough nodes, so the topology never makes a
+        test wait for busy nodes while enough free nodes are available. When no switch has enough candidates to pack
+        the nodes under it, they are packed across as few switches as possible.
+
+        Args:
+            candidate_tiers (Sequence[Sequence[SlurmNode]]): The candidate nodes, in tiers of decreasing preference,
+                like idle nodes before allocated nodes, and the preferred ones first within a tier.
+            number_of_nodes (int): The number of nodes to select.
+            placement (str): 'pack' to select nodes under the lowest switch with enough candidates, filling as few
+                leaf switches as possible, or 'spread' to select nodes round-robin across leaf switches.
+
+        Returns:
+            List[SlurmNode]: The selected nodes, or fewer nodes than requested if there are not enough candidates.
+
+        Raises:
+            ValueError: If the placement is not supported.
+        """
+        if placement not in self.PLACEMENTS:
+            raise ValueError(f"Unknown node placement '{placement}', expected one of {self.PLACEMENTS}.")
+        candidates: List[SlurmNode] = []
+        for tier in candidate_tiers:
+            candidates += tier
+            if len(candidates) < number_of_nodes:
+                continue
+            if placement == "spread":
+                return self._spread(candidates, number_of_nodes)
+            return self._pack(candidates, number_of_nodes) or self._pack_across(candidates, number_of_nodes)
+        return candidates[:number_of_nodes]
+
+    def _group_by_leaf(self, candidates: Sequence[SlurmNode]) -> Dict[Optional[str], List[SlurmNode]]:
+        """
+        Group candidates by their leaf switch, in the order of their preferred candidate.
+
+        Args:
+            candidates (Sequence[SlurmNode]): The candidate nodes, the preferred ones first.
+
+        Returns:
+            Dict[Optional[str], List[SlurmNode]]: Mapping of leaf switches, or None for nodes outside the topology, to
+                their candidates.
+        """
+        by_leaf: Dict[Optional[str], List[SlurmNode]] = {}
+        for node in candidates:
+            by_leaf.setdefault(self.node_leaves.get(node.name), []).append(node)
+        return by_leaf
+
+    def _pack(self, candidates: Sequence[SlurmNode], number_of_nodes: int) -> List[SlurmNode]:
+        """
+        Select nodes under the lowest level switch with enough candidates.
+
+        Among the switches of that level, the one whose selected nodes are the most preferred wins. Under the switch,
+        the leaf switches with the most candidates are filled first.
+
+        Args:
+            candidates (Sequence[SlurmNode]): The candidate nodes, the preferred ones first.
+            number_of_nodes (int): The number of nodes to select.
+
+        Returns:
+            List[SlurmNode]: The selected nodes, or an empty list if no switch has enough candidates.
+        """
+        by_leaf = self._group_by_leaf(candidates)
+        rank = {id(node): i for i, node in enumerate(candidates)}
+        best: List[SlurmNode] = []
+        best_key = None
+        for switch, switch_leaves in self.switch_leaves.items():
+            selected: List[SlurmNode] = []
+            leaves = [leaf_nodes for leaf, leaf_nodes in by_leaf.items() if leaf in switch_leaves]
+            for leaf_nodes in sorted(leaves, key=len, reverse=True):
+                selected += leaf_nodes[: number_of_nodes - len(selected)]
+            if len(selected) < number_of_nodes:
+                continue
+            key = (self.switch_levels[switch], sum(rank[id(node)] for node in selected), switch)
+            if best_key is None or key < best_key:
+                best, best_key = selected, key
+        return best
+
+    def _pack_across(self, candidates: Sequence[SlurmNode], number_of_nodes: int) -> List[SlurmNode]:
+        """
+        Select nodes across top level switches, when no single switch has enough candidates.
+
+        The top level switches with the most candidates are filled first, and under each of them the leaf switches
+        with the most candidates, so the nodes span as few switches as possible. Candidates outside the topology are
+        selected last.
+
+        Args:
+            candidates (Sequence[SlurmNode]): The candidate nodes, the preferred ones first.
+            number_of_nodes (int): The number of nodes to select.
+
+        Returns:
+            List[SlurmNode]: The selected nodes.
+        """
+        by_leaf = self._group_by_leaf(candidates)
+        leaf_roots: Dict[Optional[str], Optional[str]] = {}
+        for switch in sorted(self.switch_leaves, key=self.switch_levels.__getitem__):
+            for leaf in self.switch_leaves[switch]:
+                leaf_roots[leaf] = switch
+        root_sizes: Dict[Optional[str], int] = {}
+        for leaf, leaf_nodes in by_leaf.items():
+            root = leaf_roots.get(leaf)
+            root_sizes[root] = root_sizes.get(root, 0) + len(leaf_nodes)
+
+        def leaf_key(leaf: Optional[str]) -> Tuple[bool, int, str, int]:
+            root = leaf_roots.get(leaf)
+            return (leaf is None, -root_sizes[root], str(root), -len(by_leaf[leaf]))
+
+        selected: List[SlurmNode] = []
+        for leaf in sorted(by_leaf, key=leaf_key):
+            selected += by_leaf[leaf][: number_of_nodes - len(selected)]
+        return selected
+
+    def _spread(self, candidates: Sequence[SlurmNode], number_of_nodes: int) -> List[SlurmNode]:
+        """
+        Select nodes round-robin across leaf switches, starting with the leaf switch of the preferred candidate.
+
+        Args:
+            candidates (Sequence[SlurmNode]): The candidate nodes, the preferred ones first.
+            number_of_nodes (int): The number of nodes to select.
+
+        Returns:
+            List[SlurmNode]: The selected nodes.
+        """
+        leaves = list(self._group_by_leaf(candidates).values())
+        selected: List[SlurmNode] = []
+        depth = 0
+        while len(selected) < number_of_nodes and any(depth < len(leaf_nodes) for leaf_nodes in leaves):
+            for leaf_nodes in leaves:
+                if depth < len(leaf_nodes) and len(selected) < number_of_nodes:
+                    selected.append(leaf_nodes[depth])
+            depth += 1
+        return selected
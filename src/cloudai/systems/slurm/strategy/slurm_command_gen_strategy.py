@@ -20,6 +20,7 @@ from typing import Any, Dict, List
 
 from cloudai import CommandGenStrategy
 from cloudai.systems import SlurmSystem
+from cloudai.systems.slurm import HostList
 from cloudai.util.docker_image_cache_manager import DockerImageCacheManager
 
 
@@ -30,8 +31,16 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
     Attributes
         slurm_system (SlurmSystem): A casted version of the `system` attribute, which provides Slurm-specific
             properties and methods.
+        SUBMITS_SBATCH_SCRIPT (bool): Whether the generated execution command is a plain `sbatch <script>` command,
+            which lets the runner add sbatch options such as `--dependency` to it.
+        SUPPORTS_JOB_ARRAYS (bool): Whether the generated script can run all iterations of a test as a Slurm job array.
+            The output path only has to be used for the script and its logs, which then go to a subdirectory per array
+            task.
     """
 
+    SUBMITS_SBATCH_SCRIPT = True
+    SUPPORTS_JOB_ARRAYS = True
+
     def __init__(self, system: SlurmSystem, env_vars: Dict[str, Any], cmd_args: Dict[str, Any]) -> None:
         """
         Initialize a new SlurmCommandGenStrategy instance.
@@ -109,7 +118,7 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
 
         parsed_nodes = self.slurm_system.parse_nodes(nodes)
         num_nodes = len(parsed_nodes) if parsed_nodes else num_nodes
-        node_list_str = ",".join(parsed_nodes) if parsed_nodes else ""
+        node_list_str = str(HostList.from_names(parsed_nodes))
 
         slurm_args = {
             "job_name": job_name,
@@ -127,6 +136,8 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
             slurm_args["ntasks_per_node"] = self.slurm_system.ntasks_per_node
         if "time_limit" in cmd_args:
             slurm_args["time_limit"] = cmd_args["time_limit"]
+        if "job_array" in cmd_args:
+            slurm_args["job_array"] = cmd_args["job_array"]
 
         return slurm_args
 
@@ -153,10 +164,35 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
     ) -> List[str]:
         return []
 
+    def _gen_output_directives(self, args: Dict[str, Any], output_path: str) -> List[str]:
+        """
+        Generate the sbatch directives for the job array and the job's log files.
+
+        Args:
+            args (Dict[str, Any]): Arguments including job settings.
+            output_path (str): Output directory for script and logs.
+
+        Returns:
+            List[str]: The sbatch directives.
+        """
+        directives = []
+        log_path = output_path
+        if "job_array" in args:
+            directives.append(f"#SBATCH --array={args['job_array']}")
+            log_path = os.path.join(output_path, "%a")
+        if "output" not in args:
+            directives.append(f"#SBATCH --output={os.path.join(log_path, 'stdout.txt')}")
+        if "error" not in args:
+            directives.append(f"#SBATCH --error={os.path.join(log_path, 'stderr.txt')}")
+        return directives
+
     def _write_sbatch_script(self, args: Dict[str, Any], env_vars_str: str, srun_command: str, output_path: str) -> str:
         """
         Write the batch script for Slurm submission and returns the sbatch command.
 
+        For a job array, the logs of each array task are written to a subdirectory of the output path named after the
+        array task index.
+
         Args:
             args (Dict[str, Any]): Arguments including job settings.
             env_vars_str (str): Environment variables.
@@ -172,10 +208,7 @@ class SlurmCommandGenStrategy(CommandGenStrategy):
             f"#SBATCH -N {args['num_nodes']}",
         ]
 
-        if "output" not in args:
-            batch_script_content.append(f"#SBATCH --output={os.path.join(output_path, 'stdout.txt')}")
-        if "error" not in args:
-            batch_script_content.append(f"#SBATCH --error={os.path.join(output_path, 'stderr.txt')}")
+        batch_script_content.extend(self._gen_output_directives(args, output_path))
         if args["partition"]:
             batch_script_content.append(f"#SBATCH --partition={args['partition']}")
         if args["node_list_str"]:
@@ -27,17 +27,22 @@ class StandaloneSystem(System):
     Attributes
         name (str): Name of the standalone system.
         output_path (str): Path to the output directory.
+        monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+        max_monitor_interval (int): Longest interval in seconds for monitoring jobs.
     """
 
-    def __init__(self, name: str, output_path: str) -> None:
+    def __init__(self, name: str, output_path: str, monitor_interval: int = 1, max_monitor_interval: int = 30) -> None:
         """
         Initialize a StandaloneSystem instance.
 
         Args:
             name (str): Name of the standalone system.
             output_path (str): Path to the output directory.
+            monitor_interval (int): Shortest interval in seconds for monitoring jobs.
+            max_monitor_interval (int): Longest interval in seconds for monitoring jobs, reached by backing off while
+                job states do not change.
         """
-        super().__init__(name, "standalone", output_path)
+        super().__init__(name, "standalone", output_path, monitor_interval, max_monitor_interval)
 
     def __repr__(self) -> str:
         """
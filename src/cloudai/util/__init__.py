@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .async_command_shell import AsyncCommandShell
 from .command_shell import CommandShell
 
 __all__ = [
+    "AsyncCommandShell",
     "CommandShell",
 ]
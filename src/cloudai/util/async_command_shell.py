@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import subprocess
+from typing import Optional, Tuple
+
+
+class AsyncCommandShell:
+    """
+    A class responsible for executing shell commands asynchronously using a specified shell executable.
+
+    Commands are run as asyncio subprocesses, so awaiting them does not block the event loop. The number of commands
+    running at the same time is bounded, which keeps a burst of submissions or queries from overwhelming the
+    scheduler.
+
+    Attributes
+        executable (str): The path to the shell executable used for running commands.
+        max_concurrency (int): The maximum number of commands executed at the same time.
+        timeout (Optional[float]): Default timeout in seconds for a command, or None to wait indefinitely.
+    """
+
+    def __init__(self, executable: str = "/bin/bash", max_concurrency: int = 16, timeout: Optional[float] = None):
+        """
+        Initialize the AsyncCommandShell with a shell executable.
+
+        Args:
+            executable (str): The shell executable path. Defaults to "/bin/bash".
+            max_concurrency (int): The maximum number of commands executed at the same time. Defaults to 16.
+            timeout (Optional[float]): Default timeout in seconds for a command. Defaults to None.
+
+        Raises:
+            FileNotFoundError: If the specified executable does not exist.
+            ValueError: If max_concurrency is not a positive integer.
+        """
+        if not os.path.exists(executable):
+            raise FileNotFoundError(f"Executable '{executable}' not found.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.executable = executable
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Return the semaphore bounding concurrent commands, bound to the running event loop.
+
+        Returns
+            asyncio.Semaphore: The semaphore for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def execute(self, command: str, timeout: Optional[float] = None) -> Tuple[str, str]:
+        """
+        Execute a shell command and wait for it to finish without blocking the event loop.
+
+        Args:
+            command (str): The command to be executed.
+            timeout (Optional[float]): Timeout in seconds for this command. Defaults to the shell's timeout.
+
+        Returns:
+            Tuple[str, str]: The stdout and stderr of the command.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish within the timeout. The command is killed.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        async with self._get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                self.executable,
+                "-c",
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError as e:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(command, timeout or 0) from e
+
+        return stdout.decode(), stderr.decode()
@@ -65,6 +65,17 @@ def test_slurm(tmp_path: Path, scenario: Dict):
     assert log_file_path.exists(), f"Log file {log_file_path} was not created"
 
 
+def test_max_in_flight_limits_single_scenario(tmp_path: Path):
+    parser = Parser(Path("conf/system/example_slurm_cluster.toml"), Path("conf/test_template"))
+    system, tests, test_scenario = parser.parse(Path("conf/test"), SLURM_TEST_SCENARIOS[0]["path"])
+    system.output_path = str(tmp_path)
+    assert test_scenario is not None
+
+    handle_dry_run_and_run("dry-run", system, tests, test_scenario, max_in_flight=1)
+
+    assert test_scenario.max_in_flight == 1
+
+
 @pytest.fixture
 def slurm_system() -> SlurmSystem:
     nodes = [SlurmNode(name=f"node-0{i}", partition="main", state=SlurmNodeState.UNKNOWN_STATE) for i in range(33, 65)]
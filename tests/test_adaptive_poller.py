@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+
+import pytest
+from cloudai._core.adaptive_poller import AdaptivePoller
+
+
+def test_backoff_and_activity():
+    poller = AdaptivePoller(1, 10)
+
+    assert [poller.next_interval([], 0) for _ in range(6)] == [1, 2, 4, 8, 10, 10]
+
+    poller.on_activity()
+    assert poller.next_interval([], 0) == 1
+
+
+def test_tick_at_predicted_end():
+    poller = AdaptivePoller(1, 60)
+    poller.interval = 32
+
+    assert poller.next_interval([90, 105, 200], now=100) == 5
+    assert poller.next_interval([], now=105) == 2
+    assert poller.next_interval([100.5], now=100) == 1
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        AdaptivePoller(-1, 10)
+
+
+def test_notify_wakes_up_wait():
+    poller = AdaptivePoller(1, 10)
+
+    async def wait_and_notify():
+        waiter = asyncio.create_task(poller.wait(10))
+        await asyncio.sleep(0)
+        poller.notify()
+        woken = await waiter
+        return woken, await poller.wait(0.01)
+
+    assert asyncio.run(wait_and_notify()) == (True, False)
+
+
+def test_notify_before_wait():
+    poller = AdaptivePoller(1, 10)
+    poller.notify()
+
+    assert asyncio.run(poller.wait(10))
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import subprocess
+import time
+
+import pytest
+from cloudai.util import AsyncCommandShell
+
+
+def test_execute_returns_output():
+    shell = AsyncCommandShell()
+    stdout, stderr = asyncio.run(shell.execute("echo out; echo err >&2"))
+    assert stdout == "out\n"
+    assert stderr == "err\n"
+
+
+def test_execute_timeout_kills_command():
+    shell = AsyncCommandShell(timeout=0.1)
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(shell.execute("sleep 10"))
+
+
+def test_execute_runs_commands_concurrently():
+    shell = AsyncCommandShell(max_concurrency=4)
+
+    async def run_all():
+        return await asyncio.gather(*(shell.execute("sleep 0.5") for _ in range(4)))
+
+    start = time.monotonic()
+    asyncio.run(run_all())
+    assert time.monotonic() - start < 1.5
+
+
+def test_execute_bounds_concurrency():
+    shell = AsyncCommandShell(max_concurrency=1)
+
+    async def run_all():
+        return await asyncio.gather(*(shell.execute("sleep 0.3") for _ in range(3)))
+
+    start = time.monotonic()
+    asyncio.run(run_all())
+    assert time.monotonic() - start >= 0.9
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncCommandShell(max_concurrency=0)
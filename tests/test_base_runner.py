@@ -14,26 +14,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from cloudai import BaseJob, BaseRunner, System, TestScenario
+from cloudai import BaseJob, BaseRunner, FailurePolicy, JobStatusResult, System, Test, TestScenario
+from cloudai._core.run_journal import RunJournal
+from cloudai._core.runtime_model import RuntimeModel
+from cloudai._core.test import TestDependency
 
 
 class MockRunner(BaseRunner):
-    def _submit_test(self, test):
+    async def _submit_test(self, test):
         job_id = 1
         output_path = self.get_job_output_path(test)
         return BaseJob(job_id, test, output_path)
 
-    def is_job_running(self, job):
+    async def is_job_running(self, job):
         return False
 
-    def is_job_completed(self, job):
+    async def is_job_completed(self, job):
         return True
 
-    def kill_job(self, job):
+    async def kill_job(self, job):
         pass
 
 
@@ -57,6 +63,7 @@ def test_setup_output_directory(mock_datetime_now, tmp_path):
     mock_system = MagicMock(spec=System)
     mock_system.output_path = str(base_output_path)
     mock_system.monitor_interval = 5
+    mock_system.max_monitor_interval = 5
 
     runner = MockRunner("run", mock_system, mock_test_scenario)
 
@@ -79,8 +86,344 @@ def test_setup_output_directory_existing_base_path(mock_datetime_now, tmp_path):
     mock_system = MagicMock(spec=System)
     mock_system.output_path = str(base_output_path)
     mock_system.monitor_interval = 5
+    mock_system.max_monitor_interval = 5
 
     runner = MockRunner("run", mock_system, mock_test_scenario)
 
     assert expected_path.exists()
     assert runner.output_path == str(expected_path)
+
+
+@pytest.fixture
+def runner(tmp_path) -> MockRunner:
+    mock_test_scenario = MagicMock(spec=TestScenario)
+    mock_test_scenario.name = "test_scenario"
+    mock_test_scenario.tests = []
+    mock_test_scenario.max_in_flight = None
+    mock_test_scenario.max_in_flight_per_group = {}
+    mock_test_scenario.get_dependents.return_value = []
+    mock_test_scenario.get_critical_path_length.return_value = 1
+    mock_system = MagicMock(spec=System)
+    mock_system.output_path = str(tmp_path)
+    mock_system.monitor_interval = 0
+    mock_system.max_monitor_interval = 0
+    return MockRunner("run", mock_system, mock_test_scenario)
+
+
+def test_delayed_submit_test_does_not_block(runner: MockRunner):
+    test = MagicMock(section_name="Tests.1")
+
+    async def schedule():
+        task = await runner.delayed_submit_test(test, 3600)
+        assert task is not None
+        assert not task.done()
+        assert test in runner.pending_submissions
+        assert test not in runner.test_to_job_map
+
+        assert await runner.delayed_submit_test(test, 3600) is None, "test must not be scheduled twice"
+
+        runner.cancel_scheduled_tasks()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert not runner.pending_submissions
+
+    asyncio.run(asyncio.wait_for(schedule(), timeout=5))
+
+
+def test_delayed_submit_test_submits_after_delay(runner: MockRunner):
+    test = MagicMock(section_name="Tests.1")
+    test.current_iteration = 0
+
+    async def schedule():
+        task = await runner.delayed_submit_test(test, 0)
+        assert task is not None
+        await task
+        runner.reap_scheduled_tasks()
+
+    asyncio.run(asyncio.wait_for(schedule(), timeout=5))
+
+    assert test in runner.test_to_job_map
+    assert not runner.pending_submissions
+    assert not runner.scheduled_tasks
+
+
+def test_delayed_kill_job_skips_finished_job(runner: MockRunner):
+    job = BaseJob(1, MagicMock(), "")
+
+    async def schedule():
+        with patch.object(runner, "kill_job") as mock_kill_job:
+            await (await runner.delayed_kill_job(job, 0))
+        mock_kill_job.assert_not_called()
+
+    asyncio.run(asyncio.wait_for(schedule(), timeout=5))
+    assert not job.terminated_by_dependency
+
+
+def test_start_post_init_dependent_is_scheduled_once(runner: MockRunner):
+    upstream, dependent = MagicMock(section_name="Tests.1"), MagicMock(section_name="Tests.2")
+    dependent.dependencies = {"start_post_init": MagicMock(test=upstream, time=0)}
+    runner.test_to_job_map[upstream] = BaseJob(1, upstream, "")
+    runner.scheduled_tests.update({upstream, dependent})
+
+    def get_dependents(test, dep_type):
+        return [dependent] if test is upstream and dep_type == "start_post_init" else []
+
+    async def check():
+        patch_dependents = patch.object(runner.test_scenario, "get_dependents", side_effect=get_dependents)
+        with patch_dependents, patch.object(runner, "is_job_running", return_value=True) as mock_is_job_running:
+            await runner.check_start_post_init_dependencies()
+        mock_is_job_running.assert_not_called()
+
+    asyncio.run(check())
+    assert not runner.pending_submissions
+
+
+def test_submission_limit_queues_tests_by_priority(runner: MockRunner):
+    runner.test_scenario.max_in_flight = 1
+    low, high, first = (
+        MagicMock(section_name=f"Tests.{i}", priority=p, current_iteration=0) for i, p in ((1, 0), (2, 5), (3, 0))
+    )
+
+    async def submit():
+        for test in (first, low, high):
+            await runner.submit_test(test)
+        assert [job.test for job in runner.jobs] == [first]
+        assert len(runner.submission_queue) == 2
+
+        await runner.submit_queued_tests()
+        assert [job.test for job in runner.jobs] == [first]
+
+        await runner.handle_job_completion(runner.jobs[0])
+        await runner.submit_queued_tests()
+
+    first.has_more_iterations.return_value = False
+    asyncio.run(submit())
+    assert [job.test for job in runner.jobs] == [high]
+    assert len(runner.submission_queue) == 1
+
+
+def test_submission_limit_per_node_group(runner: MockRunner):
+    runner.test_scenario.max_in_flight_per_group = {"main:group1": 1}
+    t1, t2, t3 = (MagicMock(section_name=f"Tests.{i}", priority=0, current_iteration=0) for i in range(1, 4))
+    groups = {t1: "main:group1", t2: "main:group1", t3: "main:group2"}
+
+    async def submit():
+        with patch.object(runner, "get_test_node_group", side_effect=groups.get):
+            for test in (t1, t2, t3):
+                await runner.submit_test(test)
+
+    asyncio.run(submit())
+    assert [job.test for job in runner.jobs] == [t1, t3]
+    assert len(runner.submission_queue) == 1
+
+
+def make_test(section_name: str) -> Test:
+    return Test(
+        name=section_name,
+        description="",
+        test_template=MagicMock(),
+        env_vars={},
+        cmd_args={},
+        extra_env_vars={},
+        extra_cmd_args="",
+        section_name=section_name,
+    )
+
+
+def test_resume_from_journal(tmp_path):
+    finished, waiting, running, failed, repeated = (make_test(f"Tests.{i}") for i in range(1, 6))
+    waiting.dependencies = {"start_post_comp": TestDependency(finished, 0)}
+    repeated.iterations = 3
+    journal = RunJournal(str(tmp_path))
+    journal.record("submitted", test="Tests.1", iteration=0, job_id=11, output_path="")
+    journal.record("submitted", test="Tests.3", iteration=0, job_id=13, output_path="out/Tests.3/0")
+    journal.record("submitted", test="Tests.4", iteration=0, job_id=14, output_path="")
+    journal.record("submitted", test="Tests.5", iteration=0, job_id=15, output_path="")
+    journal.record("completed", test="Tests.1", iteration=1, job_id=11, output_path="", terminated_by_dependency=False)
+    journal.record("failed", test="Tests.4", iteration=0, job_id=14, output_path="")
+    journal.record("completed", test="Tests.5", iteration=1, job_id=15, output_path="", terminated_by_dependency=False)
+    scenario = TestScenario(name="scenario", tests=[finished, waiting, running, failed, repeated])
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, scenario, str(tmp_path))
+
+    async def resume():
+        completed_jobs_count = await runner.resume_from_journal()
+        assert set(runner.pending_submissions) == {waiting}
+        runner.cancel_scheduled_tasks()
+        return completed_jobs_count
+
+    assert asyncio.run(resume()) == 2
+    assert runner.output_path == str(tmp_path)
+    assert runner.test_to_job_map[running].id == 13
+    assert runner.test_to_job_map[running].output_path == "out/Tests.3/0"
+    assert runner.test_to_job_map[failed].id == 1
+    assert runner.test_to_job_map[repeated].id == 1
+    assert repeated.current_iteration == 1
+    assert finished not in runner.test_to_job_map
+    assert [entry["test"] for entry in journal.load()[-2:]] == ["Tests.4", "Tests.5"]
+
+
+def test_resume_missing_output_directory(tmp_path):
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        MockRunner("run", system, TestScenario(name="scenario", tests=[]), str(tmp_path / "missing"))
+
+
+def make_failing_runner(tmp_path, tests, failure_policy: FailurePolicy) -> MockRunner:
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=tests, failure_policy=failure_policy))
+    runner.get_job_status = MagicMock(return_value=JobStatusResult(is_successful=False, error_message="NCCL error"))
+    return runner
+
+
+def test_failure_policy_continue(tmp_path):
+    failed, dependent = make_test("Tests.1"), make_test("Tests.2")
+    dependent.dependencies = {"start_post_comp": TestDependency(failed, 0)}
+    runner = make_failing_runner(tmp_path, [failed, dependent], FailurePolicy(action="continue"))
+
+    async def fail():
+        await runner.submit_test(failed)
+        completed_jobs_count = await runner.monitor_jobs()
+        assert set(runner.pending_submissions) == {dependent}
+        runner.cancel_scheduled_tasks()
+        return completed_jobs_count
+
+    assert asyncio.run(fail()) == 1
+    assert failed.current_iteration == 1
+    assert [failure["retried"] for failure in runner.failures] == [False]
+    assert [entry["event"] for entry in runner.journal.load()] == ["submitted", "failed", "completed"]
+
+
+def test_failure_policy_retry(tmp_path):
+    test = make_test("Tests.1")
+    runner = make_failing_runner(tmp_path, [test], FailurePolicy(action="retry", max_retries=1))
+
+    async def fail_twice():
+        await runner.submit_test(test)
+        assert await runner.monitor_jobs() == 0, "a retried job does not count as completed"
+        assert test in runner.pending_submissions
+        await asyncio.gather(*runner.scheduled_tasks)
+        assert test in runner.test_to_job_map
+        return await runner.monitor_jobs()
+
+    assert asyncio.run(fail_twice()) == 1
+    assert runner.retry_counts[test] == 1
+    assert [failure["retried"] for failure in runner.failures] == [True, False]
+    assert test.current_iteration == 1
+
+
+def test_critical_path_uses_predicted_runtimes(tmp_path):
+    short, long, chain_head, chain_tail = (make_test(f"Tests.{i}") for i in range(1, 5))
+    chain_tail.dependencies = {"start_post_comp": TestDependency(chain_head, 0)}
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=[short, long, chain_head, chain_tail]))
+    assert runner.get_critical_path(chain_head) == 2
+    assert runner.get_critical_path(long) == 1
+
+    runner.runtime_model = RuntimeModel({RuntimeModel.get_test_key(long): [600.0]})
+    for test in (short, chain_head, chain_tail):
+        test.cmd_args = {"size": test.section_name}
+    runner.runtime_model.add(RuntimeModel.get_test_key(short), 60.0)
+
+    assert runner.get_critical_path(long) == 600.0
+    assert runner.get_critical_path(chain_head) == 2 * 330.0, "tests that never ran take the median runtime"
+
+
+def test_critical_path_checks_runtime_model_once(tmp_path):
+    tests = [make_test(f"Tests.{i}") for i in range(1, 4)]
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=tests))
+    runner.runtime_model = RuntimeModel({RuntimeModel.get_test_key(tests[0]): [60.0]})
+
+    with patch.object(RuntimeModel, "get_test_key", wraps=RuntimeModel.get_test_key) as mock_get_test_key:
+        sorted(tests, key=runner.submission_queue.sort_key)
+        sorted(tests, key=runner.submission_queue.sort_key)
+
+    assert mock_get_test_key.call_count == len(tests)
+    assert runner.get_critical_path(tests[0]) == 60.0
+
+
+def test_predicted_end_times(tmp_path):
+    started, queued, unknown = (make_test(f"Tests.{i}") for i in range(1, 4))
+    for test in (started, queued, unknown):
+        test.cmd_args = {"size": test.section_name}
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=[started, queued, unknown]))
+    runner.runtime_model = RuntimeModel({RuntimeModel.get_test_key(test): [60.0] for test in (started, queued)})
+    runner.jobs = [BaseJob(i, test, "") for i, test in enumerate((started, queued, unknown))]
+    runner.jobs[0].start_time = 1000.0
+    runner.jobs[2].start_time = 1000.0
+
+    assert list(runner.get_predicted_end_times()) == [1060.0]
+
+
+def test_wake_on_local_signal(runner: MockRunner):
+    runner.LOCAL_SIGNAL_INTERVAL = 0
+    job = BaseJob(1, MagicMock(), "")
+    runner.jobs.append(job)
+    signalled = []
+
+    async def wait_for_signal():
+        runner.wake_on(job, lambda: bool(signalled))
+        await asyncio.sleep(0)
+        signalled.append(True)
+        return await runner.poller.wait(10)
+
+    assert asyncio.run(asyncio.wait_for(wait_for_signal(), timeout=5))
+
+
+def test_completion_records_job_runtime(tmp_path):
+    test = make_test("Tests.1")
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=[test]))
+
+    async def run_once():
+        await runner.submit_test(test)
+        await runner.update_job_start_times()
+        await runner.monitor_jobs()
+
+    asyncio.run(run_once())
+
+    completion = runner.journal.load()[-1]
+    assert completion["event"] == "completed"
+    assert completion["runtime_key"] == RuntimeModel.get_test_key(test)
+    assert completion["submit_time"] <= completion["start_time"] <= completion["end_time"]
+
+
+def test_run_writes_timeline(tmp_path):
+    test = make_test("Tests.1")
+    system = MagicMock(spec=System)
+    system.output_path = str(tmp_path)
+    system.monitor_interval = 0
+    system.max_monitor_interval = 0
+    runner = MockRunner("run", system, TestScenario(name="scenario", tests=[test]))
+    patch_running = patch.object(runner, "is_job_running", AsyncMock(return_value=True))
+    patch_completed = patch.object(runner, "is_job_completed", AsyncMock(side_effect=[False, True]))
+
+    with patch_running, patch_completed:
+        asyncio.run(runner.run())
+
+    trace = json.loads((Path(runner.output_path) / "timeline.json").read_text())
+    spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert set(spans) == {"submit", "queued", "running", "polling lag", "test scenario"}
+    assert spans["running"]["args"] == {"job_id": 1, "iteration": 0, "outcome": "completed"}
+    assert spans["running"]["ts"] + spans["running"]["dur"] == spans["polling lag"]["ts"]
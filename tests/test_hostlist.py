@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from cloudai.systems.slurm import HostList
+
+
+@pytest.mark.parametrize(
+    "host_list,expected_names",
+    [
+        ("node-[001-003,010]", ["node-001", "node-002", "node-003", "node-010"]),
+        ("node[8-10]", ["node8", "node9", "node10"]),
+        ("node[08-10]", ["node08", "node09", "node10"]),
+        ("login, node-[2-3]", ["login", "node-2", "node-3"]),
+        ("", []),
+    ],
+)
+def test_from_string(host_list: str, expected_names):
+    assert list(HostList.from_string(host_list)) == expected_names
+
+
+@pytest.mark.parametrize("host_list", ["node-[003-001]", "node-[001-x]", "node-[001]suffix"])
+def test_from_string_malformed(host_list: str):
+    with pytest.raises(ValueError):
+        HostList.from_string(host_list)
+
+
+def test_str():
+    hosts = HostList.from_names(["node-003", "node-001", "node-002", "node-010", "node9", "node10", "login"])
+
+    assert str(hosts) == "login,node[9-10],node-[001-003,010]"
+    assert HostList.from_string(str(hosts)) == hosts
+    assert str(HostList.from_names(["node-001"])) == "node-001"
+
+
+def test_large_range_is_not_expanded():
+    hosts = HostList.from_string("node[000001-999999]")
+
+    assert len(hosts) == 999999
+    assert "node500000" in hosts
+    assert "node1000000" not in hosts
+    assert "node50000" not in hosts
+    assert str(hosts - HostList.from_string("node[000002-999998]")) == "node[000001,999999]"
+
+
+def test_set_operations():
+    first = HostList.from_string("node-[001-010],login")
+    second = HostList.from_string("node-[005-012]")
+
+    assert str(first | second) == "login,node-[001-012]"
+    assert str(first & second) == "node-[005-010]"
+    assert str(first - second) == "login,node-[001-004]"
+    assert str(second - HostList.from_string("node-[006,008]")) == "node-[005,007,009-012]"
+    assert not first & HostList.from_string("other[1-4]")
@@ -14,8 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import subprocess
-from unittest.mock import MagicMock, Mock
+import asyncio
+from unittest.mock import MagicMock
 
 import pytest
 from cloudai import TestTemplate
@@ -25,17 +25,15 @@ from cloudai._core.test_scenario import TestScenario
 from cloudai.runner.slurm.slurm_runner import SlurmRunner
 from cloudai.systems import SlurmSystem
 from cloudai.systems.slurm import SlurmNode, SlurmNodeState
-from cloudai.util import CommandShell
+from cloudai.util import AsyncCommandShell
 
 
-class MockCommandShell(CommandShell):
-    def execute(self, command):
-        mock_popen = Mock(spec=subprocess.Popen)
-        mock_popen.communicate.return_value = (
+class MockCommandShell(AsyncCommandShell):
+    async def execute(self, command, timeout=None):
+        return (
             "",
             "sbatch: error: Batch job submission failed: Requested node configuration is not available",
         )
-        return mock_popen
 
 
 class MockTest(Test):
@@ -84,7 +82,7 @@ def slurm_runner(slurm_system):
 def test_job_id_retrieval_error(slurm_runner):
     test = slurm_runner.test_scenario.tests[0]
     with pytest.raises(JobIdRetrievalError) as excinfo:
-        slurm_runner._submit_test(test)
+        asyncio.run(slurm_runner._submit_test(test))
     assert "Failed to retrieve job ID from command output." in str(excinfo.value)
     assert "sbatch: error: Batch job submission failed: Requested node configuration is not available" in str(
         excinfo.value
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from pathlib import Path
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from cloudai import JobStatusResult, MultiScenarioRunner, Test, TestScenario
+from cloudai._core.exceptions import JobFailureError
+from cloudai.runner.standalone.standalone_runner import StandaloneRunner
+from cloudai.systems import StandaloneSystem
+
+
+def make_scenario(name: str, num_tests: int) -> TestScenario:
+    tests = [
+        Test(
+            name=f"{name}.{i}",
+            description="",
+            test_template=MagicMock(),
+            env_vars={},
+            cmd_args={},
+            extra_env_vars={},
+            extra_cmd_args="",
+            section_name=f"Tests.{i}",
+        )
+        for i in range(num_tests)
+    ]
+    return TestScenario(name=name, tests=tests)
+
+
+def test_run_scenarios_concurrently(tmp_path: Path):
+    system = StandaloneSystem("system", str(tmp_path), monitor_interval=0)
+    scenarios = [make_scenario("nccl", 2), make_scenario("ucc", 3)]
+
+    multi_runner = MultiScenarioRunner("dry-run", [(system, scenario) for scenario in scenarios])
+    asyncio.run(multi_runner.run())
+
+    assert [runner.test_scenario for runner in multi_runner.runners] == scenarios
+    assert len({runner.output_path for runner in multi_runner.runners}) == 2
+    assert all(test.current_iteration == 1 for scenario in scenarios for test in scenario.tests)
+
+
+def test_shared_submission_budget(tmp_path: Path):
+    system = StandaloneSystem("system", str(tmp_path), monitor_interval=0)
+    runs = [(system, make_scenario("nccl", 1)), (system, make_scenario("ucc", 1))]
+    multi_runner = MultiScenarioRunner("dry-run", runs, max_in_flight=1)
+    first, second = multi_runner.runners
+
+    assert second.can_submit(second.test_scenario.tests[0])
+    first.submitting.add(first.test_scenario.tests[0])
+    assert not second.can_submit(second.test_scenario.tests[0])
+
+
+def make_process_test(section_name: str, command: str, is_successful: bool) -> Test:
+    template = MagicMock()
+    template.gen_exec_command.return_value = command
+    template.get_job_id.side_effect = lambda stdout, stderr: int(stdout)
+    template.get_job_status.return_value = JobStatusResult(is_successful, "" if is_successful else "test failed")
+    return Test(
+        name=section_name,
+        description="",
+        test_template=template,
+        env_vars={},
+        cmd_args={},
+        extra_env_vars={},
+        extra_cmd_args="",
+        section_name=section_name,
+    )
+
+
+def test_fail_fast_stops_only_its_scenario(tmp_path: Path):
+    system = StandaloneSystem("system", str(tmp_path), monitor_interval=0)
+    failing = TestScenario(
+        name="nccl",
+        tests=[make_process_test("Tests.1", "exit 1", False), make_process_test("Tests.2", "sleep 30", True)],
+    )
+    succeeding = TestScenario(name="ucc", tests=[make_process_test("Tests.1", "sleep 1", True)])
+    multi_runner = MultiScenarioRunner("run", [(system, failing), (system, succeeding)])
+
+    with pytest.raises(JobFailureError):
+        asyncio.run(multi_runner.run())
+
+    failing_runner = cast(StandaloneRunner, multi_runner.runners[0])
+    assert all(process.poll() is not None for process in failing_runner.processes.values())
+    cancelled = {entry["test"] for entry in failing_runner.journal.load() if entry["event"] == "cancelled"}
+    assert "Tests.2" in cancelled
+    assert succeeding.tests[0].current_iteration == 1
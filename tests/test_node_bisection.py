@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from typing import List, Set
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cloudai import NodeBisection, Test
+
+NODES = [f"node-{i:03d}" for i in range(1, 17)]
+
+
+def make_bisection(method: str, nodes: List[str] = NODES) -> NodeBisection:
+    test = Test(
+        name="nccl_test_bisection",
+        description="",
+        test_template=MagicMock(),
+        env_vars={},
+        cmd_args={},
+        extra_env_vars={},
+        extra_cmd_args="",
+    )
+    return NodeBisection(MagicMock(), test, nodes, threshold=100.0, method=method)
+
+
+def run_with_bad_nodes(bisection: NodeBisection, bad_nodes: Set[str]) -> List[List[List[str]]]:
+    rounds = []
+
+    async def run_round(probes: List[List[str]]) -> List[bool]:
+        rounds.append(probes)
+        return [not bad_nodes.intersection(probe) for probe in probes]
+
+    with patch.object(bisection, "run_round", side_effect=run_round):
+        asyncio.run(bisection.run())
+    return rounds
+
+
+@pytest.mark.parametrize("method", NodeBisection.METHODS)
+def test_finds_bad_nodes(method: str):
+    bisection = make_bisection(method)
+
+    rounds = run_with_bad_nodes(bisection, {"node-006", "node-011"})
+
+    assert bisection.bad_nodes == {"node-006", "node-011"}
+    assert bisection.good_nodes == set(NODES) - {"node-006", "node-011"}
+    assert not bisection.unresolved_nodes
+    for probes in rounds:
+        probed_nodes = [node for probe in probes for node in probe]
+        assert len(probed_nodes) == len(set(probed_nodes))
+
+
+def test_halving_rounds():
+    bisection = make_bisection("halving")
+
+    rounds = run_with_bad_nodes(bisection, {"node-006"})
+
+    assert rounds[:3] == [[NODES], [NODES[:8], NODES[8:]], [NODES[:4], NODES[4:8]]]
+    assert len(rounds) == 5
+
+
+def test_pairwise_rounds():
+    bisection = make_bisection("pairwise", NODES[:5])
+
+    rounds = run_with_bad_nodes(bisection, {"node-001"})
+
+    assert rounds == [
+        [["node-001", "node-002"], ["node-003", "node-004", "node-005"]],
+        [["node-001", "node-003"], ["node-002", "node-004"]],
+    ]
+    assert bisection.bad_nodes == {"node-001"}
+
+
+def test_unresolved_without_passing_probe():
+    bisection = make_bisection("halving", NODES[:2])
+
+    run_with_bad_nodes(bisection, {"node-001", "node-002"})
+
+    assert bisection.rounds == 1
+    assert bisection.unresolved_nodes == NODES[:2]
+
+
+def test_create_test_scenario():
+    bisection = make_bisection("pairwise", NODES[:4])
+
+    test_scenario = bisection.create_test_scenario(bisection.plan_round())
+
+    assert test_scenario.name == "bisection_nccl_test_bisection_round_1"
+    assert [test.nodes for test in test_scenario.tests] == [NODES[:2], NODES[2:4]]
+    assert [test.num_nodes for test in test_scenario.tests] == [2, 2]
+    assert test_scenario.failure_policy.action == "continue"
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        make_bisection("random")
+    with pytest.raises(ValueError):
+        make_bisection("halving", ["node-001", "node-001"])
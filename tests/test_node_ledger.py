@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from cloudai import NodeLedger, Test
+
+
+def make_test(num_nodes: int = 2) -> Test:
+    template = MagicMock()
+    template.name = "NcclTest"
+    return Test(
+        name="nccl",
+        description="",
+        test_template=template,
+        env_vars={},
+        cmd_args={"op": "all_reduce"},
+        extra_env_vars={},
+        extra_cmd_args="",
+        num_nodes=num_nodes,
+    )
+
+
+def test_records_persist_across_runs(tmp_path: Path):
+    NodeLedger(str(tmp_path)).record(make_test(), 100, ["node-001", "node-002"], False, 90.5)
+    NodeLedger(str(tmp_path)).record(make_test(), 101, ["node-001"], True, None)
+
+    records = NodeLedger(str(tmp_path)).load()
+
+    assert [record[1:] for record in records] == [
+        ("100", "node-001", 0, 90.5),
+        ("100", "node-002", 0, 90.5),
+        ("101", "node-001", 1, None),
+    ]
+
+
+def test_flags_slow_nodes(tmp_path: Path):
+    ledger = NodeLedger(str(tmp_path))
+    test = make_test()
+    job_ids = iter(range(100, 200))
+    for _ in range(3):
+        ledger.record(test, next(job_ids), ["node-001", "node-002"], False, 100.0)
+        ledger.record(test, next(job_ids), ["node-003", "node-004"], False, 101.0)
+        ledger.record(test, next(job_ids), ["node-005", "node-006"], False, 50.0)
+    # Jobs on a different number of nodes are not compared with the others.
+    ledger.record(make_test(1), next(job_ids), ["node-007"], False, 10.0)
+
+    assert ledger.get_flagged_nodes().keys() == {"node-005", "node-006"}
+
+
+def test_flags_flaky_nodes(tmp_path: Path):
+    ledger = NodeLedger(str(tmp_path))
+    test = make_test()
+    ledger.record(test, 100, ["node-001", "node-002"], True, None)
+    ledger.record(test, 101, ["node-001", "node-003"], True, None)
+    ledger.record(test, 102, ["node-001", "node-002"], False, 100.0)
+
+    assert ledger.get_flagged_nodes() == {"node-001": "2 of 3 jobs failed"}
+
+
+def test_flags_expire(tmp_path: Path):
+    ledger = NodeLedger(str(tmp_path))
+    test = make_test()
+    with patch("time.time", return_value=1_000_000.0):
+        for job_id in range(100, 103):
+            ledger.record(test, job_id, ["node-001"], True, None)
+        assert ledger.get_flagged_nodes().keys() == {"node-001"}
+
+    with patch("time.time", return_value=1_000_000.0 + NodeLedger.MAX_AGE + 1):
+        assert ledger.get_flagged_nodes() == {}
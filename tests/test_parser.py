@@ -67,3 +67,34 @@ class Test_Parser:
         test_scenario_parser.return_value = fake_scenario
         _, tests, _ = parser.parse(tests_dir, Path())
         assert len(tests) == 1
+
+    @patch("cloudai._core.system_parser.SystemParser.parse")
+    @patch("cloudai._core.test_parser.TestParser.parse_all")
+    @patch("cloudai._core.test_scenario_parser.TestScenarioParser.parse")
+    def test_several_scenarios(self, test_scenario_parser: Mock, test_parser: Mock, _, parser: Parser):
+        tests_dir = parser.system_config_path.parent / "tests"
+        tests_dir.mkdir()
+        fake_tests = []
+        for i in range(3):
+            fake_tests.append(Mock())
+            fake_tests[-1].name = f"test-{i}"
+        test_parser.return_value = fake_tests
+        fake_scenarios = []
+        for i in range(2):
+            fake_scenarios.append(Mock())
+            fake_scenarios[-1].tests = [Mock()]
+            fake_scenarios[-1].tests[0].name = f"test-{i}"
+        test_scenario_parser.side_effect = fake_scenarios
+        _, tests, test_scenarios = parser.parse_scenarios(tests_dir, [Path("a.toml"), Path("b.toml")])
+        assert test_scenarios == fake_scenarios
+        assert [t.name for t in tests] == ["test-0", "test-1"]
+
+    @patch("cloudai._core.parser.Parser.parse")
+    def test_parse_systems(self, parse: Mock, parser: Parser):
+        tests_dir = parser.system_config_path.parent / "tests"
+        parse.side_effect = [("system-a", [], None), ("system-b", [], None)]
+
+        parsed = parser.parse_systems([Path("a.toml"), Path("b.toml")], tests_dir, Path("scenario.toml"))
+
+        assert [system for system, _, _ in parsed] == ["system-a", "system-b"]
+        parse.assert_called_with(tests_dir, Path("scenario.toml"))
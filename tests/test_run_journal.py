@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+
+from cloudai._core.run_journal import RunJournal
+
+
+def test_record_and_load(tmp_path: Path):
+    journal = RunJournal(str(tmp_path))
+    journal.record("submitted", test="Tests.1", job_id=1)
+    journal.record("completed", test="Tests.1", job_id=1)
+
+    assert RunJournal(str(tmp_path)).load() == [
+        {"event": "submitted", "test": "Tests.1", "job_id": 1},
+        {"event": "completed", "test": "Tests.1", "job_id": 1},
+    ]
+
+
+def test_load_ignores_interrupted_write(tmp_path: Path):
+    journal = RunJournal(str(tmp_path))
+    journal.record("submitted", test="Tests.1", job_id=1)
+    with open(journal.path, "a") as journal_file:
+        journal_file.write('{"event": "comp')
+
+    assert journal.load() == [{"event": "submitted", "test": "Tests.1", "job_id": 1}]
+
+
+def test_load_missing_journal(tmp_path: Path):
+    assert RunJournal(str(tmp_path)).load() == []
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from cloudai import Test
+from cloudai._core.run_journal import RunJournal
+from cloudai._core.runtime_model import RuntimeModel
+
+
+def make_test(cmd_args: dict) -> Test:
+    template = MagicMock()
+    template.name = "NcclTest"
+    return Test(
+        name="nccl",
+        description="",
+        test_template=template,
+        env_vars={},
+        cmd_args=cmd_args,
+        extra_env_vars={},
+        extra_cmd_args="",
+        num_nodes=2,
+    )
+
+
+def record_completion(journal: RunJournal, job_id: int, key: str, runtime: float, **fields) -> None:
+    journal.record(
+        "completed", job_id=job_id, runtime_key=key, submit_time=0.0, start_time=10.0, end_time=10.0 + runtime, **fields
+    )
+
+
+def test_load_from_prior_runs(tmp_path: Path):
+    test = make_test({"op": "all_reduce"})
+    key = RuntimeModel.get_test_key(test)
+    for run, runtimes in enumerate([[100.0, 300.0], [200.0]]):
+        (tmp_path / f"run{run}").mkdir()
+        journal = RunJournal(str(tmp_path / f"run{run}"))
+        for job_id, runtime in enumerate(runtimes):
+            record_completion(journal, job_id, key, runtime)
+    journal = RunJournal(str(tmp_path / "run1"))
+    journal.record("failed", job_id=7)
+    record_completion(journal, 7, key, 5000.0)
+    record_completion(journal, 8, key, 1.0, terminated_by_dependency=True)
+
+    model = RuntimeModel.load(str(tmp_path))
+
+    assert model.runtimes == {key: [100.0, 300.0, 200.0]}
+    assert model.predict(test) == 200.0
+    assert model.predict(make_test({"op": "all_gather"})) is None
+    assert model.get_default_runtime() == 200.0
+
+
+def test_test_key_ignores_runner_arguments():
+    assert RuntimeModel.get_test_key(make_test({"op": "all_reduce"})) == RuntimeModel.get_test_key(
+        make_test({"op": "all_reduce", "time_limit": "01:00:00", "job_array": "0-3"})
+    )
+
+
+def test_time_limit():
+    test = make_test({})
+    key = RuntimeModel.get_test_key(test)
+    model = RuntimeModel({key: [1000.0, 3000.0]})
+    assert model.get_time_limit(test) is None, "too few runtimes to predict a time limit"
+
+    model.add(key, 2000.0)
+    assert model.get_time_limit(test) == "01:03:00"
+    assert RuntimeModel({key: [10.0, 10.0, 10.0]}).get_time_limit(test) == "00:05:00"
@@ -354,6 +354,23 @@ class TestWriteSbatchScript:
         self.assert_positional_lines(file_contents.splitlines())
         assert f"--{add_arg}=" not in file_contents
 
+    def test_job_array(self, strategy_fixture: SlurmCommandGenStrategy, tmp_path: Path):
+        args = self.MANDATORY_ARGS.copy()
+        args["job_array"] = "0-19%4"
+
+        sbatch_command = strategy_fixture._write_sbatch_script(
+            args, self.env_vars_str, self.srun_command, str(tmp_path)
+        )
+
+        filepath_from_command = sbatch_command.split()[-1]
+        with open(filepath_from_command, "r") as file:
+            file_contents = file.read()
+
+        self.assert_positional_lines(file_contents.splitlines())
+        assert "#SBATCH --array=0-19%4" in file_contents
+        assert f"#SBATCH --output={tmp_path / '%a' / 'stdout.txt'}" in file_contents
+        assert f"#SBATCH --error={tmp_path / '%a' / 'stderr.txt'}" in file_contents
+
 
 class TestNCCLSlurmCommandGen:
     def get_cmd(self, slurm_system: SlurmSystem, slurm_args: dict, cmd_args: dict) -> str:
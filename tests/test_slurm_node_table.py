@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest.mock import patch
+
+import numpy as np
+from cloudai.systems import SlurmSystem
+from cloudai.systems.slurm import SlurmNode, SlurmNodeState, SlurmNodeTable
+
+
+def make_nodes(partition: str, first: int, last: int):
+    return [SlurmNode(name=f"node-{i:03d}", partition=partition, state=SlurmNodeState.IDLE) for i in range(first, last)]
+
+
+def test_nodes_are_views_over_the_table():
+    main, backup = make_nodes("main", 0, 4), make_nodes("backup", 4, 8)
+    backup[0] = main[2]
+    table = SlurmNodeTable.from_partitions({"main": main, "backup": backup})
+
+    main[1].state = SlurmNodeState.ALLOCATED
+    main[1].user = "alice"
+    table.set_state(table.rows["node-003"], SlurmNodeState.DOWN)
+
+    assert len(table.names) == 7
+    assert main[3].state == SlurmNodeState.DOWN
+    assert (table.get_state(1), table.get_user(1)) == (SlurmNodeState.ALLOCATED, "alice")
+    assert list(np.flatnonzero(table.in_partition("backup"))) == [2, 4, 5, 6]
+    assert list(np.flatnonzero(table.in_states([SlurmNodeState.IDLE]) & table.in_partition("main"))) == [0, 2]
+    assert list(np.flatnonzero(table.used_by("alice"))) == [1]
+    assert not table.used_by("bob").any()
+
+
+def test_columnar_system_selects_like_object_system():
+    sinfo_output = "\n".join(
+        f"node-{i:03d}|main*|{state}" for i, state in enumerate(["allocated", "idle", "completing", "down", "idle"])
+    )
+    selections = []
+    for columnar_node_states in [False, True]:
+        nodes = make_nodes("main", 0, 5)
+        system = SlurmSystem(
+            name="test_system",
+            install_path="/fake/path",
+            output_path="/fake/output",
+            default_partition="main",
+            partitions={"main": nodes},
+            columnar_node_states=columnar_node_states,
+            groups={"main": {"group1": nodes}},
+        )
+        system.excluded_nodes = {"node-004"}
+        patch_squeue = patch.object(system, "get_squeue", return_value="node-000|other_user")
+        patch_sinfo = patch.object(system, "get_sinfo", return_value=sinfo_output)
+        with patch_squeue, patch_sinfo:
+            selections.append(system.parse_nodes(["main:group1:3"]))
+        assert (system.node_table is not None) == columnar_node_states
+        assert nodes[0].user == "other_user"
+
+    assert selections == [["node-001", "node-002", "node-000"]] * 2
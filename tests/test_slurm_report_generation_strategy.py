@@ -95,3 +95,9 @@ def test_nccl_report_generation(setup_test_environment):
     assert df.iloc[-1]["Size (B)"] == 12000000.0, "Last row Size (B) does not match."
     assert df.iloc[-1]["Algbw (GB/s) Out-of-place"] == 120.30, "Last row Algbw (GB/s) Out-of-place does not match."
     assert df.iloc[-1]["Busbw (GB/s) Out-of-place"] == 130.40, "Last row Busbw (GB/s) Out-of-place does not match."
+
+
+def test_nccl_performance(setup_test_environment):
+    strategy = NcclTestReportGenerationStrategy()
+
+    assert strategy.get_performance(setup_test_environment) == 111.111
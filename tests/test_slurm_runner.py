@@ -0,0 +1,457 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+from pathlib import Path
+from typing import List, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cloudai import JobStatusResult, Test, TestScenario
+from cloudai._core.runtime_model import RuntimeModel
+from cloudai._core.test import TestDependency
+from cloudai.runner.slurm.slurm_allocation import SlurmAllocation
+from cloudai.runner.slurm.slurm_job import SlurmJob, SlurmJobStep
+from cloudai.runner.slurm.slurm_runner import SlurmRunner
+from cloudai.systems import SlurmSystem
+from cloudai.systems.slurm import SlurmNode, SlurmNodeState
+from cloudai.systems.slurm.strategy import SlurmCommandGenStrategy
+
+
+def make_test(section_name: str, submits_sbatch_script: bool = True) -> Test:
+    strategy = MagicMock(spec=SlurmCommandGenStrategy)
+    strategy.SUBMITS_SBATCH_SCRIPT = submits_sbatch_script
+    template = MagicMock()
+    template.command_gen_strategy = strategy
+    template.gen_exec_command.return_value = f"sbatch /fake/{section_name}/cloudai_sbatch_script.sh"
+    template.get_job_id.side_effect = lambda stdout, stderr: int(stdout.split()[-1])
+    return Test(
+        name=section_name,
+        description="",
+        test_template=template,
+        env_vars={},
+        cmd_args={},
+        extra_env_vars={},
+        extra_cmd_args="",
+        section_name=section_name,
+    )
+
+
+@pytest.fixture
+def slurm_system(tmp_path: Path) -> SlurmSystem:
+    return SlurmSystem(
+        name="test_system",
+        install_path=str(tmp_path / "install"),
+        output_path=str(tmp_path / "output"),
+        default_partition="main",
+        partitions={"main": [SlurmNode(name="node-001", partition="main", state=SlurmNodeState.IDLE)]},
+        native_dependencies=True,
+    )
+
+
+def make_runner(slurm_system: SlurmSystem, tests: List[Test]) -> SlurmRunner:
+    runner = SlurmRunner("run", slurm_system, TestScenario(name="scenario", tests=tests))
+    job_ids = iter(range(100, 200))
+    runner.cmd_shell = MagicMock()
+    runner.cmd_shell.execute = AsyncMock(side_effect=lambda cmd: (f"Submitted batch job {next(job_ids)}", ""))
+    return runner
+
+
+def submitted_commands(runner: SlurmRunner) -> List[str]:
+    return [call.args[0] for call in cast(AsyncMock, runner.cmd_shell.execute).await_args_list]
+
+
+def test_native_dependency_chain_is_submitted_at_once(slurm_system: SlurmSystem):
+    t1, t2, t3 = make_test("Tests.1"), make_test("Tests.2"), make_test("Tests.3")
+    t2.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    t3.dependencies = {"start_post_init": TestDependency(t2, 120)}
+    runner = make_runner(slurm_system, [t1, t2, t3])
+
+    asyncio.run(runner.submit_test(t1))
+
+    assert submitted_commands(runner) == [
+        "sbatch /fake/Tests.1/cloudai_sbatch_script.sh",
+        "sbatch --dependency=afterany:100 /fake/Tests.2/cloudai_sbatch_script.sh",
+        "sbatch --dependency=after:101+2 /fake/Tests.3/cloudai_sbatch_script.sh",
+    ]
+    assert {t1, t2, t3} == set(runner.test_to_job_map)
+    assert not runner.native_dependency_map
+
+
+@pytest.mark.parametrize(
+    "dep_type,time,iterations,submits_sbatch_script",
+    [
+        ("start_post_comp", 10, 1, True),
+        ("start_post_comp", 0, 3, True),
+        ("start_post_init", 5, 1, True),
+        ("start_post_comp", 0, 1, False),
+    ],
+)
+def test_untranslatable_dependency_is_left_to_runner(
+    slurm_system: SlurmSystem, dep_type: str, time: int, iterations: int, submits_sbatch_script: bool
+):
+    t1, t2 = make_test("Tests.1"), make_test("Tests.2", submits_sbatch_script)
+    t1.iterations = iterations
+    t2.dependencies = {dep_type: TestDependency(t1, time)}
+    runner = make_runner(slurm_system, [t1, t2])
+
+    asyncio.run(runner.submit_test(t1))
+
+    assert submitted_commands(runner) == ["sbatch /fake/Tests.1/cloudai_sbatch_script.sh"]
+    assert t2 not in runner.scheduled_tests
+
+
+def test_native_dependencies_disabled(slurm_system: SlurmSystem):
+    slurm_system.native_dependencies = False
+    t1, t2 = make_test("Tests.1"), make_test("Tests.2")
+    t2.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    runner = make_runner(slurm_system, [t1, t2])
+
+    asyncio.run(runner.submit_test(t1))
+
+    assert submitted_commands(runner) == ["sbatch /fake/Tests.1/cloudai_sbatch_script.sh"]
+
+
+def test_job_array_submission(slurm_system: SlurmSystem):
+    slurm_system.job_arrays = True
+    slurm_system.job_array_max_running = 4
+    test = make_test("Tests.1")
+    test.iterations = 20
+    array_specs = []
+
+    def gen_exec_command(env_vars, cmd_args, extra_env_vars, extra_cmd_args, output_path, num_nodes, nodes):
+        array_specs.append(cmd_args["job_array"])
+        return f"sbatch {output_path}/cloudai_sbatch_script.sh"
+
+    cast(MagicMock, test.test_template).gen_exec_command.side_effect = gen_exec_command
+    runner = make_runner(slurm_system, [test])
+
+    asyncio.run(runner.submit_test(test))
+
+    job = runner.test_to_job_map[test]
+    test_output_path = Path(runner.output_path) / "Tests.1"
+    assert isinstance(job, SlurmJob)
+    assert job.array_size == 20
+    assert job.output_path == str(test_output_path)
+    assert all((test_output_path / str(i)).is_dir() for i in range(20))
+    assert array_specs == ["0-19%4"]
+    assert "job_array" not in test.cmd_args
+
+    job.increment_iteration()
+    assert not test.has_more_iterations()
+
+
+def test_job_array_status(slurm_system: SlurmSystem):
+    slurm_system.job_arrays = True
+    test = make_test("Tests.1")
+    test.iterations = 3
+    cast(MagicMock, test.test_template).get_job_status.side_effect = lambda path: JobStatusResult(
+        not path.endswith("1"), f"{path} failed"
+    )
+    runner = make_runner(slurm_system, [test])
+    job = SlurmJob(100, test, "/fake/Tests.1", array_size=3)
+
+    result = runner.get_job_status(job)
+
+    assert not result.is_successful
+    assert result.error_message == "/fake/Tests.1/1 failed"
+
+
+def test_single_iteration_test_is_not_an_array(slurm_system: SlurmSystem):
+    slurm_system.job_arrays = True
+    test = make_test("Tests.1")
+    runner = make_runner(slurm_system, [test])
+
+    assert runner.get_job_array_spec(test) is None
+
+
+def test_estimate_peak_num_nodes(slurm_system: SlurmSystem):
+    t1, t2, t3 = make_test("Tests.1"), make_test("Tests.2"), make_test("Tests.3")
+    t1.num_nodes, t2.num_nodes, t3.num_nodes = 2, 3, 8
+    t3.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    runner = make_runner(slurm_system, [t1, t2, t3])
+
+    assert runner.estimate_peak_num_nodes() == 8
+
+    t3.num_nodes = 4
+    assert runner.estimate_peak_num_nodes() == 5
+
+
+def test_allocate(slurm_system: SlurmSystem):
+    slurm_system.persistent_allocation = True
+    slurm_system.get_job_nodes = AsyncMock(return_value=["node-001", "node-002"])
+    test = make_test("Tests.1")
+    test.num_nodes = 2
+    runner = make_runner(slurm_system, [test])
+    runner.cmd_shell.execute = AsyncMock(return_value=("", "salloc: Granted job allocation 4242\n"))
+
+    allocation = asyncio.run(runner.allocate())
+
+    assert isinstance(allocation, SlurmAllocation)
+    assert allocation.job_id == 4242
+    assert allocation.nodes == ["node-001", "node-002"]
+    await_args = runner.cmd_shell.execute.await_args
+    assert await_args is not None
+    command = await_args.args[0]
+    assert command.startswith("salloc --no-shell ")
+    assert "-N 2" in command
+    slurm_system.get_job_nodes.assert_awaited_once_with(4242)
+
+
+def test_allocate_failure(slurm_system: SlurmSystem):
+    runner = make_runner(slurm_system, [make_test("Tests.1")])
+    runner.cmd_shell.execute = AsyncMock(return_value=("", "salloc: error: invalid partition"))
+
+    with pytest.raises(RuntimeError, match="invalid partition"):
+        asyncio.run(runner.allocate())
+
+
+def test_job_step_runs_on_reserved_nodes(slurm_system: SlurmSystem, tmp_path: Path):
+    script_path = tmp_path / "cloudai_sbatch_script.sh"
+    script_path.write_text(
+        "#!/bin/bash\n#SBATCH -N 2\n#SBATCH --gpus-per-node=8\n#SBATCH --time=00:10:00\n"
+        "echo $SLURM_JOB_ID $SLURM_JOB_NODELIST $SLURM_NNODES\n"
+        "echo $SLURM_DISTRIBUTION $SLURM_GPUS_PER_NODE $SLURM_TIMELIMIT\n"
+        'cat "$SLURM_HOSTFILE"\n'
+    )
+    test = make_test("Tests.1")
+    test.num_nodes = 2
+    cast(MagicMock, test.test_template).gen_exec_command.return_value = f"sbatch {script_path}"
+    runner = make_runner(slurm_system, [test])
+
+    async def run_job_step() -> SlurmJobStep:
+        runner.allocation = SlurmAllocation(4242, ["node-001", "node-002", "node-003"])
+        job = await runner._submit_test(test)
+        assert isinstance(job, SlurmJobStep)
+        assert runner.allocation.free_nodes == ["node-003"]
+        await job.process.wait()
+        await asyncio.sleep(0)
+        assert await runner.is_job_completed(job)
+        return job
+
+    job = asyncio.run(run_job_step())
+
+    assert job.nodes == ["node-001", "node-002"]
+    assert runner.allocation is not None
+    assert sorted(runner.allocation.free_nodes) == ["node-001", "node-002", "node-003"]
+    assert (Path(job.output_path) / "stdout.txt").read_text() == (
+        "4242 node-001,node-002 2\narbitrary 8 00:10:00\nnode-001\nnode-002\n"
+    )
+    cast(AsyncMock, runner.cmd_shell.execute).assert_not_called()
+
+
+def test_allocation_waits_for_released_nodes():
+    allocation = SlurmAllocation(4242, ["node-001", "node-002"])
+
+    async def acquire_and_release():
+        first = await allocation.acquire(2)
+        waiter = asyncio.create_task(allocation.acquire(1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await allocation.release(first)
+        return await waiter
+
+    assert asyncio.run(acquire_and_release()) == ["node-001"]
+    with pytest.raises(ValueError):
+        asyncio.run(allocation.acquire(3))
+
+
+def test_recover_job_from_journal(slurm_system: SlurmSystem):
+    test = make_test("Tests.1")
+    runner = make_runner(slurm_system, [test])
+    job = SlurmJob(100, test, "/fake/Tests.1", array_size=4)
+
+    entry = runner.get_job_journal_fields(job)
+    recovered = runner.recover_job(test, entry)
+
+    assert isinstance(recovered, SlurmJob)
+    assert (recovered.id, recovered.output_path, recovered.array_size) == (100, "/fake/Tests.1", 4)
+    assert runner.recover_job(test, {**entry, "job_step": True}) is None
+
+
+def test_exclude_failed_job_nodes(slurm_system: SlurmSystem):
+    t1, t2 = make_test("Tests.1"), make_test("Tests.2")
+    runner = make_runner(slurm_system, [t1, t2])
+    slurm_system.async_cmd_shell = MagicMock()
+    slurm_system.async_cmd_shell.execute = AsyncMock(return_value=("node-[002-003]\n", ""))
+
+    async def exclude_and_submit():
+        await runner.exclude_job_nodes(SlurmJob(100, t1, "/fake/Tests.1/0"))
+        await runner.submit_test(t2)
+
+    asyncio.run(exclude_and_submit())
+
+    assert slurm_system.excluded_nodes == {"node-002", "node-003"}
+    assert submitted_commands(runner) == ["sbatch --exclude=node-002,node-003 /fake/Tests.2/cloudai_sbatch_script.sh"]
+
+
+def test_allocation_excludes_nodes():
+    allocation = SlurmAllocation(4242, ["node-001", "node-002", "node-003"])
+
+    async def exclude():
+        reserved = await allocation.acquire(2)
+        await allocation.exclude(["node-001", "node-003"])
+        await allocation.release(reserved)
+        with pytest.raises(ValueError):
+            await allocation.acquire(2)
+        return await allocation.acquire(1)
+
+    assert asyncio.run(exclude()) == ["node-002"]
+    assert allocation.nodes == ["node-002"]
+
+
+def test_auto_time_limit(slurm_system: SlurmSystem):
+    slurm_system.auto_time_limit = True
+    predicted, configured = make_test("Tests.1"), make_test("Tests.2")
+    configured.time_limit = "02:00:00"
+    time_limits = {}
+
+    def gen_exec_command(env_vars, cmd_args, extra_env_vars, extra_cmd_args, output_path, num_nodes, nodes):
+        time_limits[output_path.split("/")[-2]] = cmd_args.get("time_limit")
+        return f"sbatch {output_path}/cloudai_sbatch_script.sh"
+
+    runner = make_runner(slurm_system, [predicted, configured])
+    for test in (predicted, configured):
+        cast(MagicMock, test.test_template).gen_exec_command.side_effect = gen_exec_command
+        runner.runtime_model.runtimes[RuntimeModel.get_test_key(test)] = [600.0, 700.0, 800.0]
+
+    async def submit():
+        await runner.submit_test(predicted)
+        await runner.submit_test(configured)
+
+    asyncio.run(submit())
+
+    assert time_limits == {"Tests.1": "00:17:00", "Tests.2": "02:00:00"}
+    assert "time_limit" not in predicted.cmd_args
+
+
+def test_job_array_runtime_is_not_recorded(slurm_system: SlurmSystem):
+    test = make_test("Tests.1")
+    runner = make_runner(slurm_system, [test])
+    job, array_job = SlurmJob(100, test, "/fake/Tests.1/0"), SlurmJob(101, test, "/fake/Tests.1", array_size=4)
+    job.submit_time = array_job.submit_time = 0.0
+
+    assert runner.get_job_runtime_fields(job)["runtime_key"] == RuntimeModel.get_test_key(test)
+    assert runner.get_job_runtime_fields(array_job) == {}
+
+
+def test_pipelined_iterations(slurm_system: SlurmSystem):
+    slurm_system.pipelined_iterations = True
+    slurm_system.scancel = AsyncMock()
+    test = make_test("Tests.1")
+    test.iterations = 3
+    cast(MagicMock, test.test_template).gen_exec_command.side_effect = (
+        lambda env_vars, cmd_args, extra_env_vars, extra_cmd_args, output_path, num_nodes, nodes: (
+            f"sbatch {output_path}/cloudai_sbatch_script.sh"
+        )
+    )
+    runner = make_runner(slurm_system, [test])
+    test_output_path = Path(runner.output_path) / "Tests.1"
+
+    async def run_iterations():
+        await runner.submit_test(test)
+        assert submitted_commands(runner) == [
+            f"sbatch {test_output_path}/0/cloudai_sbatch_script.sh",
+            f"sbatch --dependency=afterany:100 {test_output_path}/1/cloudai_sbatch_script.sh",
+        ]
+        await runner.handle_job_completion(runner.test_to_job_map[test])
+        await runner.handle_job_completion(runner.test_to_job_map[test])
+
+    asyncio.run(run_iterations())
+
+    job = runner.test_to_job_map[test]
+    assert (job.id, job.output_path, test.current_iteration) == (102, str(test_output_path / "2"), 2)
+    assert submitted_commands(runner)[2:] == [
+        f"sbatch --dependency=afterany:101 {test_output_path}/2/cloudai_sbatch_script.sh"
+    ]
+    assert not runner.pipelined_jobs
+    slurm_system.scancel.assert_not_called()
+
+
+def test_killed_job_cancels_pipelined_iteration(slurm_system: SlurmSystem):
+    slurm_system.pipelined_iterations = True
+    slurm_system.scancel = AsyncMock()
+    test = make_test("Tests.1")
+    test.iterations = 3
+    runner = make_runner(slurm_system, [test])
+
+    async def submit_and_kill():
+        await runner.submit_test(test)
+        await runner.kill_job(runner.test_to_job_map[test])
+
+    asyncio.run(submit_and_kill())
+
+    assert [call.args[0] for call in slurm_system.scancel.await_args_list] == [100, 101]
+    assert not runner.pipelined_jobs
+    assert runner.journal.load()[-1]["event"] == "pipeline_cancelled"
+
+
+def test_kill_jobs_cancels_all_batch_jobs_at_once(slurm_system: SlurmSystem):
+    slurm_system.pipelined_iterations = True
+    slurm_system.scancel_jobs = AsyncMock()
+    t1, t2 = make_test("Tests.1"), make_test("Tests.2")
+    t1.iterations = 2
+    runner = make_runner(slurm_system, [t1, t2])
+
+    async def submit_and_terminate():
+        await runner.submit_test(t1)
+        await runner.submit_test(t2)
+        await runner.terminate()
+
+    asyncio.run(submit_and_terminate())
+
+    slurm_system.scancel_jobs.assert_awaited_once()
+    assert slurm_system.scancel_jobs.await_args_list[0].args[0] == [100, 101, 102]
+    assert not runner.pipelined_jobs
+    assert [entry["event"] for entry in runner.journal.load()].count("cancelled") == 2
+
+
+def test_finished_job_invalidates_node_states(slurm_system: SlurmSystem):
+    test = make_test("Tests.1")
+    runner = make_runner(slurm_system, [test])
+    runner.jobs = [SlurmJob(100, test, "/fake/Tests.1")]
+    slurm_system.invalidate_node_states = MagicMock()
+
+    slurm_system.get_job_states = AsyncMock(return_value={100: "RUNNING"})
+    asyncio.run(runner.update_job_states())
+    slurm_system.invalidate_node_states.assert_not_called()
+
+    slurm_system.get_job_states = AsyncMock(return_value={})
+    asyncio.run(runner.update_job_states())
+    slurm_system.invalidate_node_states.assert_called_once()
+
+
+def test_record_finished_job_nodes(slurm_system: SlurmSystem):
+    test = make_test("Tests.1")
+    cast(MagicMock, test.test_template).get_performance.return_value = 95.0
+    runner = make_runner(slurm_system, [test])
+    slurm_system.node_ledger = True
+    slurm_system.async_cmd_shell = MagicMock()
+    slurm_system.async_cmd_shell.execute = AsyncMock(return_value=("node-[002-003]\n", ""))
+
+    asyncio.run(runner.record_job_nodes(SlurmJob(100, test, "/fake/Tests.1/0"), JobStatusResult(True)))
+    asyncio.run(runner.record_job_nodes(SlurmJob(101, test, "/fake/Tests.1/1"), JobStatusResult(False)))
+    asyncio.run(runner.record_job_nodes(SlurmJob(102, test, "/fake/Tests.1/2", array_size=2), JobStatusResult(True)))
+
+    ledger = slurm_system.get_node_ledger()
+    assert ledger is not None
+    assert [record[1:] for record in ledger.load()] == [
+        ("100", "node-002", 0, 95.0),
+        ("100", "node-003", 0, 95.0),
+        ("101", "node-002", 1, None),
+        ("101", "node-003", 1, None),
+    ]
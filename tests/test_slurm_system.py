@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from pathlib import Path
 from typing import List
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from cloudai.systems import SlurmSystem
@@ -57,14 +59,11 @@ def test_parse_squeue_output_with_node_ranges_and_root_user(slurm_system):
 
 
 def test_parse_sinfo_output(slurm_system):
-    sinfo_output = """PARTITION AVAIL  TIMELIMIT  NODES  STATE NODELIST
-    main    up    3:00:00      1  inval node-036
-    main    up    3:00:00      5  drain node-[045-046,059,061-062]
-    main    up    3:00:00      2   resv node-[034-035]
-    main    up    3:00:00     24  alloc node-[033,037-044,047-058,060,063-064]
-    backup    up   12:00:00     8  idle node[01-08]
-    empty_queue up infinite     0    n/a
-    """
+    node_states = {"node-036": "inval", "node-034": "reserved", "node-035": "reserved"}
+    node_states.update({f"node-0{i}": "drained" for i in [45, 46, 59, 61, 62]})
+    lines = [f"node-0{i}|main*|{node_states.get(f'node-0{i}', 'allocated')}" for i in range(33, 65)]
+    lines += [f"node0{i}|backup|idle" for i in range(1, 9)]
+    sinfo_output = "\n".join(lines) + "\nnode-033|other|idle\nmalformed line\n"
     node_user_map = {
         "": "user1",
         "node-033": "user2",
@@ -101,13 +100,74 @@ def test_parse_sinfo_output(slurm_system):
             assert node.state == SlurmNodeState.ALLOCATED
     for node in slurm_system.partitions["backup"]:
         assert node.state == SlurmNodeState.IDLE
+        assert node.user == "user5"
+
+
+def test_parse_sinfo_output_not_responding(slurm_system):
+    slurm_system.parse_sinfo_output("node01|backup|idle*\nnode02|backup|mixed", {})
+
+    assert slurm_system.get_node("node01").state == SlurmNodeState.NOT_RESPONDING
+    assert slurm_system.get_node("node02").state == SlurmNodeState.MIXED_ALLOCATION
+    assert slurm_system.get_node("node02").user == "N/A"
+
+
+@pytest.mark.parametrize("columnar_node_states", [False, True])
+def test_parse_per_node_sinfo_output_with_shared_nodes(columnar_node_states: bool):
+    states = ["idle", "allocated", "completing", "down"]
+    nodes = [SlurmNode(name=f"node-{i:04d}", partition="main", state=SlurmNodeState.UNKNOWN_STATE) for i in range(2000)]
+    system = SlurmSystem(
+        name="test_system",
+        install_path="/fake/path",
+        output_path="/fake/output",
+        default_partition="main",
+        partitions={"main": nodes, "debug": nodes[:500]},
+        groups={"main": {"group1": nodes[:1000]}, "debug": {"group1": nodes[:500]}},
+        columnar_node_states=columnar_node_states,
+    )
+    # Every node is listed once per partition it belongs to, with the same state, as 'sinfo --Node' does.
+    lines = [f"{node.name}|main*|{states[i % 4]}" for i, node in enumerate(nodes)]
+    lines += [f"{node.name}|debug|{states[i % 4]}" for i, node in enumerate(nodes[:500])]
+    lines += ["node-9999|main*|idle", "node-0001|other|down"]
+    node_user_map = {node.name: "user1" if i % 8 == 1 else "user2" for i, node in enumerate(nodes) if i % 4 == 1}
+
+    with patch.object(system, "convert_state_to_enum", wraps=system.convert_state_to_enum) as mock_convert:
+        system.parse_sinfo_output("\n".join(lines), node_user_map)
+
+    assert mock_convert.call_count == len(states)
+    assert (nodes[1].state, nodes[1].user) == (SlurmNodeState.ALLOCATED, "user1")
+    assert (nodes[0].state, nodes[0].user) == (SlurmNodeState.IDLE, "N/A")
+    assert nodes[1999].state == SlurmNodeState.DOWN
+    for partition_name, group_size in (("main", 1000), ("debug", 500)):
+        grouped = system.group_nodes_by_state(partition_name, "group1", "user1")
+        assert [node.name for node in grouped[SlurmNodeState.IDLE]] == [
+            f"node-{i:04d}" for i in range(0, group_size, 4)
+        ]
+        assert [node.name for node in grouped[SlurmNodeState.COMPLETING]] == [
+            f"node-{i:04d}" for i in range(2, group_size, 4)
+        ]
+        assert [node.name for node in grouped[SlurmNodeState.ALLOCATED]] == [
+            f"node-{i:04d}" for i in range(5, group_size, 8)
+        ]
+
+
+def test_node_index(slurm_system: SlurmSystem):
+    assert slurm_system.is_node_in_system("node-033")
+    assert not slurm_system.is_node_in_system("node-065")
+
+    new_node = SlurmNode(name="node-065", partition="main", state=SlurmNodeState.UNKNOWN_STATE)
+    slurm_system.partitions["main"].append(new_node)
+    slurm_system.index_nodes()
+    slurm_system.parse_sinfo_output("node-065|main*|idle", {})
+
+    assert slurm_system.get_node("node-065") is new_node
+    assert new_node.state == SlurmNodeState.IDLE
 
 
 @patch("cloudai.systems.SlurmSystem.get_squeue")
 @patch("cloudai.systems.SlurmSystem.get_sinfo")
 def test_update_node_states_with_mocked_outputs(mock_get_sinfo, mock_get_squeue, slurm_system):
     mock_get_squeue.return_value = "node-115|user1"
-    mock_get_sinfo.return_value = "PARTITION AVAIL TIMELIMIT NODES STATE NODELIST\n" "main up infinite 1 idle node-115"
+    mock_get_sinfo.return_value = "node-115|main*|idle"
 
     slurm_system.update_node_states()
     for node in slurm_system.partitions["main"]:
@@ -116,9 +176,7 @@ def test_update_node_states_with_mocked_outputs(mock_get_sinfo, mock_get_squeue,
             assert node.user == "user1"
 
     mock_get_squeue.return_value = "node01|root"
-    mock_get_sinfo.return_value = (
-        "PARTITION AVAIL TIMELIMIT NODES STATE NODELIST\n" "backup up infinite 1 allocated node01"
-    )
+    mock_get_sinfo.return_value = "node01|backup|allocated"
 
     slurm_system.update_node_states()
     for node in slurm_system.partitions["backup"]:
@@ -154,3 +212,159 @@ def test_update_node_states_with_mocked_outputs(mock_get_sinfo, mock_get_squeue,
 def test_parse_node_list(node_list: str, expected_parsed_node_list: List[str], slurm_system):
     parsed_node_list = slurm_system.parse_node_list(node_list)
     assert parsed_node_list == expected_parsed_node_list
+
+
+def test_parse_job_states_output(slurm_system):
+    squeue_output = "101|RUNNING\n102|PENDING\n\n103|COMPLETING\nmalformed line\n"
+    job_states = slurm_system.parse_job_states_output(squeue_output)
+    assert job_states == {101: "RUNNING", 102: "PENDING", 103: "COMPLETING"}
+
+
+@pytest.mark.parametrize(
+    "squeue_output,expected_state",
+    [
+        ("200|COMPLETED\n200|RUNNING\n200|PENDING\n", "RUNNING"),
+        ("200|COMPLETED\n200|PENDING\n", "PENDING"),
+        ("200|COMPLETED\n200|FAILED\n", "COMPLETED"),
+    ],
+)
+def test_parse_job_states_output_job_array(slurm_system, squeue_output, expected_state):
+    assert slurm_system.parse_job_states_output(squeue_output) == {200: expected_state}
+
+
+def test_get_job_states_single_query(slurm_system):
+    with patch.object(
+        slurm_system.async_cmd_shell, "execute", AsyncMock(return_value=("101|RUNNING\n102|PENDING\n", ""))
+    ) as mock_execute:
+        job_states = asyncio.run(slurm_system.get_job_states([101, 102, 103]))
+
+    mock_execute.assert_awaited_once_with("squeue --jobs=101,102,103 --noheader --format='%F|%T'")
+    assert job_states == {101: "RUNNING", 102: "PENDING"}
+    assert slurm_system.is_job_state_running(job_states.get(101))
+    assert not slurm_system.is_job_state_completed(job_states.get(102))
+    assert slurm_system.is_job_state_completed(job_states.get(103))
+
+
+def test_get_job_states_no_jobs(slurm_system):
+    with patch.object(slurm_system.async_cmd_shell, "execute", AsyncMock()) as mock_execute:
+        assert asyncio.run(slurm_system.get_job_states([])) == {}
+    mock_execute.assert_not_called()
+
+
+def test_get_job_states_invalid_job_id(slurm_system):
+    stderr = "slurm_load_jobs error: Invalid job id specified"
+    with patch.object(slurm_system.async_cmd_shell, "execute", AsyncMock(return_value=("", stderr))):
+        assert asyncio.run(slurm_system.get_job_states([101])) == {}
+        assert asyncio.run(slurm_system.is_job_completed(101)) is True
+
+
+def test_get_job_states_retries_exhausted(slurm_system):
+    stderr = "Socket timed out on send/recv operation"
+    mock_execute = AsyncMock(return_value=("", stderr))
+    with patch.object(slurm_system.async_cmd_shell, "execute", mock_execute), pytest.raises(RuntimeError):
+        asyncio.run(slurm_system.get_job_states([101], retry_threshold=2))
+    assert mock_execute.await_count == 2
+
+
+def test_shared_job_state_snapshots(slurm_system: SlurmSystem):
+    slurm_system.share_state(60)
+    mock_execute = AsyncMock(return_value=("101|RUNNING\n102|PENDING\n", ""))
+
+    async def query_concurrently():
+        return await asyncio.gather(slurm_system.get_job_states([101]), slurm_system.get_job_states([102, 103]))
+
+    with patch.object(slurm_system.async_cmd_shell, "execute", mock_execute):
+        assert asyncio.run(query_concurrently()) == [{101: "RUNNING"}, {102: "PENDING"}]
+        assert asyncio.run(slurm_system.get_job_states([102])) == {102: "PENDING"}
+
+    mock_execute.assert_awaited_once_with("squeue --jobs=101,102,103 --noheader --format='%F|%T'")
+    assert slurm_system.watched_job_ids == {101, 102}
+
+
+def test_gen_scancel_commands(slurm_system: SlurmSystem):
+    with patch.object(slurm_system, "SCANCEL_MAX_COMMAND_LENGTH", 40):
+        commands = slurm_system.gen_scancel_commands([1001, 1002, 1003, 1001, 1004, 1005], user="me")
+
+    assert commands == ["scancel --user=me 1001 1002 1003 1004", "scancel --user=me 1005"]
+    assert slurm_system.gen_scancel_commands([], user="me") == []
+
+
+def test_scancel_jobs(slurm_system: SlurmSystem):
+    with patch.object(slurm_system.async_cmd_shell, "execute", AsyncMock(return_value=("", ""))) as mock_execute:
+        asyncio.run(slurm_system.scancel_jobs(list(range(1000, 1500))))
+
+    mock_execute.assert_awaited_once_with("scancel " + " ".join(str(job_id) for job_id in range(1000, 1500)))
+
+
+def test_gen_salloc_command(slurm_system: SlurmSystem):
+    slurm_system.account = "acct"
+    slurm_system.gpus_per_node = 8
+
+    command = slurm_system.gen_salloc_command(4, "cloudai_scenario")
+
+    assert command == (
+        "salloc --no-shell --job-name=cloudai_scenario --partition=main -N 4 --account=acct --gpus-per-node=8"
+    )
+
+
+def test_count_nodes(slurm_system: SlurmSystem):
+    assert slurm_system.count_nodes(["node-[001-004]", "node-010", "main:group1:3"]) == 8
+
+
+def test_get_finished_job_nodes(slurm_system: SlurmSystem):
+    sacct_output = "node-[033-034]\nnode-034,node-040\nNone assigned\n"
+    with patch.object(
+        slurm_system.async_cmd_shell, "execute", AsyncMock(return_value=(sacct_output, ""))
+    ) as mock_execute:
+        nodes = asyncio.run(slurm_system.get_finished_job_nodes(101))
+
+    mock_execute.assert_awaited_once_with("sacct --jobs=101 --allocations --noheader --parsable2 --format=NodeList")
+    assert nodes == ["node-033", "node-034", "node-040"]
+
+
+def test_node_state_snapshot_is_reused(slurm_system: SlurmSystem):
+    sinfo_output = "\n".join(f"node-0{i}|main*|idle" for i in range(33, 65))
+    slurm_system.groups = {"main": {"group1": slurm_system.partitions["main"][:4]}}
+    patch_squeue = patch.object(slurm_system, "get_squeue", return_value="")
+    patch_sinfo = patch.object(slurm_system, "get_sinfo", return_value=sinfo_output)
+    with patch_squeue, patch_sinfo as mock_get_sinfo:
+        slurm_system.update()
+        for _ in range(3):
+            assert slurm_system.parse_nodes(["main:group1:2"]) == ["node-033", "node-034"]
+        assert mock_get_sinfo.call_count == 1
+
+        slurm_system.invalidate_node_states()
+        slurm_system.update()
+        assert mock_get_sinfo.call_count == 2
+
+        slurm_system.node_state_ttl = 0
+        slurm_system.update()
+        assert mock_get_sinfo.call_count == 3
+
+
+@patch("cloudai.systems.slurm.slurm_system.SlurmSystem.update_node_states")
+def test_available_nodes_skip_excluded_nodes(_, slurm_system: SlurmSystem):
+    nodes = [SlurmNode(name=f"node-0{i}", partition="main", state=SlurmNodeState.IDLE) for i in range(33, 36)]
+    slurm_system.groups = {"main": {"group1": nodes}}
+    slurm_system.excluded_nodes = {"node-033"}
+
+    selected = slurm_system.get_available_nodes_from_group("main", "group1", 2)
+
+    assert [node.name for node in selected] == ["node-034", "node-035"]
+
+
+@patch("cloudai.systems.slurm.slurm_system.SlurmSystem.update_node_states")
+def test_available_nodes_skip_flagged_nodes(_, slurm_system: SlurmSystem, tmp_path: Path):
+    nodes = [SlurmNode(name=f"node-0{i}", partition="main", state=SlurmNodeState.IDLE) for i in range(33, 36)]
+    slurm_system.groups = {"main": {"group1": nodes}}
+    slurm_system.output_path = str(tmp_path)
+    slurm_system.node_ledger = True
+    ledger = slurm_system.get_node_ledger()
+    assert ledger is not None
+
+    with patch.object(ledger, "get_flagged_nodes", return_value={"node-034": "3 of 3 jobs failed"}) as mock_flagged:
+        selected = slurm_system.get_available_nodes_from_group("main", "group1", 2)
+        slurm_system.get_available_nodes_from_group("main", "group1", 2)
+
+    assert [node.name for node in selected] == ["node-033", "node-035"]
+    assert mock_flagged.call_count == 1
@@ -70,6 +70,64 @@ def test_parse_slurm_system_parser_with_mpi(example_data, mpi_value, expected_mp
     assert "group1" in slurm_system.groups["main"]
     assert "group2" in slurm_system.groups["backup"]
     assert slurm_system.mpi == expected_mpi
+    assert slurm_system.native_dependencies is False
+
+
+def test_parse_native_dependencies(example_data):
+    example_data["native_dependencies"] = "True"
+
+    slurm_system = SlurmSystemParser().parse(example_data)
+
+    assert slurm_system.native_dependencies is True
+
+
+def test_parse_monitor_intervals(example_data):
+    slurm_system = SlurmSystemParser().parse(example_data)
+    assert (slurm_system.monitor_interval, slurm_system.max_monitor_interval) == (1, 30)
+
+    example_data["monitor_interval"] = 5
+    example_data["max_monitor_interval"] = 120
+    slurm_system = SlurmSystemParser().parse(example_data)
+    assert (slurm_system.monitor_interval, slurm_system.max_monitor_interval) == (5, 120)
+
+
+def test_parse_node_state_ttl(example_data):
+    assert SlurmSystemParser().parse(example_data).node_state_ttl == 10
+
+    example_data["node_state_ttl"] = "0"
+    assert SlurmSystemParser().parse(example_data).node_state_ttl == 0
+
+
+def test_parse_topology(example_data, tmp_path):
+    assert SlurmSystemParser().parse(example_data).topology is None
+
+    example_data["topology"] = {
+        "leaf1": {"nodes": ["node-[033-034]"]},
+        "leaf2": {"nodes": ["node-01", "node-02"]},
+        "spine": {"switches": ["leaf1", "leaf2"]},
+    }
+    topology = SlurmSystemParser().parse(example_data).topology
+    assert topology is not None
+    assert (topology.node_leaves["node-02"], topology.switch_levels["spine"]) == ("leaf2", 1)
+
+    topology_file = tmp_path / "topology.conf"
+    topology_file.write_text("SwitchName=leaf1 Nodes=node-[033-034]\n")
+    example_data["topology_file"] = str(topology_file)
+    with pytest.raises(ValueError):
+        SlurmSystemParser().parse(example_data)
+
+    del example_data["topology"]
+    topology = SlurmSystemParser().parse(example_data).topology
+    assert topology is not None
+    assert topology.node_leaves == {"node-033": "leaf1", "node-034": "leaf1"}
+
+
+def test_parse_node_index(example_data):
+    slurm_system = SlurmSystemParser().parse(example_data)
+
+    assert set(slurm_system.node_index) == {"node-033", "node-034", "node-01", "node-02"}
+    assert slurm_system.partition_node_names["backup"] == {"node-01", "node-02"}
+    assert slurm_system.get_node("node-033") is slurm_system.groups["main"]["group1"][0]
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from cloudai.systems import SlurmSystem
+from cloudai.systems.slurm import SlurmNode, SlurmNodeState, SlurmTopology
+
+SCONTROL_TOPOLOGY = """
+SwitchName=leaf1 Level=0 LinkSpeed=1 Nodes=node-[001-004]
+SwitchName=leaf2 Level=0 LinkSpeed=1 Nodes=node-[005-008]
+SwitchName=leaf3 Level=0 LinkSpeed=1 Nodes=node-[009-012]
+SwitchName=spine1 Level=1 LinkSpeed=1 Switches=leaf[1-2]
+SwitchName=core Level=2 LinkSpeed=1 Switches=spine1,leaf3  # core switch
+"""
+
+
+def make_nodes(*numbers: int) -> List[SlurmNode]:
+    return [SlurmNode(name=f"node-{i:03d}", partition="main", state=SlurmNodeState.IDLE) for i in numbers]
+
+
+def names(nodes: List[SlurmNode]) -> List[str]:
+    return [node.name for node in nodes]
+
+
+def test_from_string():
+    topology = SlurmTopology.from_string(SCONTROL_TOPOLOGY)
+
+    assert topology.switch_levels == {"leaf1": 0, "leaf2": 0, "leaf3": 0, "spine1": 1, "core": 2}
+    assert topology.switch_leaves["core"] == {"leaf1", "leaf2", "leaf3"}
+    assert topology.node_leaves["node-006"] == "leaf2"
+
+
+@pytest.mark.parametrize(
+    "topology",
+    [
+        "SwitchName=s1 Switches=s2\nSwitchName=s2 Switches=s1",
+        "SwitchName=s1 Switches=missing",
+        "SwitchName=s1 Level=0",
+        "Nodes=node-001",
+    ],
+)
+def test_from_string_invalid(topology: str):
+    with pytest.raises(ValueError):
+        SlurmTopology.from_string(topology)
+
+
+def test_pack_fills_the_fewest_switches():
+    topology = SlurmTopology.from_string(SCONTROL_TOPOLOGY)
+    candidates = make_nodes(1, 5, 6, 7, 9, 10, 11, 12, 2)
+
+    assert names(topology.select([candidates], 3, "pack")) == ["node-005", "node-006", "node-007"]
+    assert names(topology.select([candidates], 4, "pack")) == ["node-009", "node-010", "node-011", "node-012"]
+    assert names(topology.select([candidates], 5, "pack")) == [
+        "node-005",
+        "node-006",
+        "node-007",
+        "node-001",
+        "node-002",
+    ]
+
+
+def test_spread_round_robins_over_leaves():
+    topology = SlurmTopology.from_string(SCONTROL_TOPOLOGY)
+    candidates = make_nodes(1, 2, 3, 5, 6, 9, 13)
+
+    selected = topology.select([candidates], 5, "spread")
+
+    assert names(selected) == ["node-001", "node-005", "node-009", "node-013", "node-002"]
+
+
+def test_free_nodes_are_preferred_over_placement():
+    topology = SlurmTopology.from_string(SCONTROL_TOPOLOGY)
+    idle, allocated = make_nodes(1, 5, 9), make_nodes(6, 7, 8)
+
+    assert names(topology.select([idle, allocated], 3, "pack")) == ["node-001", "node-005", "node-009"]
+    assert names(topology.select([idle, allocated], 4, "pack")) == ["node-005", "node-006", "node-007", "node-008"]
+    with pytest.raises(ValueError):
+        topology.select([idle], 1, "scatter")
+
+
+def test_pack_across_root_switches_keeps_free_nodes():
+    topology = SlurmTopology.from_string(
+        "SwitchName=leaf1 Nodes=node-[001-004]\n"
+        "SwitchName=leaf2 Nodes=node-[005-008]\n"
+        "SwitchName=leaf3 Nodes=node-[009-012]\n"
+        "SwitchName=spine1 Switches=leaf[1-2]\n"
+        "SwitchName=spine2 Switches=leaf3\n"
+    )
+    idle, allocated = make_nodes(9, 5, 1, 2, 10, 20), make_nodes(3, 4)
+
+    assert names(topology.select([idle, allocated], 5, "pack")) == [
+        "node-001",
+        "node-002",
+        "node-005",
+        "node-009",
+        "node-010",
+    ]
+    assert names(topology.select([idle, allocated], 6, "pack"))[-1] == "node-020"
+
+
+def test_system_places_group_nodes_on_topology():
+    nodes = make_nodes(*range(1, 13))
+    system = SlurmSystem(
+        name="test_system",
+        install_path="/fake/path",
+        output_path="/fake/output",
+        default_partition="main",
+        partitions={"main": nodes},
+        topology=SlurmTopology.from_string(SCONTROL_TOPOLOGY),
+        groups={"main": {"group1": nodes}},
+    )
+    system.update = lambda: None
+    system.excluded_nodes = {"node-001"}
+
+    assert system.parse_nodes(["main:group1:4"]) == ["node-005", "node-006", "node-007", "node-008"]
+    assert system.parse_nodes(["main:group1:3:spread"]) == ["node-002", "node-005", "node-009"]
+    assert system.count_nodes(["main:group1:3:spread"]) == 3
+
+
+def test_system_queries_topology_once():
+    system = SlurmSystem(
+        name="test_system",
+        install_path="/fake/path",
+        output_path="/fake/output",
+        default_partition="main",
+        partitions={"main": make_nodes(1, 2)},
+        query_topology=True,
+    )
+
+    with patch.object(system, "fetch_command_output", return_value=(SCONTROL_TOPOLOGY, "")) as mock_fetch:
+        topology = system.get_topology()
+        assert system.get_topology() is topology
+
+    mock_fetch.assert_called_once_with("scontrol show topology")
+    assert topology is not None
+    assert topology.node_leaves["node-001"] == "leaf1"
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest.mock import MagicMock
+
+from cloudai._core.submission_queue import SubmissionQueue
+
+
+def test_pop_order():
+    critical_path_lengths = {"a": 1, "b": 3, "c": 1, "d": 2}
+    tests = {name: MagicMock(section_name=name, priority=0) for name in critical_path_lengths}
+    tests["c"].priority = 1
+    queue = SubmissionQueue(lambda test: critical_path_lengths[test.section_name])
+    for test in tests.values():
+        queue.push(test)
+
+    popped = []
+    while (test := queue.pop(lambda test: True)) is not None:
+        popped.append(test.section_name)
+
+    assert popped == ["c", "b", "d", "a"]
+
+
+def test_pop_skips_tests_that_cannot_be_submitted():
+    queue = SubmissionQueue(lambda test: 1)
+    blocked, ready = MagicMock(priority=1), MagicMock(priority=0)
+    queue.push(blocked)
+    queue.push(ready)
+
+    assert queue.pop(lambda test: test is ready) is ready
+    assert queue.pop(lambda test: test is ready) is None
+    assert len(queue) == 1
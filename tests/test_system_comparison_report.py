@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+from cloudai import NcclTestReportGenerationStrategy, RunJournal, SystemComparisonReport, TestScenario
+
+
+def write_journal(run_path: Path, runtimes: list, failures: int, bus_bandwidths: list) -> None:
+    run_path.mkdir()
+    journal = RunJournal(str(run_path))
+    for job_id, (runtime, bus_bandwidth) in enumerate(zip(runtimes, bus_bandwidths)):
+        output_path = run_path / "Tests.1" / str(job_id)
+        output_path.mkdir(parents=True)
+        (output_path / "stdout.txt").write_text(
+            f"# Out of bounds values : 0 OK\n# Avg bus bandwidth    : {bus_bandwidth}\n"
+        )
+        journal.record(
+            "completed",
+            test="Tests.1",
+            job_id=job_id,
+            output_path=str(output_path),
+            start_time=100.0,
+            end_time=100.0 + runtime,
+        )
+    for job_id in range(len(runtimes), len(runtimes) + failures):
+        journal.record("failed", test="Tests.1", job_id=job_id, retried=False)
+        journal.record("completed", test="Tests.1", job_id=job_id, start_time=100.0, end_time=101.0)
+
+
+def test_compare_systems(tmp_path: Path):
+    write_journal(tmp_path / "eos", [10.0, 30.0, 20.0], failures=0, bus_bandwidths=[180.5, 175.25, 182.0])
+    write_journal(tmp_path / "dfw", [40.0], failures=2, bus_bandwidths=[90.75])
+    nccl_test = MagicMock(section_name="Tests.1")
+    nccl_test.get_performance.side_effect = NcclTestReportGenerationStrategy().get_performance
+    test_scenario = TestScenario(name="nccl", tests=[nccl_test, MagicMock(section_name="Tests.2")])
+
+    report_path = SystemComparisonReport(str(tmp_path)).generate(
+        test_scenario, {"eos": str(tmp_path / "eos"), "dfw": str(tmp_path / "dfw")}
+    )
+
+    report = pd.read_csv(report_path).set_index("test")
+    assert report.loc["Tests.1", "eos succeeded"] == 3
+    assert report.loc["Tests.1", "eos median runtime (s)"] == 20.0
+    assert report.loc["Tests.1", "dfw succeeded"] == 1
+    assert report.loc["Tests.1", "dfw failed"] == 2
+    assert report.loc["Tests.1", "dfw median runtime (s)"] == 40.0
+    assert report.loc["Tests.1", "eos median performance"] == 180.5
+    assert report.loc["Tests.1", "dfw median performance"] == 90.75
+    assert report.loc["Tests.2", "eos succeeded"] == 0
+    assert pd.isna(report.loc["Tests.2", "eos median performance"])
+    assert pd.isna(report.loc["Tests.2", "eos median runtime (s)"])
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest.mock import MagicMock
+
+import pytest
+from cloudai import FailurePolicy, Test, TestScenario
+from cloudai._core.test import TestDependency
+from cloudai._core.test_scenario_parser import TestScenarioParser
+
+
+def make_test(section_name: str) -> Test:
+    return Test(
+        name=section_name,
+        description="",
+        test_template=MagicMock(),
+        env_vars={},
+        cmd_args={},
+        extra_env_vars={},
+        extra_cmd_args="",
+        section_name=section_name,
+    )
+
+
+def test_get_dependents():
+    t1, t2, t3, t4 = (make_test(f"Tests.{i}") for i in range(1, 5))
+    t2.dependencies = {"start_post_init": TestDependency(t1, 5)}
+    t3.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    t4.dependencies = {"start_post_comp": TestDependency(t1, 0), "end_post_comp": TestDependency(t3, 0)}
+    scenario = TestScenario(name="scenario", tests=[t1, t2, t3, t4])
+
+    assert scenario.get_dependents(t1, "start_post_init") == [t2]
+    assert scenario.get_dependents(t1, "start_post_comp") == [t3, t4]
+    assert scenario.get_dependents(t1, "end_post_comp") == []
+    assert scenario.get_dependents(t3, "end_post_comp") == [t4]
+    assert scenario.get_dependents(t4, "start_post_comp") == []
+
+
+def test_get_critical_path_length():
+    t1, t2, t3, t4 = (make_test(f"Tests.{i}") for i in range(1, 5))
+    t2.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    t3.dependencies = {"start_post_init": TestDependency(t2, 0)}
+    t4.dependencies = {"end_post_comp": TestDependency(t1, 0)}
+    scenario = TestScenario(name="scenario", tests=[t1, t2, t3, t4])
+
+    assert [scenario.get_critical_path_length(t) for t in (t1, t2, t3, t4)] == [3, 2, 1, 1]
+
+
+def test_parse_submission_limits_and_priority():
+    parser = TestScenarioParser("", MagicMock(), {"nccl": make_test("")})
+    scenario = parser._parse_data(
+        {
+            "name": "scenario",
+            "max_in_flight": 4,
+            "max_in_flight_per_group": {"main:group1": 2},
+            "Tests": {"1": {"name": "nccl", "priority": 10}, "2": {"name": "nccl"}},
+        }
+    )
+
+    assert scenario.max_in_flight == 4
+    assert scenario.max_in_flight_per_group == {"main:group1": 2}
+    assert [test.priority for test in scenario.tests] == [10, 0]
+
+
+def test_parse_failure_policy():
+    parser = TestScenarioParser("", MagicMock(), {"nccl": make_test("")})
+    scenario = parser._parse_data(
+        {
+            "name": "scenario",
+            "failure_policy": {"action": "retry", "max_retries": 2, "backoff": 30},
+            "Tests": {
+                "1": {"name": "nccl", "failure_policy": {"max_retries": 5, "exclude_failed_nodes": True}},
+                "2": {"name": "nccl"},
+            },
+        }
+    )
+
+    assert scenario.failure_policy.action == "retry"
+    assert scenario.failure_policy.max_retries == 2
+    override = scenario.tests[0].failure_policy
+    assert override is not None
+    assert (override.action, override.max_retries, override.backoff, override.exclude_failed_nodes) == (
+        "retry",
+        5,
+        30.0,
+        True,
+    )
+    assert scenario.tests[1].failure_policy is None
+    assert TestScenario(name="scenario", tests=[]).failure_policy.action == "fail-fast"
+
+
+def test_failure_policy_retry_delay():
+    policy = FailurePolicy(action="retry", max_retries=2, backoff=10)
+
+    assert [policy.get_retry_delay(retries) for retries in range(3)] == [10, 20, 40]
+    assert policy.should_retry(1)
+    assert not policy.should_retry(2)
+    assert not FailurePolicy(action="continue", max_retries=2).should_retry(0)
+    with pytest.raises(ValueError):
+        FailurePolicy(action="ignore")
+
+
+def test_get_critical_path_cost():
+    t1, t2, t3, t4 = (make_test(f"Tests.{i}") for i in range(1, 5))
+    t2.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    t3.dependencies = {"start_post_comp": TestDependency(t2, 0)}
+    t4.dependencies = {"start_post_comp": TestDependency(t1, 0)}
+    runtimes = {t1: 10.0, t2: 20.0, t3: 30.0, t4: 100.0}
+    scenario = TestScenario(name="scenario", tests=[t1, t2, t3, t4])
+
+    assert scenario.get_critical_path_cost(t1, runtimes.__getitem__) == 110.0
+    assert scenario.get_critical_path_cost(t2, runtimes.__getitem__) == 50.0
+    assert scenario.get_critical_path_length(t1) == 3
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: NVIDIA CORPORATION & AFFILIATES
+# Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+from pathlib import Path
+
+from cloudai._core.timeline import Timeline
+
+
+def test_write_chrome_trace(tmp_path: Path):
+    timeline = Timeline(str(tmp_path), "scenario")
+    timeline.add_span("Tests.1", "queued", "job", 100.0, 102.5, job_id=1)
+    timeline.add_span("Tests.2", "running", "job", 101.0, 101.0)
+    timeline.add_span("Tests.1", "running", "job", 102.5, 110.0, job_id=1)
+    timeline.write()
+
+    trace = json.loads((tmp_path / Timeline.FILE_NAME).read_text())
+    metadata = {(e["name"], e["tid"]): e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+    assert metadata == {("process_name", 0): "scenario", ("thread_name", 1): "Tests.1", ("thread_name", 2): "Tests.2"}
+    spans = [(e["tid"], e["name"], e["ts"], e["dur"]) for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert spans == [
+        (1, "queued", 100_000_000, 2_500_000),
+        (2, "running", 101_000_000, 0),
+        (1, "running", 102_500_000, 7_500_000),
+    ]